@@ -0,0 +1,108 @@
+bl_info = {
+    "name": "Create Shapes",
+    "author": "Jeremy Behreandt",
+    "version": (0, 1),
+    "blender": (4, 5, 2),
+    "category": "Object",
+    "description": "Creates curve and mesh shapes from a single Add > Shapes menu.",
+    "tracker_url": "https://github.com/behreajj/blendergeom"
+}
+
+# Every script in the repository remains an add-on of its own. Installed
+# as a whole, the repository is one package which lists the scripts here
+# and imports each only when its operator is first used, so that enabling
+# the package costs the same however many shapes there are.
+#
+# Worker processes of shape batches import this package on their way to
+# the kernels, so bpy is only imported once the package is registered.
+
+# Module, operator class, operator id, label, icon and menu section.
+SHAPES = (
+    ("curves.arc_curve_gen", "ArcCurveMaker",
+        "curve.primitive_arc_add", "Arc", "CURVE_BEZCURVE", "CURVE"),
+    ("curves.circ_curve_gen", "CircCurveMaker",
+        "curve.primitive_circ_add", "Circle", "CURVE_BEZCURVE", "CURVE"),
+    ("curves.egg_curve_gen", "EggCurveMaker",
+        "curve.primitive_egg_add", "Egg", "CURVE_BEZCURVE", "CURVE"),
+    ("curves.foil_curve_gen", "FoilCurveMaker",
+        "curve.primitive_foil_add", "Foil", "CURVE_BEZCURVE", "CURVE"),
+    ("curves.infinity_curve_gen", "InfinityCurveMaker",
+        "curve.primitive_infinity_add", "Infinity Loop", "CURVE_BEZCURVE", "CURVE"),
+    ("curves.lancet_arch_curve_gen", "LancetArchCurveMaker",
+        "curve.primitive_lancet_add", "Lancet Arch", "CURVE_BEZCURVE", "CURVE"),
+    ("curves.line_curve_gen", "LineCurveMaker",
+        "curve.primitive_line_add", "Line", "CURVE_BEZCURVE", "CURVE"),
+    ("curves.octogram_curve_gen", "OctogramCurveMaker",
+        "curve.primitive_octogram_add", "Octogram", "CURVE_BEZCURVE", "CURVE"),
+    ("curves.ogee_curve_gen", "OgeeCurveMaker",
+        "curve.primitive_ogee_add", "Ogee", "CURVE_BEZCURVE", "CURVE"),
+    ("curves.polar_grid_curve_gen", "PolarGridMaker",
+        "curve.primitive_polar_grid_add", "Polar Grid", "CURVE_BEZCURVE", "CURVE"),
+    ("curves.reuleaux_curve_gen", "ReuleauxCurveMaker",
+        "curve.primitive_reuleaux_add", "Reuleaux Triangle", "CURVE_BEZCURVE", "CURVE"),
+    ("curves.seedoflife_curve_gen", "SeedCurveMaker",
+        "curve.primitive_seed_add", "Seed of Life", "CURVE_BEZCURVE", "CURVE"),
+    ("curves.star_curve_gen", "StarCurveMaker",
+        "curve.primitive_star_add", "Star", "CURVE_BEZCURVE", "CURVE"),
+    ("curves.tracery_curve_gen", "TraceryCurveMaker",
+        "curve.primitive_tracery_add", "Tracery", "CURVE_BEZCURVE", "CURVE"),
+    ("curves.tudor_arch_curve_gen", "TudorArchCurveMaker",
+        "curve.primitive_tudor_add", "Tudor Arch", "CURVE_BEZCURVE", "CURVE"),
+    ("curves.vesica_curve_gen", "VesicaCurveMaker",
+        "curve.primitive_vesica_add", "Vesica Piscis", "CURVE_BEZCURVE", "CURVE"),
+    ("curves.utils.circ_intersect", "CircIntersectCurveMaker",
+        "curve.primitive_circle_intersect_add", "Circle Intersect", "CURVE_BEZCURVE", "CURVE"),
+    ("curves.utils.line_intersect", "LineIntersectCurveMaker",
+        "curve.primitive_line_intersect_add", "Line Intersect", "CURVE_BEZCURVE", "CURVE"),
+    ("meshes.arc_mesh_gen", "ArcMeshMaker",
+        "mesh.primitive_arc_add", "Arc", "MESH_DATA", "MESH"),
+    ("meshes.arcade_mesh_gen", "ArcadeMeshMaker",
+        "mesh.primitive_arcade_add", "Arcade", "MESH_DATA", "MESH"),
+    ("meshes.circle_arrangement_mesh_gen", "CircleArrangementMeshMaker",
+        "mesh.primitive_circle_arrangement_add", "Circle Arrangement", "MESH_DATA", "MESH"),
+    ("meshes.egg_mesh_gen", "EggMeshMaker",
+        "mesh.primitive_egg_add", "Egg", "MESH_DATA", "MESH"),
+    ("meshes.infinity_mesh_gen", "InfinityMeshMaker",
+        "mesh.primitive_infinity_add", "Infinity Loop", "MESH_DATA", "MESH"),
+    ("meshes.lancet_arch_mesh_gen", "LancetArchMeshMaker",
+        "mesh.primitive_lancet_add", "Lancet Arch", "MESH_DATA", "MESH"),
+    ("meshes.line_mesh_gen", "LineMeshMaker",
+        "mesh.primitive_line_add", "Line", "MESH_DATA", "MESH"),
+    ("meshes.octogram_mesh_gen", "OctogramMeshMaker",
+        "mesh.primitive_octogram_add", "Octogram", "MESH_DATA", "MESH"),
+    ("meshes.polar_grid_gen", "PolarGridMaker",
+        "mesh.primitive_polar_grid_add", "Polar Grid", "MESH_DATA", "MESH"),
+    ("meshes.reuleaux_mesh_gen", "ReuleauxMeshMaker",
+        "mesh.primitive_reuleaux_add", "Reuleaux Triangle", "MESH_DATA", "MESH"),
+    ("meshes.star_mesh_gen", "StarMeshMaker",
+        "mesh.primitive_star_add", "Star", "MESH_DATA", "MESH"),
+    ("meshes.tiling_mesh_gen", "TilingMeshMaker",
+        "mesh.primitive_tiling_add", "Tiling", "MESH_DATA", "MESH"),
+    ("meshes.tudor_arch_mesh_gen", "TudorArchMeshMaker",
+        "mesh.primitive_tudor_add", "Tudor Arch", "MESH_DATA", "MESH"),
+    ("meshes.vesica_mesh_gen", "VesicaMeshMaker",
+        "mesh.primitive_vesica_add", "Vesica Piscis", "MESH_DATA", "MESH"),
+    ("shape_batch.operators", "ShapeBatchMaker",
+        "object.shape_batch_add", "Shape Batch", "MOD_ARRAY", "BATCH"),
+    ("shape_batch.operators", "ShapeManifestImporter",
+        "object.shape_manifest_import", "Shape Manifest (.csv, .jsonl)", "NONE", "IMPORT"),
+    ("shape_batch.cleanup", "ShapeOrphanPurger",
+        "outliner.shape_orphans_purge", "Purge Shape Orphans", "ORPHAN_DATA", "CLEANUP"),
+)
+
+# Generators whose objects are animated by a frame change handler. Their
+# modules are loaded along with any file which holds such objects.
+ANIMATED = (
+    "mesh.primitive_arc_add",
+    "mesh.primitive_star_add",
+)
+
+
+def register():
+    from . import loader
+    loader.register()
+
+
+def unregister():
+    from . import loader
+    loader.unregister()
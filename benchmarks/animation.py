@@ -0,0 +1,192 @@
+"""Measures the time animated shapes take to update on each frame.
+
+Run from Blender in background mode, with arguments after "--":
+
+    blender --background --factory-startup --python benchmarks/animation.py -- \\
+        --count 50 --frames 120
+
+Stars and arcs made with the Animate option store their parameters on
+their objects, and a frame change handler rewrites their coordinates
+from those parameters. For each of these scripts, this adds a number of
+animated shapes, keyframes a parameter of each across the frames, then
+steps through the frames, timing the script's handler on every one.
+The handler is called directly rather than registered, so that only its
+own time is measured. The script exits with an error if the median
+time per frame exceeds the budget, by default one frame at the scene's
+frame rate.
+"""
+
+import argparse
+import importlib.util
+import math
+import os
+import statistics
+import sys
+import time
+
+import bpy # type: ignore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The script of each animated shape, with a parameter keyframed from the
+# first value to the second.
+SHAPES = (
+    ("meshes/star_mesh_gen.py", "StarMeshMaker", "inset", 0.1, 0.9),
+    ("meshes/arc_mesh_gen.py", "ArcMeshMaker", "stop_angle", 0.1, math.tau),
+)
+
+
+class StubOperator:
+    """Stands in for an operator, holding its properties as attributes"""
+
+    def __init__(self, properties):
+        self.__dict__.update(properties)
+
+    def report(self, type, message):
+        pass
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="benchmarks/animation.py",
+        description="Measures the per frame cost of animated shapes.")
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=50,
+        help="Number of animated shapes of each kind")
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=120,
+        help="Number of frames to step through")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=0.0,
+        help="Milliseconds allowed per frame; one frame at the scene's rate by default")
+    return parser.parse_args(argv)
+
+
+def script_args():
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1:]
+    return sys.argv[1:]
+
+
+def import_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def property_defaults(cls):
+    # Properties declared in annotations are deferred, and keep the
+    # keywords they were declared with.
+    defaults = {}
+    for name, prop in getattr(cls, "__annotations__", {}).items():
+        keywords = getattr(prop, "keywords", None)
+        if keywords is None:
+            continue
+        if "default" in keywords:
+            defaults[name] = keywords["default"]
+        elif prop.function is bpy.props.EnumProperty:
+            defaults[name] = keywords["items"][0][0]
+        elif prop.function is bpy.props.BoolProperty:
+            defaults[name] = False
+        elif prop.function is bpy.props.IntProperty:
+            defaults[name] = 0
+        elif prop.function is bpy.props.FloatProperty:
+            defaults[name] = 0.0
+        else:
+            defaults[name] = (0.0,) * keywords.get("size", 3)
+    return defaults
+
+
+def add_shapes(cls, key, first, last, count, frames):
+    # Operators are run through their execute methods, as their poll
+    # needs a 3D view, which background mode does not have.
+    scene = bpy.context.scene
+    properties = property_defaults(cls)
+    properties["animate"] = True
+    made = []
+    i = 0
+    while i < count:
+        before = set(bpy.data.objects)
+        cls.execute(StubOperator(properties), bpy.context)
+        for obj in bpy.data.objects:
+            if obj not in before:
+                made.append(obj)
+        i = i + 1
+
+    # Each shape is offset in time, so that they do not all change by
+    # the same amount on the same frame.
+    data_path = '["{}"]'.format(key)
+    for j, obj in enumerate(made):
+        shift = j % max(1, frames // 4)
+        obj[key] = first
+        obj.keyframe_insert(data_path, frame=scene.frame_start + shift)
+        obj[key] = last
+        obj.keyframe_insert(data_path, frame=scene.frame_start + frames - 1)
+    return made
+
+
+def measure(handler, frames):
+    # Frames are set without the handler registered, so that Blender
+    # evaluates the keyframes, then the handler is timed on its own.
+    scene = bpy.context.scene
+    times = []
+    f = 0
+    while f < frames:
+        scene.frame_set(scene.frame_start + f)
+        start = time.perf_counter()
+        handler(scene)
+        times.append((time.perf_counter() - start) * 1000.0)
+        f = f + 1
+    return times
+
+
+def main(argv):
+    args = parse_args(argv)
+    count = max(1, args.count)
+    frames = max(2, args.frames)
+    scene = bpy.context.scene
+    budget = args.budget
+    if budget <= 0.0:
+        budget = 1000.0 * scene.render.fps_base / scene.render.fps
+
+    print("{:<30}{:>12}{:>12}{:>12}".format(
+        "Script", "Median ms", "Max ms", "Per shape us"))
+    over = []
+    for rel, cls_name, key, first, last in SHAPES:
+        module = import_module(
+            "bench_" + rel.replace("/", "_").replace(".py", ""),
+            os.path.join(ROOT, rel))
+        made = add_shapes(
+            getattr(module, cls_name), key, first, last, count, frames)
+        times = measure(module.frame_change_post, frames)
+        median = statistics.median(times)
+        print("{:<30}{:>12.3f}{:>12.3f}{:>12.3f}".format(
+            rel, median, max(times), median * 1000.0 / count))
+        if median > budget:
+            over.append(rel)
+
+        for obj in made:
+            mesh_data = obj.data
+            bpy.data.objects.remove(obj)
+            if mesh_data is not None and mesh_data.users == 0:
+                bpy.data.meshes.remove(mesh_data)
+
+    print("Budget is {:.3f} ms per frame for {} shapes of each kind.".format(
+        budget, count))
+    for rel in over:
+        print("Over budget: {}".format(rel), file=sys.stderr)
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    code = main(script_args())
+    if code:
+        sys.exit(code)
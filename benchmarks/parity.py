@@ -0,0 +1,334 @@
+"""Checks that the shape batch kernels build what the operators build.
+
+Run from Blender in background mode, with arguments after "--":
+
+    blender --background --factory-startup --python benchmarks/parity.py -- \\
+        --shape STAR --tolerance 0.00001
+
+The kernels are ports of the operators' math, so the two can drift
+apart. For each shape with a kernel, this runs the kernel and the
+operator it names as its generator on the same parameters: the shape's
+defaults, each value of each of its enum parameters, and a few other
+variations alone and with each enum value. The kernel's arrays are
+written by the batch writer and the operator's execute method is called
+directly, so that both results pass through Blender. Both datablocks
+are then read back and compared. The script exits with an error if any
+case differs, so it can be run before a release.
+"""
+
+import argparse
+import array
+import glob
+import importlib
+import importlib.util
+import math
+import os
+import sys
+
+import bpy # type: ignore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The batch package is imported under this name, so that its relative
+# imports resolve.
+PACKAGE = "parity_shape_batch"
+
+# Parameters varied on top of each shape's defaults. Every value of each
+# enum parameter in the manifest bounds is tried alone and with each of
+# these.
+VARIATIONS = {
+    "ARC": (
+        {"start_angle": 0.3, "stop_angle": 2.9},
+        {"start_angle": 0.0, "stop_angle": math.tau},
+        {"r_scalar": 0.25, "stroke_width": 0.2, "join_type": "ROUND"}),
+    "EGG": (
+        {"sectors": 3},
+        {"sectors": 17, "offset_angle": 0.7, "origin": (0.2, -0.1)},
+        {"stroke_width": 0.2, "join_type": "ROUND"}),
+    "LANCET_ARCH": (
+        {"sharpness": 0.0, "arch_weight": 0.25, "arch_offset": -0.5},
+        {"arch_weight": 0.25, "depth": 0.4},
+        {"arch_weight": 0.25, "depth": 0.4, "chamfer": 0.03},
+        {"arch_weight": 0.25, "depth": 0.4, "chamfer": 0.5}),
+    "POLAR_GRID": (
+        {"rings": 1, "sectors": 5},
+        {"offset_angle": 0.4, "origin": (0.2, -0.1)}),
+    "STAR": (
+        {"skip": (2, 1)},
+        {"skip": (0, 1)},
+        {"inset": 0.0},
+        {"sectors": 9, "inset": 0.8, "join_type": "ROUND"}),
+    "CIRCLE": (
+        {"knot_count": 3},
+        {"knot_count": 7, "offset_angle": 0.3}),
+    "FOIL": (
+        {"foil_count": 4},
+        {"foil_count": 6},
+        {"foil_count": 9, "offset_angle": 0.0}),
+}
+
+
+class StubOperator:
+    """Stands in for an operator, holding its properties as attributes"""
+
+    def __init__(self, properties):
+        self.__dict__.update(properties)
+        self.reports = []
+
+    def report(self, type, message):
+        self.reports.append(message)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="benchmarks/parity.py",
+        description="Compares shape batch kernels with their operators.")
+    parser.add_argument(
+        "--shape",
+        action="append",
+        help="Shape to check, such as STAR; may be repeated. All by default")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.00001,
+        help="Largest difference allowed between coordinates")
+    return parser.parse_args(argv)
+
+
+def script_args():
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1:]
+    return sys.argv[1:]
+
+
+def import_module(name, path):
+    search = None
+    if os.path.basename(path) == "__init__.py":
+        search = [os.path.dirname(path)]
+    spec = importlib.util.spec_from_file_location(
+        name, path, submodule_search_locations=search)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def find_operators(idnames):
+    # Only the scripts which mention a generator are imported. They are
+    # not registered, as their execute methods are called directly.
+    found = {}
+    paths = sorted(glob.glob(os.path.join(ROOT, "curves", "**", "*.py"), recursive=True)
+        + glob.glob(os.path.join(ROOT, "meshes", "**", "*.py"), recursive=True))
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as in_file:
+            text = in_file.read()
+        if not any('"{}"'.format(idname) in text for idname in idnames):
+            continue
+        rel = os.path.relpath(path, ROOT).replace(os.sep, "/")
+        module = import_module("parity_" + rel.replace("/", "_")[:-3], path)
+        for value in vars(module).values():
+            idname = getattr(value, "bl_idname", None)
+            if isinstance(value, type) and idname in idnames:
+                found[idname] = value
+    return found
+
+
+def property_defaults(cls):
+    # Properties declared in annotations are deferred, and keep the
+    # keywords they were declared with.
+    defaults = {}
+    for name, prop in getattr(cls, "__annotations__", {}).items():
+        keywords = getattr(prop, "keywords", None)
+        if keywords is None:
+            continue
+        if "default" in keywords:
+            defaults[name] = keywords["default"]
+        elif prop.function is bpy.props.EnumProperty:
+            defaults[name] = keywords["items"][0][0]
+        elif prop.function is bpy.props.BoolProperty:
+            defaults[name] = False
+        elif prop.function is bpy.props.IntProperty:
+            defaults[name] = 0
+        elif prop.function is bpy.props.FloatProperty:
+            defaults[name] = 0.0
+        else:
+            defaults[name] = (0.0,) * keywords.get("size", 3)
+    return defaults
+
+
+def cases(shape, manifest, kernels):
+    # Yields each case once, as a row for the manifest to validate.
+    defaults = kernels.SHAPES[shape]["defaults"]
+    enums = [(key, spec[1])
+        for key, spec in manifest.BOUNDS[shape].items() if spec[0] == "ENUM"]
+    seen = set()
+    for base in ({},) + VARIATIONS.get(shape, ()):
+        variants = [base]
+        for key, values in enums:
+            for value in values:
+                if base.get(key, defaults.get(key)) != value:
+                    variant = dict(base)
+                    variant[key] = value
+                    variants.append(variant)
+        for variant in variants:
+            key = repr(sorted(variant.items()))
+            if key not in seen:
+                seen.add(key)
+                yield variant
+
+
+def read_mesh(mesh_data):
+    len_loops = len(mesh_data.loops)
+    co = array.array("f", [0.0]) * (len(mesh_data.vertices) * 3)
+    mesh_data.vertices.foreach_get("co", co)
+    loop_starts = array.array("i", [0]) * len(mesh_data.polygons)
+    mesh_data.polygons.foreach_get("loop_start", loop_starts)
+    loop_verts = array.array("i", [0]) * len_loops
+    mesh_data.loops.foreach_get("vertex_index", loop_verts)
+    uv = array.array("f", [0.0]) * (len_loops * 2)
+    uv_layer = mesh_data.uv_layers.active
+    if uv_layer is not None:
+        uv_layer.data.foreach_get("uv", uv)
+    edges = array.array("i", [0]) * (len(mesh_data.edges) * 2)
+    mesh_data.edges.foreach_get("vertices", edges)
+
+    # Edge order depends on how the mesh was built, so edges are
+    # compared as a set.
+    edge_set = set()
+    k = 0
+    while k < len(edges):
+        edge_set.add((min(edges[k], edges[k + 1]), max(edges[k], edges[k + 1])))
+        k = k + 2
+
+    return {
+        "co": co,
+        "loop_starts": list(loop_starts),
+        "loop_verts": list(loop_verts),
+        "uv": uv,
+        "edges": edge_set}
+
+
+def read_curve(crv_data, handle_types):
+    result = {
+        "knot_counts": [],
+        "cyclic": [],
+        "resolution": [],
+        "co": [],
+        "handle_left": [],
+        "handle_right": [],
+        "left_types": [],
+        "right_types": []}
+    for spline in crv_data.splines:
+        result["knot_counts"].append(len(spline.bezier_points))
+        result["cyclic"].append(spline.use_cyclic_u)
+        result["resolution"].append(spline.resolution_u)
+        for knot in spline.bezier_points:
+            result["co"].extend(knot.co)
+            result["handle_left"].extend(knot.handle_left)
+            result["handle_right"].extend(knot.handle_right)
+            result["left_types"].append(
+                handle_types.index(knot.handle_left_type))
+            result["right_types"].append(
+                handle_types.index(knot.handle_right_type))
+    return result
+
+
+def compare(expected, actual, tolerance):
+    # Returns a description of each field which differs.
+    diffs = []
+    for key, value in expected.items():
+        other = actual[key]
+        if isinstance(value, set) or not value or isinstance(value[0], (bool, int)):
+            if value != other:
+                diffs.append(key)
+            continue
+        if len(value) != len(other):
+            diffs.append("{} has {} values, not {}".format(
+                key, len(other), len(value)))
+            continue
+        worst = max(abs(a - b) for a, b in zip(value, other))
+        if worst > tolerance:
+            diffs.append("{} differs by {:.6g}".format(key, worst))
+    return diffs
+
+
+def run_operator(cls, params):
+    # Returns the datablock the operator made.
+    before = set(bpy.data.objects)
+    properties = property_defaults(cls)
+    properties.update(params)
+    cls.execute(StubOperator(properties), bpy.context)
+    made = [obj for obj in bpy.data.objects if obj not in before]
+    return made[0].data
+
+
+def remove(data):
+    for obj in [obj for obj in bpy.data.objects if obj.data == data]:
+        bpy.data.objects.remove(obj)
+    if isinstance(data, bpy.types.Mesh):
+        bpy.data.meshes.remove(data)
+    else:
+        bpy.data.curves.remove(data)
+
+
+def main(argv):
+    args = parse_args(argv)
+    import_module(PACKAGE, os.path.join(ROOT, "shape_batch", "__init__.py"))
+    kernels = importlib.import_module(PACKAGE + ".kernels")
+    manifest = importlib.import_module(PACKAGE + ".manifest")
+    writer = importlib.import_module(PACKAGE + ".operators").ShapeBatchMaker
+
+    shapes = list(kernels.SHAPES)
+    if args.shape:
+        shapes = [shape.upper() for shape in args.shape]
+    operators = find_operators(
+        set(kernels.SHAPES[shape]["generator"] for shape in shapes))
+
+    case_count = 0
+    failures = []
+    for shape in shapes:
+        entry = kernels.SHAPES[shape]
+        cls = operators.get(entry["generator"])
+        if cls is None:
+            failures.append("{}: no operator named {}".format(
+                shape, entry["generator"]))
+            continue
+
+        for case in cases(shape, manifest, kernels):
+            case_count = case_count + 1
+            label = "{} {}".format(shape, case)
+            try:
+                row = manifest.validate_row(dict(case, shape=shape))
+                _, params = kernels.resolve(row)
+                kind, arrays = kernels.generate(row)
+
+                if kind == "CURVE":
+                    batch_data = writer.write_curve("Parity", arrays)
+                    op_data = run_operator(cls, params)
+                    expected = read_curve(batch_data, kernels.HANDLE_TYPES)
+                    actual = read_curve(op_data, kernels.HANDLE_TYPES)
+                else:
+                    batch_data = writer.write_mesh("Parity", arrays)
+                    op_data = run_operator(cls, params)
+                    expected = read_mesh(batch_data)
+                    actual = read_mesh(op_data)
+                remove(batch_data)
+                remove(op_data)
+            except Exception as e:
+                failures.append("{}: {}: {}".format(label, type(e).__name__, e))
+                continue
+
+            diffs = compare(expected, actual, args.tolerance)
+            if diffs:
+                failures.append("{}: {}".format(label, "; ".join(diffs)))
+
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    print("{} cases, {} differ".format(case_count, len(failures)))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    code = main(script_args())
+    if code:
+        sys.exit(code)
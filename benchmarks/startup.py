@@ -0,0 +1,329 @@
+"""Measures what the add-ons cost Blender at startup and while drawing.
+
+Run from Blender in background mode, with arguments after "--":
+
+    blender --background --factory-startup --python benchmarks/startup.py -- \\
+        --repeat 10 --history benchmarks/startup_history.jsonl
+
+For each script installed on its own, and for the package which installs
+them all, this times the import of the module, its register() and
+unregister() calls and one call of each function it appends to a menu.
+The set of scripts is then timed as a whole. Menus cannot be drawn in
+background mode, so menu functions are given a stand-in layout. Their
+times are the cost of the Python which runs on every draw, not of
+Blender's drawing.
+
+Each run is appended to the history file, with the commit and Blender
+version, and compared with the last run on the same Blender version, so
+that costs can be tracked from one release to the next.
+"""
+
+import argparse
+import datetime
+import glob
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import bpy # type: ignore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The package is imported under this name, whatever its folder is called.
+PACKAGE = "blendergeom"
+
+# Functions which a module may append to Blender's menus.
+MENU_FUNCS = ("menu_func", "menu_func_import")
+
+# Number of calls over which a menu function is timed.
+DRAW_CALLS = 1000
+
+
+class StubLayout:
+    """Stands in for a UI layout, accepting and ignoring every call"""
+
+    def __getattr__(self, name):
+        return self
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def __setattr__(self, name, value):
+        pass
+
+
+class StubMenu:
+    """Stands in for the menu a menu function is appended to"""
+
+    def __init__(self):
+        self.layout = StubLayout()
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="benchmarks/startup.py",
+        description="Measures add-on import, registration and menu draw times.")
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of times to measure each step; the median is kept")
+    parser.add_argument(
+        "--history",
+        default=os.path.join(ROOT, "benchmarks", "startup_history.jsonl"),
+        help="JSON lines file to which results are appended")
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Print results without appending them to the history")
+    return parser.parse_args(argv)
+
+
+def script_args():
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1:]
+    return sys.argv[1:]
+
+
+def addon_modules():
+    # Returns the name and file of each add-on which can be installed on
+    # its own, sorted by path so that runs line up in the history.
+    modules = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "curves", "**", "*.py"), recursive=True)
+        + glob.glob(os.path.join(ROOT, "meshes", "**", "*.py"), recursive=True)):
+        rel = os.path.relpath(path, ROOT).replace(os.sep, "/")
+        modules.append((rel, path))
+    modules.append(("shape_batch", os.path.join(ROOT, "shape_batch", "__init__.py")))
+    return modules
+
+
+def module_name(rel):
+    return "bench_" + rel.replace("/", "_").replace(".py", "")
+
+
+def forget(name):
+    for key in [k for k in sys.modules if k == name or k.startswith(name + ".")]:
+        del sys.modules[key]
+
+
+def import_module(name, path):
+    # Packages are imported with their folder as a search location, so
+    # that their relative imports resolve.
+    search = None
+    if os.path.basename(path) == "__init__.py":
+        search = [os.path.dirname(path)]
+    spec = importlib.util.spec_from_file_location(
+        name, path, submodule_search_locations=search)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def menu_funcs(module):
+    # The package's menu functions live in its loader, and the shape
+    # batch's in its operators, rather than in the module registered.
+    # Menus a module defines are drawn too, as when they are opened.
+    found = []
+    for owner in (module, getattr(module, "loader", None),
+        getattr(module, "operators", None)):
+        if owner is None:
+            continue
+        for attr in MENU_FUNCS:
+            func = getattr(owner, attr, None)
+            if func is not None:
+                found.append(func)
+        for value in vars(owner).values():
+            if isinstance(value, type) and issubclass(value, bpy.types.Menu) \
+                and value.__module__ == owner.__name__:
+                found.append(value.draw)
+    return found
+
+
+def time_draw(funcs):
+    menu = StubMenu()
+    context = bpy.context
+    start = time.perf_counter()
+    i = 0
+    while i < DRAW_CALLS:
+        for func in funcs:
+            func(menu, context)
+        i = i + 1
+    return (time.perf_counter() - start) / DRAW_CALLS
+
+
+def measure(name, path, repeat):
+    # Times are in milliseconds, except draw times, which are in
+    # microseconds per call.
+    imports = []
+    registers = []
+    unregisters = []
+    draws = []
+    r = 0
+    while r < repeat:
+        forget(name)
+        start = time.perf_counter()
+        module = import_module(name, path)
+        imports.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        module.register()
+        registers.append(time.perf_counter() - start)
+
+        funcs = menu_funcs(module)
+        if funcs:
+            draws.append(time_draw(funcs))
+
+        start = time.perf_counter()
+        module.unregister()
+        unregisters.append(time.perf_counter() - start)
+        r = r + 1
+
+    forget(name)
+    return {
+        "import_ms": statistics.median(imports) * 1000.0,
+        "register_ms": statistics.median(registers) * 1000.0,
+        "unregister_ms": statistics.median(unregisters) * 1000.0,
+        "draw_us": statistics.median(draws) * 1000000.0 if draws else 0.0}
+
+
+def measure_set(modules, repeat):
+    # Every script is imported and registered in turn, as Blender does
+    # when all of them are enabled, then all are unregistered.
+    imports = []
+    registers = []
+    unregisters = []
+    draws = []
+    r = 0
+    while r < repeat:
+        loaded = []
+        start = time.perf_counter()
+        for rel, path in modules:
+            name = module_name(rel)
+            forget(name)
+            loaded.append((name, import_module(name, path)))
+        imports.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for name, module in loaded:
+            module.register()
+        registers.append(time.perf_counter() - start)
+
+        funcs = []
+        for name, module in loaded:
+            funcs.extend(menu_funcs(module))
+        draws.append(time_draw(funcs))
+
+        start = time.perf_counter()
+        for name, module in reversed(loaded):
+            module.unregister()
+        unregisters.append(time.perf_counter() - start)
+
+        for name, module in loaded:
+            forget(name)
+        r = r + 1
+
+    return {
+        "import_ms": statistics.median(imports) * 1000.0,
+        "register_ms": statistics.median(registers) * 1000.0,
+        "unregister_ms": statistics.median(unregisters) * 1000.0,
+        "draw_us": statistics.median(draws) * 1000000.0}
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+            capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def last_record(history, blender_version):
+    if not os.path.exists(history):
+        return None
+    last = None
+    with open(history, "r", encoding="utf-8") as in_file:
+        for line in in_file:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if record.get("blender") == blender_version:
+                last = record
+    return last
+
+
+def print_table(results, previous):
+    keys = ("import_ms", "register_ms", "unregister_ms", "draw_us")
+    print("{:<40}{:>12}{:>12}{:>12}{:>12}".format(
+        "Module", "Import ms", "Reg ms", "Unreg ms", "Draw us"))
+    prev_results = {}
+    if previous is not None:
+        prev_results = previous["results"]
+    for name, result in results.items():
+        cells = ["{:.3f}".format(result[key]) for key in keys]
+        print("{:<40}{:>12}{:>12}{:>12}{:>12}".format(name, *cells))
+
+        prev = prev_results.get(name)
+        if prev is not None:
+            deltas = ["{:+.3f}".format(result[key] - prev.get(key, 0.0))
+                for key in keys]
+            print("{:<40}{:>12}{:>12}{:>12}{:>12}".format("", *deltas))
+
+
+def main(argv):
+    args = parse_args(argv)
+    repeat = max(1, args.repeat)
+    modules = addon_modules()
+
+    # A module which fails to import or register is reported rather
+    # than stopping the run, as that is also a finding.
+    results = {}
+    errors = {}
+    steps = [(rel, measure, (module_name(rel), path, repeat))
+        for rel, path in modules]
+    steps.append(("(all scripts)", measure_set, (modules, repeat)))
+    steps.append(("(package)", measure,
+        (PACKAGE, os.path.join(ROOT, "__init__.py"), repeat)))
+    for name, func, func_args in steps:
+        try:
+            results[name] = func(*func_args)
+        except Exception as e:
+            errors[name] = "{}: {}".format(type(e).__name__, e)
+
+    record = {
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "blender": bpy.app.version_string,
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "results": results,
+        "errors": errors}
+
+    previous = None
+    if not args.no_history:
+        previous = last_record(args.history, record["blender"])
+    print_table(results, previous)
+    if previous is not None:
+        print("Second rows are changes since {} ({}).".format(
+            previous["commit"], previous["date"]))
+    for name, error in errors.items():
+        print("Failed: {}: {}".format(name, error), file=sys.stderr)
+
+    if not args.no_history:
+        os.makedirs(os.path.dirname(os.path.abspath(args.history)), exist_ok=True)
+        with open(args.history, "a", encoding="utf-8") as out_file:
+            out_file.write(json.dumps(record) + "\n")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    code = main(script_args())
+    if code:
+        sys.exit(code)
@@ -102,6 +102,7 @@ class ArcCurveMaker(bpy.types.Operator):
                 math.degrees(stop_angle) % 360,
                 radius),
             "CURVE")
+        crv_data["generator"] = ArcCurveMaker.bl_idname
 
         crv_data['start_angle'] = start_angle % math.tau
         crv_data['stop_angle'] = stop_angle % math.tau
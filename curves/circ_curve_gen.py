@@ -76,6 +76,7 @@ class CircCurveMaker(bpy.types.Operator):
         handle_mag = math.tan(0.25 * to_theta) * radius * (4.0 / 3.0)
 
         crv_data = bpy.data.curves.new("Circle", "CURVE")
+        crv_data["generator"] = CircCurveMaker.bl_idname
         # If a curve is 2D, then transforms cannot be applied.
         crv_data.dimensions = "3D"
 
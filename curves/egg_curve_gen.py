@@ -81,6 +81,7 @@ class EggCurveMaker(bpy.types.Operator):
         sina = math.sin(offset_angle)
 
         crv_data = bpy.data.curves.new("Egg", "CURVE")
+        crv_data["generator"] = EggCurveMaker.bl_idname
         # If a curve is 2D, then transforms cannot be applied.
         crv_data.dimensions = "3D"
 
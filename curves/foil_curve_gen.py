@@ -115,6 +115,7 @@ class FoilCurveMaker(bpy.types.Operator):
             foil_name = foil_name + ".Overlap"
 
         crv_data = bpy.data.curves.new(foil_name, "CURVE")
+        crv_data["generator"] = FoilCurveMaker.bl_idname
         crv_data.dimensions = "3D"
         crv_splines = crv_data.splines
         spline = crv_splines.new("BEZIER")
@@ -89,6 +89,7 @@ class InfinityCurveMaker(bpy.types.Operator):
         sina = math.sin(offset_angle)
 
         crv_data = bpy.data.curves.new("Infinity Loop", "CURVE")
+        crv_data["generator"] = InfinityCurveMaker.bl_idname
         # If a curve is 2D, then transforms cannot be applied.
         crv_data.dimensions = "3D"
 
@@ -172,6 +172,7 @@ class LancetArchCurveMaker(bpy.types.Operator):
             and radius_inner > 0.0
 
         crv_data = bpy.data.curves.new("Lancet Arch", "CURVE")
+        crv_data["generator"] = LancetArchCurveMaker.bl_idname
         # If a curve is 2D, then transforms cannot be applied.
         crv_data.dimensions = "3D"
 
@@ -72,6 +72,7 @@ class LineCurveMaker(bpy.types.Operator):
         handle_factor = 1.0 / (3.0 * subdiv)
 
         crv_data = bpy.data.curves.new("Line", "CURVE")
+        crv_data["generator"] = LineCurveMaker.bl_idname
         # If a curve is 2D, then transforms cannot be applied.
         crv_data.dimensions = "3D"
 
@@ -102,6 +102,7 @@ class OctogramCurveMaker(bpy.types.Operator):
         sina = math.sin(offset_angle)
 
         crv_data = bpy.data.curves.new("Octogram", "CURVE")
+        crv_data["generator"] = OctogramCurveMaker.bl_idname
         # If a curve is 2D, then transforms cannot be applied.
         crv_data.dimensions = "3D"
 
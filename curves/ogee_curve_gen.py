@@ -92,6 +92,7 @@ class OgeeCurveMaker(bpy.types.Operator):
         sina = math.sin(offset_angle)
 
         crv_data = bpy.data.curves.new("Ogee", "CURVE")
+        crv_data["generator"] = OgeeCurveMaker.bl_idname
         # If a curve is 2D, then transforms cannot be applied.
         crv_data.dimensions = "3D"
 
@@ -96,6 +96,7 @@ class PolarGridMaker(bpy.types.Operator):
         ring_sec = rings * sectors
 
         crv_data = bpy.data.curves.new("Polar Grid", "CURVE")
+        crv_data["generator"] = PolarGridMaker.bl_idname
         # If a curve is 2D, then transforms cannot be applied.
         crv_data.dimensions = "3D"
         crv_splines = crv_data.splines
@@ -81,6 +81,7 @@ class ReuleauxCurveMaker(bpy.types.Operator):
         sina = math.sin(offset_angle)
 
         crv_data = bpy.data.curves.new("Reuleaux Triangle", "CURVE")
+        crv_data["generator"] = ReuleauxCurveMaker.bl_idname
         # If a curve is 2D, then transforms cannot be applied.
         crv_data.dimensions = "3D"
 
@@ -31,6 +31,13 @@ class SeedCurveMaker(bpy.types.Operator):
         precision=3,
         default=0.5) # type: ignore
 
+    rings: IntProperty(
+        name="Rings",
+        description="Rings of circles around the central circle",
+        min=1,
+        soft_max=64,
+        default=1) # type: ignore
+
     offset_angle: FloatProperty(
         name="Angle",
         description="Knot offset angle",
@@ -68,18 +75,46 @@ class SeedCurveMaker(bpy.types.Operator):
         return (v[0] * s, v[1] * s, 0.0)
 
     @staticmethod
-    def translate(v, t):
-        return (v[0] + t[0], v[1] + t[1], 0.0)
+    def lattice_centers(rings):
+        # Returns the axial coordinates of a hexagonal lattice, ring by
+        # ring, starting from the center. Each ring is walked from its
+        # first corner, counter-clockwise, so the first ring follows the
+        # order of the hexagon's corners.
+        hex_dirs = [(1, 0), (0, 1), (-1, 1), (-1, 0), (0, -1), (1, -1)]
+        centers = [(0, 0)]
+        k = 1
+        while k <= rings:
+            q = k
+            r = 0
+            side = 0
+            while side < 6:
+                step_dir = hex_dirs[(side + 2) % 6]
+                j = 0
+                while j < k:
+                    centers.append((q, r))
+                    q = q + step_dir[0]
+                    r = r + step_dir[1]
+                    j = j + 1
+                side = side + 1
+            k = k + 1
+        return centers
 
     def execute(self, context):
         radius = max(0.000001, self.radius)
+        rings = max(1, self.rings)
         offset_angle = self.offset_angle
         origin = self.origin
+        res_u = self.res_u
 
         cosa = math.cos(offset_angle)
         sina = math.sin(offset_angle)
 
-        crv_data = bpy.data.curves.new("Seed of Life", "CURVE")
+        crv_name = "Seed of Life"
+        if rings > 1:
+            crv_name = "Flower of Life"
+
+        crv_data = bpy.data.curves.new(crv_name, "CURVE")
+        crv_data["generator"] = SeedCurveMaker.bl_idname
         # If a curve is 2D, then transforms cannot be applied.
         crv_data.dimensions = "3D"
         crv_splines = crv_data.splines
@@ -88,8 +123,8 @@ class SeedCurveMaker(bpy.types.Operator):
         crv_obj.location = context.scene.cursor.location
         context.collection.objects.link(crv_obj)
 
-        # TODO: Create separate, detachable pieces
-        # instead of overlapping circles.
+        # For separate, detachable pieces instead of overlapping circles,
+        # see the circle arrangement mesh.
         hex_cos = [
             (0.8660254037844386, 0.5, 0.0),
             (0.0, 1.0, 0.0),
@@ -117,81 +152,60 @@ class SeedCurveMaker(bpy.types.Operator):
             (1.0446581987385204, -0.19059892324149685, 0.0),
         ]
 
-        spline = crv_splines.new("BEZIER")
-        spline.use_cyclic_u = True
-        spline.resolution_u = self.res_u
-
-        bz_pts = spline.bezier_points
-        bz_pts.add(5)
-
+        # The circle is scaled and rotated once. Every circle of the
+        # lattice is a translation of it.
+        co_local = []
+        lh_local = []
+        rh_local = []
         k = 0
-        for knot in bz_pts:
-            co_local = hex_cos[k]
-            fh_local = hex_fhs[k]
-            rh_local = hex_rhs[k]
-
-            knot.handle_left_type = "FREE"
-            knot.handle_right_type = "FREE"
-            knot.co = SeedCurveMaker.translate(
-                SeedCurveMaker.rotate_z(
-                SeedCurveMaker.scale(co_local, radius),
-                cosa, sina),
-                origin)
-            knot.handle_left = SeedCurveMaker.translate(
-                SeedCurveMaker.rotate_z(
-                SeedCurveMaker.scale(rh_local, radius),
-                cosa, sina),
-                origin)
-            knot.handle_right = SeedCurveMaker.translate(
-                SeedCurveMaker.rotate_z(
-                SeedCurveMaker.scale(fh_local, radius),
-                cosa, sina),
-                origin)
-
+        while k < 6:
+            co_local.extend(SeedCurveMaker.rotate_z(
+                SeedCurveMaker.scale(hex_cos[k], radius),
+                cosa, sina))
+            lh_local.extend(SeedCurveMaker.rotate_z(
+                SeedCurveMaker.scale(hex_rhs[k], radius),
+                cosa, sina))
+            rh_local.extend(SeedCurveMaker.rotate_z(
+                SeedCurveMaker.scale(hex_fhs[k], radius),
+                cosa, sina))
             k = k + 1
 
-        i = 0
-        while i < 6:
-            center = SeedCurveMaker.translate(
-                SeedCurveMaker.rotate_z(
-                SeedCurveMaker.scale(hex_cos[i], radius),
-                cosa, sina),
-                origin)
-
+        # Lattice axes are the first two corners of the hexagon, so the
+        # lattice's spacing is the radius.
+        u = SeedCurveMaker.rotate_z(
+            SeedCurveMaker.scale(hex_cos[0], radius), cosa, sina)
+        v = SeedCurveMaker.rotate_z(
+            SeedCurveMaker.scale(hex_cos[1], radius), cosa, sina)
+        offsets = []
+        for q, r in SeedCurveMaker.lattice_centers(rings):
+            offsets.extend((
+                origin[0] + q * u[0] + r * v[0],
+                origin[1] + q * u[1] + r * v[1],
+                0.0) * 6)
+
+        len_offsets = len(offsets)
+        circ_count = len_offsets // 18
+        co = [a + b for a, b in zip(co_local * circ_count, offsets)]
+        handle_left = [a + b for a, b in zip(lh_local * circ_count, offsets)]
+        handle_right = [a + b for a, b in zip(rh_local * circ_count, offsets)]
+
+        j = 0
+        while j < len_offsets:
             spline = crv_splines.new("BEZIER")
             spline.use_cyclic_u = True
-            spline.resolution_u = self.res_u
+            spline.resolution_u = res_u
 
             bz_pts = spline.bezier_points
             bz_pts.add(5)
 
-            k = 0
+            # Handle types are enums, which foreach_set does not accept.
             for knot in bz_pts:
-                co_local = hex_cos[k]
-                fh_local = hex_fhs[k]
-                rh_local = hex_rhs[k]
-
                 knot.handle_left_type = "FREE"
                 knot.handle_right_type = "FREE"
-                knot.co = SeedCurveMaker.translate(
-                    SeedCurveMaker.rotate_z(
-                    SeedCurveMaker.scale(co_local, radius),
-                    cosa, sina),
-                    center)
-                knot.handle_left = SeedCurveMaker.translate(
-                    SeedCurveMaker.rotate_z(
-                    SeedCurveMaker.scale(rh_local, radius),
-                    cosa, sina),
-                    center)
-                knot.handle_right = SeedCurveMaker.translate(
-                    SeedCurveMaker.rotate_z(
-                    SeedCurveMaker.scale(fh_local, radius),
-                    cosa, sina),
-                    center)
-
-                k = k + 1
-
-            i = i + 1
+            bz_pts.foreach_set("co", co[j:j + 18])
+            bz_pts.foreach_set("handle_left", handle_left[j:j + 18])
+            bz_pts.foreach_set("handle_right", handle_right[j:j + 18])
+            j = j + 18
 
         return {"FINISHED"}
 
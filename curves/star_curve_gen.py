@@ -148,6 +148,7 @@ class StarCurveMaker(bpy.types.Operator):
             else:
                 crv_name = "Polygon"
         crv_data = bpy.data.curves.new(crv_name, "CURVE")
+        crv_data["generator"] = StarCurveMaker.bl_idname
         # If a curve is 2D, then transforms cannot be applied.
         crv_data.dimensions = "3D"
 
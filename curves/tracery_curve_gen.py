@@ -0,0 +1,324 @@
+import bpy # type: ignore
+import math
+from bpy.props import ( # type: ignore
+    EnumProperty,
+    FloatProperty,
+    FloatVectorProperty,
+    IntProperty)
+
+bl_info = {
+    "name": "Create Tracery Curve",
+    "author": "Jeremy Behreandt",
+    "version": (0, 1),
+    "blender": (4, 5, 2),
+    "category": "Add Curve",
+    "description": "Creates a Bezier curve Gothic window of nested arches, circles and foils.",
+    "tracker_url": "https://github.com/behreajj/blendergeom"
+}
+
+
+class TraceryCurveMaker(bpy.types.Operator):
+    """Creates a Bezier curve Gothic window of nested arches, circles and foils"""
+
+    bl_idname = "curve.primitive_tracery_add"
+    bl_label = "Tracery"
+    bl_options = {"REGISTER", "UNDO"}
+
+    depth: IntProperty(
+        name="Depth",
+        description="Levels of arches nested in the window",
+        min=0,
+        soft_max=5,
+        max=8,
+        default=2) # type: ignore
+
+    sharpness: FloatProperty(
+        name="Sharpness",
+        description="Arch sharpness, where 0 is equilateral and 1 is lancet",
+        default=0.0,
+        step=1,
+        precision=3,
+        min=0.0,
+        max=1.0,
+        subtype="FACTOR") # type: ignore
+
+    foil_count: IntProperty(
+        name="Foils",
+        description="Lobes of the foil inside each circle, or 0 for none",
+        min=0,
+        max=12,
+        default=3) # type: ignore
+
+    radius: FloatProperty(
+        name="Radius",
+        description="Window radius, half its span",
+        min=0.0001,
+        soft_max=100.0,
+        step=1,
+        precision=3,
+        default=0.5) # type: ignore
+
+    origin: FloatVectorProperty(
+        name="Origin",
+        description="Window origin",
+        default=(0.0, 0.0),
+        step=1,
+        precision=3,
+        size=2,
+        subtype="TRANSLATION") # type: ignore
+
+    output: EnumProperty(
+        items=[
+            ("CURVE", "Curve", "Bezier curve", 1),
+            ("MESH", "Mesh", "Mesh of edges", 2)],
+        name="Output",
+        default="CURVE",
+        description="Kind of data to create") # type: ignore
+
+    res_u: IntProperty(
+        name="Resolution",
+        description="Resolution",
+        min=1,
+        soft_max=64,
+        default=24) # type: ignore
+
+    sectors: IntProperty(
+        name="Vertices",
+        description="Number of mesh points per full circle",
+        min=3,
+        soft_max=500,
+        default=64) # type: ignore
+
+    @staticmethod
+    def arch_path(x_center, y_base, span, arc_ratio, arc_angle):
+        # An arch of half width span is two arcs whose radius is the
+        # span times the arc ratio. The right half is drawn by the arc
+        # centered on the left, and the other way round.
+        r = span * arc_ratio
+        x_offset = span - r
+        return [
+            ((x_center + x_offset, y_base), r, 0.0, arc_angle),
+            ((x_center - x_offset, y_base), r, math.pi - arc_angle, math.pi)]
+
+    @staticmethod
+    def foil_path(x_center, y_center, radius, foil_count):
+        # Lobes are tangent to each other and to the circle they fill.
+        # Each lobe's arc runs between the points where it touches its
+        # neighbors, with one lobe pointing up.
+        half_angle = math.pi / foil_count
+        sin_half = math.sin(half_angle)
+        r_lobe = radius * sin_half / (1.0 + sin_half)
+        d_lobe = radius - r_lobe
+        sweep = math.pi * 0.5 + half_angle
+
+        path = [None] * foil_count
+        i = 0
+        while i < foil_count:
+            theta = math.pi * 0.5 + i * 2.0 * half_angle
+            path[i] = (
+                (x_center + d_lobe * math.cos(theta),
+                    y_center + d_lobe * math.sin(theta)),
+                r_lobe, theta - sweep, theta + sweep)
+            i = i + 1
+        return path
+
+    @staticmethod
+    def calc_tracery(depth, sharpness, foil_count, radius, origin):
+        # Returns the window as a list of paths. Each path is a list of
+        # circular arcs, given by center, radius and start and stop
+        # angle, and a flag for whether it is closed.
+        #
+        # An arch holds two arches of half its span, side by side, and a
+        # circle in its head. The circle touches the inside of the arch's
+        # arcs and the outside of the two sub arches' inner arcs. With
+        # the arch's arc radius R, less its span, as a, and the sub
+        # arches' arc radius as b, the circle's center at height h is
+        #     sqrt(a^2 + h^2) = R - rho
+        #     sqrt(b^2 + h^2) = b + rho
+        # Adding these, then squaring, gives sqrt(b^2 + h^2) directly.
+        sharpness = min(max(sharpness, 0.0), 1.0)
+        arc_ratio = (1.0 - sharpness) * 2.0 + sharpness * 4.0
+        arc_x_offset = arc_ratio - 1.0
+
+        # The apex is where the two unit arcs cross, above the midpoint
+        # of their centers.
+        y_apex = math.sqrt(arc_ratio * arc_ratio - arc_x_offset * arc_x_offset)
+        arc_angle = math.atan2(y_apex, arc_x_offset)
+
+        a_unit = arc_ratio - 1.0
+        b_unit = arc_ratio * 0.5
+        s_unit = arc_ratio + b_unit
+        t_unit = (s_unit * s_unit + b_unit * b_unit - a_unit * a_unit) \
+            / (2.0 * s_unit)
+        h_unit = math.sqrt(max(0.0, t_unit * t_unit - b_unit * b_unit))
+        rho_unit = t_unit - b_unit
+
+        paths = []
+        stack = [(origin[0], radius, 0)]
+        while stack:
+            x_center, span, level = stack.pop()
+            paths.append((TraceryCurveMaker.arch_path(
+                x_center, origin[1], span, arc_ratio, arc_angle), False))
+
+            if level < depth:
+                half_span = span * 0.5
+                stack.append((x_center + half_span, half_span, level + 1))
+                stack.append((x_center - half_span, half_span, level + 1))
+
+                y_circ = origin[1] + h_unit * span
+                rho = rho_unit * span
+                paths.append(([((x_center, y_circ), rho, 0.0, math.tau)], True))
+                if foil_count > 1:
+                    paths.append((TraceryCurveMaker.foil_path(
+                        x_center, y_circ, rho, foil_count), True))
+
+        return paths
+
+    @staticmethod
+    def path_to_knots(path, closed):
+        # Splits each arc into pieces of at most 90 degrees. A piece's
+        # handles are tangent to the arc, with length 4 / 3 tan(a / 4) of
+        # the radius, where a is the piece's angle.
+        knots = []
+        for center, r, angle_orig, angle_dest in path:
+            arc_len = angle_dest - angle_orig
+            piece_count = max(1, math.ceil(abs(arc_len) / (math.pi * 0.5) - 0.000001))
+            piece_len = arc_len / piece_count
+            handle_mag = r * (4.0 / 3.0) * math.tan(piece_len * 0.25)
+
+            j = 0
+            while j < piece_count:
+                t0 = angle_orig + j * piece_len
+                t1 = t0 + piece_len
+                cos_t0 = math.cos(t0)
+                sin_t0 = math.sin(t0)
+                cos_t1 = math.cos(t1)
+                sin_t1 = math.sin(t1)
+                p0 = (center[0] + r * cos_t0, center[1] + r * sin_t0)
+                p1 = (center[0] + r * cos_t1, center[1] + r * sin_t1)
+                h0 = (p0[0] - handle_mag * sin_t0, p0[1] + handle_mag * cos_t0)
+                h1 = (p1[0] + handle_mag * sin_t1, p1[1] - handle_mag * cos_t1)
+
+                if knots:
+                    knots[-1][2] = h0
+                else:
+                    knots.append([p0, (2.0 * p0[0] - h0[0], 2.0 * p0[1] - h0[1]), h0])
+                knots.append([p1, h1, (2.0 * p1[0] - h1[0], 2.0 * p1[1] - h1[1])])
+                j = j + 1
+
+        # A closed path ends where it began, so its last knot is folded
+        # into its first.
+        if closed and len(knots) > 1:
+            last = knots.pop()
+            knots[0][1] = last[1]
+        return knots
+
+    @staticmethod
+    def path_to_points(path, closed, sectors):
+        points = []
+        for center, r, angle_orig, angle_dest in path:
+            arc_len = angle_dest - angle_orig
+            seg_count = max(1, math.ceil(sectors * abs(arc_len) / math.tau))
+            j = 0 if not points else 1
+            while j <= seg_count:
+                angle = angle_orig + arc_len * j / seg_count
+                points.append((
+                    center[0] + r * math.cos(angle),
+                    center[1] + r * math.sin(angle)))
+                j = j + 1
+        if closed and len(points) > 1:
+            points.pop()
+        return points
+
+    def execute(self, context):
+        depth = max(0, self.depth)
+        radius = max(0.000001, self.radius)
+        foil_count = max(0, self.foil_count)
+        origin = self.origin
+
+        paths = TraceryCurveMaker.calc_tracery(
+            depth, self.sharpness, foil_count, radius, origin)
+
+        if self.output == "MESH":
+            sectors = max(3, self.sectors)
+            vs = []
+            edges = []
+            for path, closed in paths:
+                points = TraceryCurveMaker.path_to_points(path, closed, sectors)
+                start = len(vs)
+                len_points = len(points)
+                vs.extend(points)
+                j = 0
+                while j < len_points - 1:
+                    edges.append((start + j, start + j + 1))
+                    j = j + 1
+                if closed:
+                    edges.append((start + len_points - 1, start))
+
+            mesh_data = bpy.data.meshes.new("Tracery")
+            mesh_data["generator"] = TraceryCurveMaker.bl_idname
+            mesh_data.vertices.add(len(vs))
+            mesh_data.vertices.foreach_set(
+                "co", [c for v in vs for c in (v[0], v[1], 0.0)])
+            mesh_data.edges.add(len(edges))
+            mesh_data.edges.foreach_set(
+                "vertices", [h for e in edges for h in e])
+            mesh_data.update()
+
+            mesh_obj = bpy.data.objects.new(mesh_data.name, mesh_data)
+            mesh_obj.location = context.scene.cursor.location
+            context.collection.objects.link(mesh_obj)
+            return {"FINISHED"}
+
+        crv_data = bpy.data.curves.new("Tracery", "CURVE")
+        crv_data["generator"] = TraceryCurveMaker.bl_idname
+        # If a curve is 2D, then transforms cannot be applied.
+        crv_data.dimensions = "3D"
+        crv_splines = crv_data.splines
+        res_u = self.res_u
+
+        for path, closed in paths:
+            knots = TraceryCurveMaker.path_to_knots(path, closed)
+
+            spline = crv_splines.new("BEZIER")
+            spline.use_cyclic_u = closed
+            spline.resolution_u = res_u
+
+            # Spline already contains one Bezier point.
+            bz_pts = spline.bezier_points
+            bz_pts.add(len(knots) - 1)
+
+            # Handle types are enums, which foreach_set does not accept.
+            for knot in bz_pts:
+                knot.handle_left_type = "FREE"
+                knot.handle_right_type = "FREE"
+            bz_pts.foreach_set("co", [c
+                for k in knots for c in (k[0][0], k[0][1], 0.0)])
+            bz_pts.foreach_set("handle_left", [c
+                for k in knots for c in (k[1][0], k[1][1], 0.0)])
+            bz_pts.foreach_set("handle_right", [c
+                for k in knots for c in (k[2][0], k[2][1], 0.0)])
+
+        crv_obj = bpy.data.objects.new(crv_data.name, crv_data)
+        crv_obj.location = context.scene.cursor.location
+        context.collection.objects.link(crv_obj)
+
+        return {"FINISHED"}
+
+    @classmethod
+    def poll(cls, context):
+        return context.area.type == "VIEW_3D"
+
+
+def menu_func(self, context):
+    self.layout.operator(TraceryCurveMaker.bl_idname, icon="CURVE_BEZCURVE")
+
+
+def register():
+    bpy.utils.register_class(TraceryCurveMaker)
+    bpy.types.VIEW3D_MT_curve_add.append(menu_func)
+
+
+def unregister():
+    bpy.utils.unregister_class(TraceryCurveMaker)
+    bpy.types.VIEW3D_MT_curve_add.remove(menu_func)
@@ -99,6 +99,7 @@ class TudorArchCurveMaker(bpy.types.Operator):
             and radius_inner > 0.0
 
         crv_data = bpy.data.curves.new("Tudor Arch", "CURVE")
+        crv_data["generator"] = TudorArchCurveMaker.bl_idname
         # If a curve is 2D, then transforms cannot be applied.
         crv_data.dimensions = "3D"
 
@@ -86,7 +86,7 @@ class CircIntersectCurveMaker(bpy.types.Operator):
         f = (0.5 * (orig[0] + dest[0]) + a * (dest[0] - orig[0]),
             0.5 * (orig[1] + dest[1]) + a * (dest[1] - orig[1]))
         g = (c * 0.5 * (dest[1] - orig[1]),
-            c * 0.5 * (dest[0] - orig[0]))
+            c * 0.5 * (orig[0] - dest[0]))
 
         i1 = (f[0] + g[0],
             f[1] + g[1])
@@ -98,6 +98,109 @@ class CircIntersectCurveMaker(bpy.types.Operator):
 
         return [ i1, i2 ]
 
+    @staticmethod
+    def circ_intersect_all(centers, radii, tolerance=0.00001):
+        # Finds every point where two circles of a set cross. Returns
+        # a list of points and a list of the index pairs which made
+        # them, one pair per point. Circles are hashed into a uniform
+        # grid by their bounds, so only circles which share a cell are
+        # compared. For circles of similar size, this is near linear
+        # rather than quadratic in the number of circles.
+        len_circs = len(radii)
+        points = []
+        pairs = []
+        if len_circs < 2:
+            return points, pairs
+
+        # Cells are as wide as the average diameter, so that a typical
+        # circle covers at most four cells.
+        r_sum = 0.0
+        for r in radii:
+            r_sum = r_sum + r
+        cell_size = max(tolerance, 2.0 * r_sum / len_circs)
+        to_cell = 1.0 / cell_size
+
+        bounds = [None] * len_circs
+        grid = {}
+        i = 0
+        while i < len_circs:
+            x, y = centers[i][0], centers[i][1]
+            r = radii[i]
+            lbx = math.floor((x - r) * to_cell)
+            lby = math.floor((y - r) * to_cell)
+            ubx = math.floor((x + r) * to_cell)
+            uby = math.floor((y + r) * to_cell)
+            bounds[i] = (lbx, lby, ubx, uby)
+
+            cx = lbx
+            while cx <= ubx:
+                cy = lby
+                while cy <= uby:
+                    key = (cx, cy)
+                    cell = grid.get(key)
+                    if cell is None:
+                        grid[key] = [i]
+                    else:
+                        cell.append(i)
+                    cy = cy + 1
+                cx = cx + 1
+            i = i + 1
+
+        for (cx, cy), cell in grid.items():
+            len_cell = len(cell)
+            j = 0
+            while j < len_cell:
+                a = cell[j]
+                a_bounds = bounds[a]
+                k = j + 1
+                while k < len_cell:
+                    b = cell[k]
+                    b_bounds = bounds[b]
+                    k = k + 1
+
+                    # A pair which shares many cells is only tested in
+                    # the first cell of the overlap of their bounds.
+                    if cx != max(a_bounds[0], b_bounds[0]) \
+                        or cy != max(a_bounds[1], b_bounds[1]):
+                        continue
+
+                    ax, ay = centers[a][0], centers[a][1]
+                    bx, by = centers[b][0], centers[b][1]
+                    ra = radii[a]
+                    rb = radii[b]
+                    dx = bx - ax
+                    dy = by - ay
+                    dsq = dx * dx + dy * dy
+                    if dsq > (ra + rb) ** 2 \
+                        or dsq < (ra - rb) ** 2 \
+                        or dsq < tolerance * tolerance:
+                        continue
+
+                    # Distance from the first center, along the line
+                    # between centers, to the chord between points.
+                    d = math.sqrt(dsq)
+                    d_inv = 1.0 / d
+                    t = (ra * ra - rb * rb + dsq) * 0.5 * d_inv
+                    hsq = ra * ra - t * t
+                    h = 0.0
+                    if hsq > 0.0:
+                        h = math.sqrt(hsq)
+
+                    mx = ax + t * dx * d_inv
+                    my = ay + t * dy * d_inv
+                    ox = -dy * h * d_inv
+                    oy = dx * h * d_inv
+
+                    pair = (min(a, b), max(a, b))
+                    points.append((mx + ox, my + oy))
+                    pairs.append(pair)
+                    if h > tolerance:
+                        points.append((mx - ox, my - oy))
+                        pairs.append(pair)
+                j = j + 1
+
+        return points, pairs
+
 
     def execute(self, context):
         orig = self.a_orig
@@ -114,6 +217,7 @@ class CircIntersectCurveMaker(bpy.types.Operator):
         #     self.report({"INFO"}, f"({intersection[0]},{intersection[1]})")
 
         crv_data = bpy.data.curves.new("Circles", "CURVE")
+        crv_data["generator"] = CircIntersectCurveMaker.bl_idname
         # If a curve is 2D, then transforms cannot be applied.
         crv_data.dimensions = "3D"
         crv_splines = crv_data.splines
@@ -1,5 +1,9 @@
 import bpy # type: ignore
+import heapq
+import math
+import random
 from bpy.props import ( # type: ignore
+    BoolProperty,
     EnumProperty,
     FloatVectorProperty,
     IntProperty)
@@ -22,6 +26,19 @@ class LineIntersectCurveMaker(bpy.types.Operator):
     bl_label = "Line Intersect"
     bl_options = {"REGISTER", "UNDO"}
 
+    mode: EnumProperty(
+        items=[
+            ("PAIR", "Pair", "Intersect the two lines below", 1),
+            ("MESH", "Mesh Edges", "Intersect every edge of the active mesh object, seen from above", 2)],
+        name="Mode",
+        default="PAIR",
+        description="Lines to intersect") # type: ignore
+
+    split: BoolProperty(
+        name="Split At Crossings",
+        description="Add a knot to each edge wherever another edge crosses it",
+        default=True) # type: ignore
+
     a_orig: FloatVectorProperty(
         name="Origin",
         description="Line origin",
@@ -78,8 +95,317 @@ class LineIntersectCurveMaker(bpy.types.Operator):
     def determinant(a, b):
         return a[0] * b[1] - a[1] * b[0]
 
+    @staticmethod
+    def seg_intersect(a, b, c, d, tolerance=0.000001):
+        # Returns the point where segment ab meets segment cd, or None if
+        # they do not meet or are parallel.
+        r = (b[0] - a[0], b[1] - a[1])
+        s = (d[0] - c[0], d[1] - c[1])
+        denom = LineIntersectCurveMaker.determinant(r, s)
+        if abs(denom) < 0.000000000001:
+            return None
+
+        ca = (c[0] - a[0], c[1] - a[1])
+        t = LineIntersectCurveMaker.determinant(ca, s) / denom
+        u = LineIntersectCurveMaker.determinant(ca, r) / denom
+        t_tol = tolerance / math.sqrt(r[0] ** 2 + r[1] ** 2)
+        u_tol = tolerance / math.sqrt(s[0] ** 2 + s[1] ** 2)
+        if t < -t_tol or t > 1.0 + t_tol or u < -u_tol or u > 1.0 + u_tol:
+            return None
+        return (a[0] + t * r[0], a[1] + t * r[1])
+
+    @staticmethod
+    def sweep_intersect(segments, tolerance=0.000001):
+        # Finds every point where two of a list of segments cross, with a
+        # Bentley-Ottmann sweep from left to right. Returns a list of
+        # points and a list of the index pairs which met at them, one
+        # pair per point. Segments which only share an end point are not
+        # counted. Collinear overlaps are not reported.
+        #
+        # Events are points, ordered by x then y, and snapped to a grid
+        # the size of the tolerance, so that three or more segments which
+        # meet at a point meet at one event. The status is a skip list of
+        # the segments which cross the sweep line, in order of y. Each
+        # segment links to its neighbors on every level of the list, so
+        # it can be removed without a search, and positions are found in
+        # logarithmic expected time.
+        to_grid = 1.0 / tolerance
+        len_segs = len(segments)
+        starts = {}
+        ends = {}
+        lefts = [None] * len_segs
+        rights = [None] * len_segs
+        slopes = [0.0] * len_segs
+        queue = []
+
+        i = 0
+        while i < len_segs:
+            seg = segments[i]
+            p = (seg[0][0], seg[0][1])
+            q = (seg[1][0], seg[1][1])
+            pk = (round(p[0] * to_grid), round(p[1] * to_grid))
+            qk = (round(q[0] * to_grid), round(q[1] * to_grid))
+            if pk != qk:
+                if qk < pk:
+                    p, q = q, p
+                    pk, qk = qk, pk
+                lefts[i] = p
+                rights[i] = q
+                dx = q[0] - p[0]
+                slopes[i] = (q[1] - p[1]) / dx if pk[0] != qk[0] else math.inf
+
+                if pk not in starts and pk not in ends:
+                    heapq.heappush(queue, (pk, p))
+                starts.setdefault(pk, []).append(i)
+                if qk not in starts and qk not in ends:
+                    heapq.heappush(queue, (qk, q))
+                ends.setdefault(qk, []).append(i)
+            i = i + 1
+
+        def y_at(i, x, y):
+            # Vertical segments are taken to be at the event's height.
+            slope = slopes[i]
+            left = lefts[i]
+            if slope == math.inf:
+                return min(max(y, left[1]), rights[i][1])
+            if x == rights[i][0]:
+                return rights[i][1]
+            return left[1] + (x - left[0]) * slope
+
+        # The head of the skip list is an index past the last segment.
+        # An index of -1 marks the end of a level.
+        head = len_segs
+        levels = 1
+        while (1 << levels) <= len_segs:
+            levels = levels + 1
+        nexts = [None] * (len_segs + 1)
+        prevs = [None] * (len_segs + 1)
+        nexts[head] = [-1] * levels
+        rng = random.Random(len_segs)
+
+        def find_below(x, y):
+            # Returns the last segment below y at x on each level.
+            update = [head] * levels
+            node = head
+            level = levels - 1
+            while level >= 0:
+                after = nexts[node][level]
+                while after >= 0 and y_at(after, x, y) < y:
+                    node = after
+                    after = nexts[node][level]
+                update[level] = node
+                level = level - 1
+            return update
+
+        def insert_after(update, i):
+            # Moves the update past the new segment, so that segments can
+            # be inserted one after another.
+            height = 1
+            while height < levels and rng.random() < 0.5:
+                height = height + 1
+            nexts[i] = [-1] * height
+            prevs[i] = [head] * height
+            level = 0
+            while level < height:
+                before = update[level]
+                after = nexts[before][level]
+                nexts[i][level] = after
+                prevs[i][level] = before
+                nexts[before][level] = i
+                if after >= 0:
+                    prevs[after][level] = i
+                update[level] = i
+                level = level + 1
+
+        def remove(i):
+            level = 0
+            height = len(nexts[i])
+            while level < height:
+                before = prevs[i][level]
+                after = nexts[i][level]
+                nexts[before][level] = after
+                if after >= 0:
+                    prevs[after][level] = before
+                level = level + 1
+            nexts[i] = None
+            prevs[i] = None
+
+        def check(i, j, key):
+            point = LineIntersectCurveMaker.seg_intersect(
+                lefts[i], rights[i], lefts[j], rights[j], tolerance)
+            if point is None:
+                return
+            point_key = (round(point[0] * to_grid), round(point[1] * to_grid))
+            if point_key > key and point_key not in seen:
+                seen.add(point_key)
+                heapq.heappush(queue, (point_key, point))
+
+        seen = set(starts)
+        seen.update(ends)
+        points = []
+        pairs = []
+        while queue:
+            key, p = heapq.heappop(queue)
+            px, py = p
+            upper = starts.get(key, [])
+            lower = ends.get(key, [])
+
+            # Segments which end here are removed by identity. Segments
+            # which pass through are found near the event's height.
+            for i in lower:
+                remove(i)
+            inner = []
+            i = nexts[find_below(px, py - tolerance)[0]][0]
+            while i >= 0 and y_at(i, px, py) <= py + tolerance:
+                left = lefts[i]
+                right = rights[i]
+                ux = right[0] - left[0]
+                uy = right[1] - left[1]
+                dist = abs(ux * (py - left[1]) - uy * (px - left[0])) \
+                    / math.sqrt(ux * ux + uy * uy)
+                if dist <= tolerance:
+                    inner.append(i)
+                i = nexts[i][0]
+
+            # Every pair which meets here is a crossing, unless both
+            # segments end or start here, or they overlap.
+            meeting = upper + lower + inner
+            len_ends = len(upper) + len(lower)
+            len_meeting = len(meeting)
+            j = 0
+            while j < len_meeting:
+                k = max(j + 1, len_ends)
+                while k < len_meeting:
+                    a = meeting[j]
+                    b = meeting[k]
+                    if slopes[a] != slopes[b]:
+                        points.append(p)
+                        pairs.append((min(a, b), max(a, b)))
+                    k = k + 1
+                j = j + 1
+
+            for i in inner:
+                remove(i)
+
+            # Segments which continue past the event are ordered by
+            # slope, as they are just to its right.
+            going = sorted(upper + inner, key=lambda i: (slopes[i], i))
+            update = find_below(px, py)
+            below = update[0]
+            for i in going:
+                insert_after(update, i)
+            above = nexts[update[0]][0]
+
+            if going:
+                if below != head:
+                    check(below, going[0], key)
+                if above >= 0:
+                    check(going[-1], above, key)
+            elif below != head and above >= 0:
+                check(below, above, key)
+
+        return points, pairs
+
+    @staticmethod
+    def write_polyline(crv_splines, points, handle_type, res_u):
+        # Each span's handles sit a third of the way toward its ends, so
+        # the spline follows the straight line.
+        len_points = len(points)
+        spline = crv_splines.new("BEZIER")
+        spline.use_cyclic_u = False
+        spline.resolution_u = res_u
+        bz_pts = spline.bezier_points
+        bz_pts.add(len_points - 1)
+
+        co = [0.0] * (len_points * 3)
+        handle_left = [0.0] * (len_points * 3)
+        handle_right = [0.0] * (len_points * 3)
+        i = 0
+        while i < len_points:
+            curr_pt = points[i]
+            prev_pt = points[max(0, i - 1)]
+            next_pt = points[min(len_points - 1, i + 1)]
+            if i == 0:
+                prev_pt = (curr_pt[0] - (next_pt[0] - curr_pt[0]), curr_pt[1] - (next_pt[1] - curr_pt[1]))
+            if i == len_points - 1:
+                next_pt = (curr_pt[0] + (curr_pt[0] - prev_pt[0]), curr_pt[1] + (curr_pt[1] - prev_pt[1]))
+
+            j = i * 3
+            co[j] = curr_pt[0]
+            co[j + 1] = curr_pt[1]
+            handle_left[j] = curr_pt[0] + (prev_pt[0] - curr_pt[0]) / 3.0
+            handle_left[j + 1] = curr_pt[1] + (prev_pt[1] - curr_pt[1]) / 3.0
+            handle_right[j] = curr_pt[0] + (next_pt[0] - curr_pt[0]) / 3.0
+            handle_right[j + 1] = curr_pt[1] + (next_pt[1] - curr_pt[1]) / 3.0
+            i = i + 1
+
+        for knot in bz_pts:
+            knot.handle_left_type = handle_type
+            knot.handle_right_type = handle_type
+        bz_pts.foreach_set("co", co)
+        bz_pts.foreach_set("handle_left", handle_left)
+        bz_pts.foreach_set("handle_right", handle_right)
+
+    def execute_mesh(self, context):
+        src_obj = context.active_object
+        if src_obj is None or src_obj.type != "MESH":
+            self.report({"ERROR"}, "Mesh Edges mode needs an active mesh object")
+            return {"CANCELLED"}
+
+        # Edges are intersected in the object's space, seen from above.
+        src_data = src_obj.data
+        vs = src_data.vertices
+        segments = []
+        for edge in src_data.edges:
+            v0 = vs[edge.vertices[0]].co
+            v1 = vs[edge.vertices[1]].co
+            segments.append(((v0[0], v0[1]), (v1[0], v1[1])))
+
+        points, pairs = LineIntersectCurveMaker.sweep_intersect(segments)
+
+        crv_data = bpy.data.curves.new("Lines", "CURVE")
+        crv_data["generator"] = LineIntersectCurveMaker.bl_idname
+        crv_data.dimensions = "3D"
+        crv_splines = crv_data.splines
+
+        len_segs = len(segments)
+        cuts = [None] * len_segs
+        i = 0
+        while i < len_segs:
+            cuts[i] = [segments[i][0], segments[i][1]]
+            i = i + 1
+        if self.split:
+            for point, pair in zip(points, pairs):
+                cuts[pair[0]].append(point)
+                cuts[pair[1]].append(point)
+
+        for seg, seg_cuts in zip(segments, cuts):
+            # Points are sorted by their distance from the start, and
+            # repeats, from three or more edges meeting, are dropped.
+            orig = seg[0]
+            seg_cuts.sort(key=lambda v: (v[0] - orig[0]) ** 2 + (v[1] - orig[1]) ** 2)
+            knots = [seg_cuts[0]]
+            for v in seg_cuts:
+                last = knots[-1]
+                if abs(v[0] - last[0]) > 0.000001 or abs(v[1] - last[1]) > 0.000001:
+                    knots.append(v)
+            if len(knots) > 1:
+                LineIntersectCurveMaker.write_polyline(
+                    crv_splines, knots, self.handle_type, self.res_u)
+
+        crv_obj = bpy.data.objects.new(crv_data.name, crv_data)
+        crv_obj.matrix_world = src_obj.matrix_world
+        context.collection.objects.link(crv_obj)
+
+        self.report({"INFO"}, "{} crossings among {} edges".format(
+            len(points), len_segs))
+        return {"FINISHED"}
+
 
     def execute(self, context):
+        if self.mode == "MESH":
+            return self.execute_mesh(context)
+
         a_orig = self.a_orig
         a_dest = self.a_dest
         b_orig = self.b_orig
@@ -95,6 +421,7 @@ class LineIntersectCurveMaker(bpy.types.Operator):
         div = LineIntersectCurveMaker.determinant(xdiff, ydiff)
 
         crv_data = bpy.data.curves.new("Lines", "CURVE")
+        crv_data["generator"] = LineIntersectCurveMaker.bl_idname
         # If a curve is 2D, then transforms cannot be applied.
         crv_data.dimensions = "3D"
 
@@ -100,6 +100,7 @@ class VesicaCurveMaker(bpy.types.Operator):
         sina = math.sin(offset_angle)
 
         crv_data = bpy.data.curves.new("Vesica", "CURVE")
+        crv_data["generator"] = VesicaCurveMaker.bl_idname
         # If a curve is 2D, then transforms cannot be applied.
         crv_data.dimensions = "3D"
 
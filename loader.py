@@ -0,0 +1,212 @@
+import bpy # type: ignore
+import importlib
+from bpy.props import StringProperty # type: ignore
+
+from . import ANIMATED, SHAPES
+
+# Modules which have been imported and registered, by path.
+loader_state = {
+    "modules": {},
+}
+
+SECTION_NOUNS = {
+    "CURVE": "curve",
+    "MESH": "mesh",
+}
+
+
+def find_entry(idname):
+    for entry in SHAPES:
+        if entry[2] == idname:
+            return entry
+    return None
+
+
+def load_module(path):
+    # Imports a module and registers its operators, as well as its frame
+    # change handler if it has one. Its menu entries are not added, as
+    # the package's own menus list every shape.
+    module = loader_state["modules"].get(path)
+    if module is not None:
+        return module
+
+    module = importlib.import_module("." + path, __package__)
+    for entry in SHAPES:
+        if entry[0] == path:
+            bpy.utils.register_class(getattr(module, entry[1]))
+
+    handler = getattr(module, "frame_change_post", None)
+    if handler is not None:
+        bpy.app.handlers.frame_change_post.append(handler)
+
+    loader_state["modules"][path] = module
+    return module
+
+
+def unload_modules():
+    for path, module in loader_state["modules"].items():
+        handler = getattr(module, "frame_change_post", None)
+        if handler is not None and handler in bpy.app.handlers.frame_change_post:
+            bpy.app.handlers.frame_change_post.remove(handler)
+
+        for entry in reversed(SHAPES):
+            if entry[0] == path:
+                bpy.utils.unregister_class(getattr(module, entry[1]))
+
+        # Modules may hold resources beyond their operators, such as
+        # the worker processes of shape batches.
+        shutdown = getattr(module, "shutdown", None)
+        if shutdown is not None:
+            shutdown()
+
+    loader_state["modules"].clear()
+
+
+@bpy.app.handlers.persistent
+def load_post(*args):
+    # Animated objects are updated by their module's handler, so the
+    # module must be loaded before the first frame change, not when its
+    # operator is next used.
+    remaining = set(ANIMATED)
+    for obj in bpy.data.objects:
+        if not remaining:
+            break
+        generator = obj.get("generator")
+        if generator in remaining:
+            remaining.discard(generator)
+            load_module(find_entry(generator)[0])
+
+    # Returning None also stops the timer used when the package is
+    # enabled in an open file.
+    return None
+
+
+class ShapeLoader(bpy.types.Operator):
+    """Loads a shape's module the first time it is used, then runs its operator"""
+
+    bl_idname = "wm.shape_loader"
+    bl_label = "Load Shape"
+    bl_options = {"INTERNAL"}
+
+    target: StringProperty(
+        name="Target",
+        description="Operator to load and run",
+        options={"HIDDEN", "SKIP_SAVE"}) # type: ignore
+
+    @classmethod
+    def description(cls, context, properties):
+        entry = find_entry(properties.target)
+        if entry is None:
+            return cls.__doc__
+        if entry[5] not in SECTION_NOUNS:
+            return entry[3]
+        name = entry[3].lower()
+        article = "an" if name[:1] in "aeiou" else "a"
+        return "Creates {} {} {}".format(
+            article, name, SECTION_NOUNS[entry[5]])
+
+    def run(self, context, call):
+        entry = find_entry(self.target)
+        if entry is None:
+            self.report({"ERROR"}, "Unknown shape {!r}".format(self.target))
+            return {"CANCELLED"}
+
+        load_module(entry[0])
+
+        # The first use of a shape runs through this operator. Later uses
+        # run the shape's operator directly, as the menus then list it.
+        category, name = self.target.split(".", 1)
+        operator = getattr(getattr(bpy.ops, category), name)
+        try:
+            result = operator(call)
+        except RuntimeError as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+
+        if "CANCELLED" in result:
+            return {"CANCELLED"}
+        return {"FINISHED"}
+
+    def execute(self, context):
+        return self.run(context, "EXEC_DEFAULT")
+
+    def invoke(self, context, event):
+        return self.run(context, "INVOKE_DEFAULT")
+
+
+def draw_entry(layout, entry):
+    if entry[0] in loader_state["modules"]:
+        layout.operator(entry[2], text=entry[3], icon=entry[4])
+    else:
+        props = layout.operator(
+            ShapeLoader.bl_idname, text=entry[3], icon=entry[4])
+        props.target = entry[2]
+
+
+class VIEW3D_MT_shapes_add(bpy.types.Menu):
+    """Lists every shape the package can create"""
+
+    bl_idname = "VIEW3D_MT_shapes_add"
+    bl_label = "Shapes"
+
+    def draw(self, context):
+        layout = self.layout
+        layout.operator_context = "INVOKE_REGION_WIN"
+
+        row = layout.row()
+        curve_col = row.column()
+        curve_col.label(text="Curves")
+        mesh_col = row.column()
+        mesh_col.label(text="Meshes")
+
+        for entry in SHAPES:
+            if entry[5] == "CURVE":
+                draw_entry(curve_col, entry)
+            elif entry[5] == "MESH":
+                draw_entry(mesh_col, entry)
+
+        mesh_col.separator()
+        for entry in SHAPES:
+            if entry[5] == "BATCH":
+                draw_entry(mesh_col, entry)
+
+
+def menu_func(self, context):
+    self.layout.menu(VIEW3D_MT_shapes_add.bl_idname, icon="OUTLINER_OB_CURVE")
+
+
+def menu_func_import(self, context):
+    for entry in SHAPES:
+        if entry[5] == "IMPORT":
+            draw_entry(self.layout, entry)
+
+
+def menu_func_cleanup(self, context):
+    for entry in SHAPES:
+        if entry[5] == "CLEANUP":
+            draw_entry(self.layout, entry)
+
+
+def register():
+    bpy.utils.register_class(ShapeLoader)
+    bpy.utils.register_class(VIEW3D_MT_shapes_add)
+    bpy.types.VIEW3D_MT_add.append(menu_func)
+    bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
+    bpy.types.TOPBAR_MT_file_cleanup.append(menu_func_cleanup)
+    bpy.app.handlers.load_post.append(load_post)
+
+    # If the package is enabled in an open file, that file is checked
+    # for animated objects once Blender is idle.
+    bpy.app.timers.register(load_post, first_interval=0.0)
+
+
+def unregister():
+    if bpy.app.timers.is_registered(load_post):
+        bpy.app.timers.unregister(load_post)
+    bpy.app.handlers.load_post.remove(load_post)
+    bpy.types.TOPBAR_MT_file_cleanup.remove(menu_func_cleanup)
+    bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
+    bpy.types.VIEW3D_MT_add.remove(menu_func)
+    unload_modules()
+    bpy.utils.unregister_class(VIEW3D_MT_shapes_add)
+    bpy.utils.unregister_class(ShapeLoader)
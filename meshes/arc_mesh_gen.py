@@ -1,8 +1,9 @@
 import bpy # type: ignore
 import bmesh # type: ignore
+import functools
 import math
-from mathutils import Matrix # type: ignore
 from bpy.props import ( # type: ignore
+    BoolProperty,
     EnumProperty,
     FloatProperty,
     FloatVectorProperty,
@@ -31,11 +32,30 @@ class ArcMeshMaker(bpy.types.Operator):
             ("CHORD", "Chord", "Chord", 1),
             ("PIE", "Pie", "Pie", 2),
             ("SECTOR", "Sector", "Sector", 3),
-            ("STROKE", "Stroke", "Stroke", 4)],
+            ("STROKE", "Stroke", "Stroke", 4),
+            ("CHORD_TRIS", "Chord Tris", "Chord filled with triangles", 5),
+            ("RIBBON", "Ribbon", "Stroke with a constant width", 6)],
         name="Arc Type",
         default="PIE",
         description="Arc type to create") # type: ignore
 
+    stroke_width: FloatProperty(
+        name="Width",
+        description="Ribbon width",
+        min=0.0001,
+        soft_max=1.0,
+        step=1,
+        precision=3,
+        default=0.05) # type: ignore
+
+    join_type: EnumProperty(
+        items=[
+            ("MITER", "Miter", "Extend the sides of a ribbon to a point", 1),
+            ("ROUND", "Round", "Round the outer corners of a ribbon", 2)],
+        name="Join",
+        default="MITER",
+        description="How to join the sides of a ribbon at a corner") # type: ignore
+
     sectors: IntProperty(
         name="Vertices",
         description="Number of points on a whole circle",
@@ -88,6 +108,11 @@ class ArcMeshMaker(bpy.types.Operator):
         size=2,
         subtype="TRANSLATION") # type: ignore
 
+    animate: BoolProperty(
+        name="Animate",
+        description="Store parameters on the object so they can be keyframed",
+        default=False) # type: ignore
+
     @staticmethod
     def mesh_data_to_bmesh(
             vs, vts, vns,
@@ -136,14 +161,244 @@ class ArcMeshMaker(bpy.types.Operator):
 
         return bm
 
-    def execute(self, context):
-        sectors_per_circle = max(3, self.sectors)
-        radius = max(0.000001, self.radius)
-        r_scalar = min(1.0 - 0.000001, max(0.000001, self.r_scalar))
-        start_angle = self.start_angle
-        stop_angle = self.stop_angle
-        arc_type = self.arc_type
-        origin = self.origin
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def face_indices(arc_type, sectors):
+        # Face indices depend only on the arc type and vertex count.
+        fs = []
+        if arc_type == "CHORD":
+            f = [0] * sectors
+            k = 0
+            while k < sectors:
+                f[k] = k
+                k = k + 1
+            fs = [tuple(f)]
+
+        elif arc_type == "CHORD_TRIS":
+            # A chord is convex, so it can be zigzagged from both ends
+            # of the arc toward the middle without a central vertex.
+            len_fs = sectors - 2
+            fs = [(0, 0, 0)] * len_fs
+            lo = 0
+            hi = sectors - 1
+            k = 0
+            while k < len_fs:
+                if k % 2 == 0:
+                    fs[k] = (lo, lo + 1, hi)
+                    lo = lo + 1
+                else:
+                    fs[k] = (lo, hi - 1, hi)
+                    hi = hi - 1
+                k = k + 1
+
+        elif arc_type == "PIE":
+            # Construct a triangle fan.
+            len_fs = sectors - 1
+            fs = [(0, 0, 0)] * len_fs
+            k = 0
+            while k < len_fs:
+                fs[k] = (0, k + 1, k + 2)
+                k = k + 1
+
+        elif arc_type == "SECTOR":
+            # Construct quads.
+            len_fs = sectors - 1
+            sec_arc_2 = sectors * 2
+            fs = [(0, 0, 0, 0)] * len_fs
+            k = 0
+            while k < len_fs:
+                fs[k] = (
+                    k,
+                    k + 1,
+                    sec_arc_2 - k - 2,
+                    sec_arc_2 - k - 1)
+                k = k + 1
+
+        elif arc_type == "CIRCLE":
+            # Construct a closed triangle fan.
+            fs = [(0, 0, 0)] * sectors
+            k = 0
+            while k < sectors:
+                fs[k] = (0, 1 + k, 1 + (k + 1) % sectors)
+                k = k + 1
+
+        elif arc_type == "ANNULUS":
+            # Construct quads around a closed ring.
+            fs = [(0, 0, 0, 0)] * sectors
+            k = 0
+            while k < sectors:
+                fs[k] = (
+                    k % sectors,
+                    (k + 1) % sectors,
+                    sectors + (-k - 2) % sectors,
+                    sectors + (-k - 1) % sectors)
+                k = k + 1
+
+        return tuple(fs)
+
+    @staticmethod
+    def calc_ribbon(
+            vs, vts, is_closed, width, join_type,
+            uv_scale, uv_cosa=1.0, uv_sina=0.0):
+        # Offsets the outline by half the width to either side. Each
+        # join has one vertex on its inner side and one or more on its
+        # outer side. Miters longer than four half widths are beveled,
+        # as in SVG. Texture coordinates are offset from those of the
+        # outline, so the ribbon keeps the shape's planar projection.
+        len_vs = len(vs)
+        half_width = max(0.000001, width * 0.5)
+        miter_limit = 4.0
+        round_step = math.pi / 12.0
+
+        # Find the unit direction of the edge leaving each vertex. An
+        # open outline's last vertex reuses the direction of its last
+        # edge, so its ends are cut square.
+        len_edges = len_vs
+        if not is_closed:
+            len_edges = len_vs - 1
+        dirs = [(1.0, 0.0)] * len_vs
+        i = 0
+        while i < len_edges:
+            v_curr = vs[i]
+            v_next = vs[(i + 1) % len_vs]
+            dx = v_next[0] - v_curr[0]
+            dy = v_next[1] - v_curr[1]
+            mag = math.sqrt(dx * dx + dy * dy)
+            if mag > 0.000001:
+                dirs[i] = (dx / mag, dy / mag)
+            i = i + 1
+        if not is_closed and len_vs > 1:
+            dirs[len_vs - 1] = dirs[len_vs - 2]
+
+        rvs = []
+        rvts = []
+        rights = [None] * len_vs
+        lefts = [None] * len_vs
+        fs = []
+
+        i = 0
+        while i < len_vs:
+            v = vs[i]
+            d1 = dirs[i]
+            d0 = dirs[(i - 1) % len_vs]
+            if not is_closed and i == 0:
+                d0 = d1
+
+            # Normals point to the left of each edge.
+            n0 = (-d0[1], d0[0])
+            n1 = (-d1[1], d1[0])
+            cross = d0[0] * d1[1] - d0[1] * d1[0]
+            dot = d0[0] * d1[0] + d0[1] * d1[1]
+
+            # The miter bisects the two normals. Its length is the half
+            # width over the cosine of half the turn.
+            mx = n0[0] + n1[0]
+            my = n0[1] + n1[1]
+            m_mag = math.sqrt(mx * mx + my * my)
+            cos_half = 0.0
+            if m_mag > 0.000001:
+                mx = mx / m_mag
+                my = my / m_mag
+                cos_half = mx * n0[0] + my * n0[1]
+
+            # For a left turn, the right side is outer.
+            side = 1.0
+            if cross < 0.0:
+                side = -1.0
+
+            # Shallow turns are mitered whatever the join type, since a
+            # rounded join would be indistinguishable.
+            angle = math.atan2(abs(cross), dot)
+            offsets = []
+            if cos_half * miter_limit >= 1.0 \
+                and (join_type == "MITER"
+                    or angle <= round_step + 0.000001):
+                miter_len = half_width / cos_half
+                offsets.append((-side * mx * miter_len,
+                                -side * my * miter_len))
+            elif join_type == "ROUND":
+                # A turn of a whole number of steps is not given an
+                # extra step by rounding error.
+                count = max(1, math.ceil(angle / round_step - 0.000001))
+                to_angle = side * angle / count
+                k = 0
+                while k < count + 1:
+                    a = k * to_angle
+                    cosa = math.cos(a)
+                    sina = math.sin(a)
+                    offsets.append((
+                        -side * half_width * (cosa * n0[0] - sina * n0[1]),
+                        -side * half_width * (cosa * n0[1] + sina * n0[0])))
+                    k = k + 1
+            else:
+                offsets.append((-side * half_width * n0[0],
+                                -side * half_width * n0[1]))
+                offsets.append((-side * half_width * n1[0],
+                                -side * half_width * n1[1]))
+
+            inner = (side * half_width * n0[0],
+                     side * half_width * n0[1])
+            if cos_half > 0.000001:
+                inner_len = half_width / cos_half
+                inner = (side * mx * inner_len,
+                         side * my * inner_len)
+
+            start = len(rvs)
+            for offset in [inner] + offsets:
+                rvs.append((v[0] + offset[0], v[1] + offset[1], 0.0))
+                du = uv_cosa * offset[0] - uv_sina * offset[1]
+                dv = uv_cosa * offset[1] + uv_sina * offset[0]
+                rvts.append((
+                    vts[i][0] + uv_scale * du,
+                    vts[i][1] + uv_scale * dv))
+            len_offsets = len(offsets)
+            outer_indices = list(range(start + 1, start + 1 + len_offsets))
+
+            if side > 0.0:
+                lefts[i] = [start]
+                rights[i] = outer_indices
+            else:
+                lefts[i] = outer_indices
+                rights[i] = [start]
+
+            # Fill the join between the outer vertices with a fan from
+            # the inner vertex.
+            k = 0
+            while k < len_offsets - 1:
+                if side > 0.0:
+                    fs.append((
+                        start,
+                        outer_indices[k],
+                        outer_indices[k + 1]))
+                else:
+                    fs.append((
+                        start,
+                        outer_indices[k + 1],
+                        outer_indices[k]))
+                k = k + 1
+
+            i = i + 1
+
+        i = 0
+        while i < len_edges:
+            j = (i + 1) % len_vs
+            fs.append((
+                rights[i][-1],
+                rights[j][0],
+                lefts[j][0],
+                lefts[i][-1]))
+            i = i + 1
+
+        return rvs, rvts, fs
+
+    @staticmethod
+    def calc_arc(
+            arc_type, sectors_per_circle, radius, r_scalar,
+            start_angle, stop_angle, origin,
+            stroke_width=0.05, join_type="MITER"):
+        sectors_per_circle = max(3, sectors_per_circle)
+        radius = max(0.000001, radius)
+        r_scalar = min(1.0 - 0.000001, max(0.000001, r_scalar))
 
         x_orig = origin[0]
         y_orig = origin[1]
@@ -155,19 +410,16 @@ class ArcMeshMaker(bpy.types.Operator):
 
         if arc_len < 0.00139 \
             or abs(math.tau - (stop_angle - start_angle)) < 0.00139:
-            mesh_data = bpy.data.meshes.new("Circle")
+
+            j_to_theta = math.tau / sectors_per_circle
 
             if arc_type == "SECTOR" \
                 and r_inner > 0.00001:
                 len_vs = sectors_per_circle * 2
-                len_fs = sectors_per_circle
 
                 vs = [(0.0, 0.0, 0.0)] * len_vs
                 vts = [(0.5, 0.5)] * len_vs
-                vns = [(0.0, 0.0, 1.0)] * len_vs
-                fs = [(0, 0, 0, 0)] * len_fs
 
-                j_to_theta = math.tau / sectors_per_circle
                 j = 0
                 while j < sectors_per_circle:
                         theta = start_angle + j * j_to_theta
@@ -186,46 +438,47 @@ class ArcMeshMaker(bpy.types.Operator):
                         vts[len_vs - j] = (0.5 * r_scalar * cos_theta + 0.5,
                            0.5 * r_scalar * sin_theta + 0.5)
 
-                k = 0
-                while k < len_fs:
-                    fs[k] = (
-                        k % sectors_per_circle,
-                        (k + 1) % sectors_per_circle,
-                        sectors_per_circle + (-k - 2) % sectors_per_circle,
-                        sectors_per_circle + (-k - 1) % sectors_per_circle)
-                    k = k + 1
+                fs = ArcMeshMaker.face_indices(
+                    "ANNULUS", sectors_per_circle)
 
-                bm = ArcMeshMaker.mesh_data_to_bmesh(
-                    vs, vts, vns,
-                    fs, fs, fs)
+                return vs, vts, fs, True
 
-                mesh_data = bpy.data.meshes.new(
-                    "Circle R {:.3f}".format(radius))
+            # A whole circle of any other type is filled with a
+            # triangle fan around a central vertex. A ribbon skips the
+            # central vertex and closes around the circle.
+            is_ribbon = arc_type == "RIBBON"
+            len_vs = sectors_per_circle + 1
+            if is_ribbon:
+                len_vs = sectors_per_circle
+            vs = [(x_orig, y_orig, 0.0)] * len_vs
+            vts = [(0.5, 0.5)] * len_vs
 
-                bm.to_mesh(mesh_data)
-                bm.free()
-            else:
-                bm = bmesh.new()
-                bmesh.ops.create_circle(
-                    bm,
-                    # TODO: Set these appropriately per stroke type?
-                    cap_ends = True,
-                    cap_tris = True,
-                    matrix = Matrix.Rotation(start_angle, 4, 'Z'),
-                    radius = radius,
-                    segments = sectors_per_circle,
-                    calc_uvs = True)
-                bm.to_mesh(mesh_data)
-                bm.free()
-
-            mesh_data['radius'] = radius
-            mesh_data['origin'] = origin
-
-            mesh_obj = bpy.data.objects.new(mesh_data.name, mesh_data)
-            mesh_obj.location = context.scene.cursor.location
-            context.collection.objects.link(mesh_obj)
-
-            return {"FINISHED"}
+            j = 0
+            while j < sectors_per_circle:
+                theta = start_angle + j * j_to_theta
+                cos_theta = math.cos(theta)
+                sin_theta = math.sin(theta)
+
+                k = j
+                if not is_ribbon:
+                    k = 1 + j
+                vs[k] = (x_orig + radius * cos_theta,
+                    y_orig + radius * sin_theta, 0.0)
+                vts[k] = (0.5 * cos_theta + 0.5,
+                    0.5 * sin_theta + 0.5)
+
+                j = j + 1
+
+            if is_ribbon:
+                vs, vts, fs = ArcMeshMaker.calc_ribbon(
+                    vs, vts, True, stroke_width, join_type,
+                    0.5 / radius)
+                return vs, vts, fs, True
+
+            fs = ArcMeshMaker.face_indices(
+                "CIRCLE", sectors_per_circle)
+
+            return vs, vts, fs, True
 
         # Find points on arc without translation.
         fudge = 0
@@ -246,32 +499,21 @@ class ArcMeshMaker(bpy.types.Operator):
             arc_points[i] = (math.cos(angle), math.sin(angle))
             i = i + 1
 
-        # Determine length of faces and vertices.
-        len_fs = 0
-        fs = []
+        # Determine length of vertices. Faces are looked up from the
+        # topology cache.
+        fs = ArcMeshMaker.face_indices(arc_type, sectors_per_arc)
         len_vs = sectors_per_arc
-        if arc_type == "CHORD":
-
-            len_fs = 1
-            fs = [tuple([0] * sectors_per_arc)]
-
-        elif arc_type == "PIE":
-
+        if arc_type == "PIE":
             len_vs = sectors_per_arc + 1
-            len_fs = sectors_per_arc - 1
-            fs = [(0, 0, 0)] * len_fs
-
         elif arc_type == "SECTOR":
-
             len_vs = sectors_per_arc * 2
-            len_fs = sectors_per_arc - 1
-            fs = [(0, 0, 0, 0)] * len_fs
 
         vs = [(0.0, 0.0, 0.0)] * len_vs
         vts = [(0.5, 0.5)] * len_vs
-        vns = [(0.0, 0.0, 1.0)] * len_vs
 
-        if arc_type == "CHORD":
+        if arc_type == "CHORD" \
+            or arc_type == "CHORD_TRIS" \
+            or arc_type == "RIBBON":
 
             j = 0
             while j < sectors_per_arc:
@@ -282,14 +524,6 @@ class ArcMeshMaker(bpy.types.Operator):
                           point[1] * 0.5 + 0.5)
                 j = j + 1
 
-            # Construct an n-gon face.
-            k = 0
-            f = [0] * sectors_per_arc
-            while k < sectors_per_arc:
-                f[k] = k
-                k = k + 1
-            fs[0] = tuple(f) # type: ignore
-
         elif arc_type == "PIE":
 
             vs[0] = (x_orig, y_orig, 0.0)
@@ -303,12 +537,6 @@ class ArcMeshMaker(bpy.types.Operator):
                               0.5 * point[1] + 0.5)
                 j = j + 1
 
-            # Construct a triangle fan.
-            k = 0
-            while k < len_fs:
-                fs[k] = (0, k + 1, k + 2) # type: ignore
-                k = k + 1
-
         elif arc_type == "SECTOR":
 
             j = 0
@@ -328,17 +556,6 @@ class ArcMeshMaker(bpy.types.Operator):
                 vts[len_vs - j] = (0.5 * r_scalar * point[0] + 0.5,
                            0.5 * r_scalar * point[1] + 0.5)
 
-            # Construct quads.
-            sec_arc_2 = sectors_per_arc * 2
-            k = 0
-            while k < len_fs:
-                fs[k] = ( # type: ignore
-                    k,
-                    k + 1,
-                    sec_arc_2 - k - 2,
-                    sec_arc_2 - k - 1)
-                k = k + 1
-
         else:
 
             # Default to a stroke.
@@ -349,18 +566,91 @@ class ArcMeshMaker(bpy.types.Operator):
                          y_orig + radius * point[1], 0.0)
                 j = j + 1
 
+        if arc_type == "RIBBON":
+            vs, vts, fs = ArcMeshMaker.calc_ribbon(
+                vs, vts, False, stroke_width, join_type,
+                0.5 / radius)
+
+        return vs, vts, fs, False
+
+    @staticmethod
+    def update_object(obj):
+        # Rewrites the coordinates of an animated arc in place from the
+        # parameters stored on its object. The mesh is only rebuilt if
+        # the vertex count has changed, e.g. as the arc grows.
+        mesh_data = obj.data
+        vs, vts, fs, is_circle = ArcMeshMaker.calc_arc(
+            obj.get("arc_type", "PIE"),
+            obj.get("sectors", 32),
+            obj.get("radius", 0.5),
+            obj.get("r_scalar", 2.0 / 3.0),
+            obj.get("start_angle", 0.0),
+            obj.get("stop_angle", math.pi * 0.5),
+            obj.get("origin", (0.0, 0.0)),
+            obj.get("stroke_width", 0.05),
+            obj.get("join_type", "MITER"))
+        len_vs = len(vs)
+
+        if len_vs != len(mesh_data.vertices) \
+            or len(fs) != len(mesh_data.polygons):
+            vns = [(0.0, 0.0, 1.0)] * len_vs
+            bm = ArcMeshMaker.mesh_data_to_bmesh(
+                vs, vts, vns,
+                fs, fs, fs)
+            bm.to_mesh(mesh_data)
+            bm.free()
+            return
+
+        mesh_data.vertices.foreach_set(
+            "co", [c for v in vs for c in v])
+
+        uv_layer = mesh_data.uv_layers.active
+        len_loops = len(mesh_data.loops)
+        if uv_layer is not None and len_loops > 0:
+            loop_vs = [0] * len_loops
+            mesh_data.loops.foreach_get("vertex_index", loop_vs)
+            uv_layer.data.foreach_set(
+                "uv", [c for h in loop_vs for c in vts[h]])
+
+        mesh_data.update()
+
+    def execute(self, context):
+        sectors_per_circle = max(3, self.sectors)
+        radius = max(0.000001, self.radius)
+        r_scalar = min(1.0 - 0.000001, max(0.000001, self.r_scalar))
+        start_angle = self.start_angle
+        stop_angle = self.stop_angle
+        arc_type = self.arc_type
+        origin = self.origin
+        stroke_width = self.stroke_width
+        join_type = self.join_type
+
+        vs, vts, fs, is_circle = ArcMeshMaker.calc_arc(
+            arc_type, sectors_per_circle, radius, r_scalar,
+            start_angle, stop_angle, origin,
+            stroke_width, join_type)
+        vns = [(0.0, 0.0, 1.0)] * len(vs)
+
         bm = ArcMeshMaker.mesh_data_to_bmesh(
             vs, vts, vns,
             fs, fs, fs)
 
-        mesh_data = bpy.data.meshes.new(
-            "Arc From {:.0f} To {:.0f} R {:.3f}".format(
-                math.degrees(start_angle) % 360,
-                math.degrees(stop_angle) % 360,
-                radius))
+        if is_circle:
+            mesh_name = "Circle"
+            if arc_type == "SECTOR":
+                mesh_name = "Circle R {:.3f}".format(radius)
+            mesh_data = bpy.data.meshes.new(mesh_name)
+        else:
+            mesh_data = bpy.data.meshes.new(
+                "Arc From {:.0f} To {:.0f} R {:.3f}".format(
+                    math.degrees(start_angle) % 360,
+                    math.degrees(stop_angle) % 360,
+                    radius))
+
+            mesh_data['start_angle'] = start_angle % math.tau
+            mesh_data['stop_angle'] = stop_angle % math.tau
 
-        mesh_data['start_angle'] = start_angle % math.tau
-        mesh_data['stop_angle'] = stop_angle % math.tau
+        mesh_data["generator"] = ArcMeshMaker.bl_idname
         mesh_data['radius'] = radius
         mesh_data['origin'] = origin
 
@@ -371,6 +661,20 @@ class ArcMeshMaker(bpy.types.Operator):
         mesh_obj.location = context.scene.cursor.location
         context.collection.objects.link(mesh_obj)
 
+        if self.animate:
+            # Custom properties on the object can be keyframed. The frame
+            # change handler reads them back to rewrite coordinates.
+            mesh_obj["generator"] = ArcMeshMaker.bl_idname
+            mesh_obj["arc_type"] = arc_type
+            mesh_obj["sectors"] = sectors_per_circle
+            mesh_obj["radius"] = radius
+            mesh_obj["r_scalar"] = r_scalar
+            mesh_obj["start_angle"] = start_angle
+            mesh_obj["stop_angle"] = stop_angle
+            mesh_obj["origin"] = (origin[0], origin[1])
+            mesh_obj["stroke_width"] = stroke_width
+            mesh_obj["join_type"] = join_type
+
         return {"FINISHED"}
 
     @classmethod
@@ -378,6 +682,14 @@ class ArcMeshMaker(bpy.types.Operator):
         return context.area.type == "VIEW_3D"
 
 
+@bpy.app.handlers.persistent
+def frame_change_post(scene, depsgraph=None):
+    for obj in scene.objects:
+        if obj.get("generator") == ArcMeshMaker.bl_idname \
+            and obj.type == "MESH":
+            ArcMeshMaker.update_object(obj)
+
+
 def menu_func(self, context):
     self.layout.operator(ArcMeshMaker.bl_idname, icon="MESH_DATA")
 
@@ -385,8 +697,10 @@ def menu_func(self, context):
 def register():
     bpy.utils.register_class(ArcMeshMaker)
     bpy.types.VIEW3D_MT_mesh_add.append(menu_func)
+    bpy.app.handlers.frame_change_post.append(frame_change_post)
 
 
 def unregister():
     bpy.utils.unregister_class(ArcMeshMaker)
-    bpy.types.VIEW3D_MT_mesh_add.remove(menu_func)
\ No newline at end of file
+    bpy.types.VIEW3D_MT_mesh_add.remove(menu_func)
+    bpy.app.handlers.frame_change_post.remove(frame_change_post)
\ No newline at end of file
@@ -0,0 +1,431 @@
+import bpy # type: ignore
+import math
+from bpy.props import ( # type: ignore
+    EnumProperty,
+    FloatProperty,
+    FloatVectorProperty,
+    IntProperty)
+
+bl_info = {
+    "name": "Create Arcade Mesh",
+    "author": "Jeremy Behreandt",
+    "version": (0, 1),
+    "blender": (4, 5, 2),
+    "category": "Add Mesh",
+    "description": "Creates a mesh row of arches which share their springers.",
+    "tracker_url": "https://github.com/behreajj/blendergeom"
+}
+
+
+class ArcadeMeshMaker(bpy.types.Operator):
+    """Creates a mesh row of arches which share their springers"""
+
+    bl_idname = "mesh.primitive_arcade_add"
+    bl_label = "Arcade"
+    bl_options = {"REGISTER", "UNDO"}
+
+    arch_type: EnumProperty(
+        items=[
+            ("LANCET", "Lancet", "Lancet arch", 1),
+            ("TUDOR", "Tudor", "Tudor arch", 2),
+            ("OGEE", "Ogee", "Ogee arch, using 60 degree arcs", 3)],
+        name="Arch",
+        default="LANCET",
+        description="Type of arch") # type: ignore
+
+    path: EnumProperty(
+        items=[
+            ("LINE", "Line", "Place a number of arches in a row", 1),
+            ("CURVE", "Active Curve", "Stand as many arches as fit along the active curve, read as a floor plan", 2)],
+        name="Path",
+        default="LINE",
+        description="Where to place the arches") # type: ignore
+
+    count: IntProperty(
+        name="Count",
+        description="Number of arches in a row",
+        min=1,
+        soft_max=100,
+        default=5) # type: ignore
+
+    sectors: IntProperty(
+        name="Vertices",
+        description="Number of points in half an arch",
+        min=2,
+        soft_max=250,
+        default=12) # type: ignore
+
+    sharpness: FloatProperty(
+        name="Sharpness",
+        description="Lancet arch sharpness, where 0 is equilateral and 1 is lancet",
+        default=1.0,
+        step=1,
+        precision=3,
+        min=0.0,
+        max=1.0,
+        subtype="FACTOR") # type: ignore
+
+    radius: FloatProperty(
+        name="Radius",
+        description="Arch radius",
+        min=0.0001,
+        soft_max=100.0,
+        step=1,
+        precision=3,
+        default=0.5) # type: ignore
+
+    arch_weight: FloatProperty(
+        name="Extrude",
+        description="Arch extrusion weight",
+        default=0.25,
+        step=1,
+        precision=3,
+        min=0.0,
+        max=1.0,
+        subtype="FACTOR") # type: ignore
+
+    arch_offset: FloatProperty(
+        name="Offset",
+        description="Arch weight offset",
+        default=1.0,
+        step=1,
+        precision=3,
+        min=-1.0,
+        max=1.0,
+        subtype="FACTOR") # type: ignore
+
+    origin: FloatVectorProperty(
+        name="Origin",
+        description="Arcade origin",
+        default=(0.0, 0.0),
+        step=1,
+        precision=3,
+        size=2,
+        subtype="TRANSLATION") # type: ignore
+
+    face_type: EnumProperty(
+        items=[
+            ("NGON", "NGon", "Fill each arch with an ngon", 1),
+            ("QUADS", "Quads", "Fill with quads", 2)],
+        name="Face Type",
+        default="QUADS",
+        description="How to fill the mesh") # type: ignore
+
+    @staticmethod
+    def calc_profile(arch_type, sectors, sharpness):
+        # Returns an arch's center line at unit radius, from the right
+        # springer at (1, 0), over the top, to the left at (-1, 0). The
+        # right half is a chain of circular arcs, given by center, radius
+        # and start and stop angle. The left half is its mirror.
+        arcs = []
+        if arch_type == "TUDOR":
+            arcs = [
+                ((0.5, 0.0), 0.5, 0.0, 0.9272952180016122),
+                ((-1.0, -2.0), 3.0, 0.9272952180016122, 1.2309594173407747)]
+        elif arch_type == "OGEE":
+            # The second arc curves the other way, so its angle falls.
+            arcs = [
+                ((0.0, 0.0), 1.0, 0.0, math.pi / 3.0),
+                ((1.0, 1.7320508075688772), 1.0, math.pi * 4.0 / 3.0, math.pi)]
+        else:
+            # The arc's center is offset so that the springer is at 1
+            # and the two arcs meet above the origin.
+            sharpness = min(max(sharpness, 0.0), 1.0)
+            arc_radius = (1.0 - sharpness) * 2.0 + sharpness * 4.0
+            arc_x_offset = (1.0 - sharpness) * 1.0 + sharpness * 3.0
+            arcs = [
+                ((-arc_x_offset, 0.0), arc_radius,
+                    0.0, math.acos(arc_x_offset / arc_radius))]
+
+        # Points are shared among arcs by their length.
+        total_len = 0.0
+        for arc in arcs:
+            total_len = total_len + arc[1] * abs(arc[3] - arc[2])
+
+        right = [(1.0, 0.0)]
+        len_arcs = len(arcs)
+        i = 0
+        while i < len_arcs:
+            center, r, angle_orig, angle_dest = arcs[i]
+            seg_count = max(1, round(
+                sectors * r * abs(angle_dest - angle_orig) / total_len))
+            if i == len_arcs - 1:
+                seg_count = max(1, sectors - len(right) + 1)
+
+            j = 1
+            while j <= seg_count:
+                t = j / seg_count
+                angle = (1.0 - t) * angle_orig + t * angle_dest
+                right.append((
+                    center[0] + r * math.cos(angle),
+                    center[1] + r * math.sin(angle)))
+                j = j + 1
+            i = i + 1
+
+        # The apex is on the y axis, whatever the rounding error.
+        right[-1] = (0.0, right[-1][1])
+        left = [(-p[0], p[1]) for p in reversed(right[:-1])]
+        return right + left
+
+    @staticmethod
+    def sample_spline(spline, res):
+        # Returns a spline's points, with Bezier segments divided evenly
+        # by their parameter.
+        points = []
+        if spline.type == "BEZIER":
+            knots = spline.bezier_points
+            len_knots = len(knots)
+            seg_count = len_knots
+            if not spline.use_cyclic_u:
+                seg_count = len_knots - 1
+
+            points.append(tuple(knots[0].co))
+            i = 0
+            while i < seg_count:
+                k0 = knots[i]
+                k1 = knots[(i + 1) % len_knots]
+                p0 = k0.co
+                p1 = k0.handle_right
+                p2 = k1.handle_left
+                p3 = k1.co
+                j = 1
+                while j <= res:
+                    t = j / res
+                    u = 1.0 - t
+                    a = u * u * u
+                    b = 3.0 * u * u * t
+                    c = 3.0 * u * t * t
+                    d = t * t * t
+                    points.append((
+                        a * p0[0] + b * p1[0] + c * p2[0] + d * p3[0],
+                        a * p0[1] + b * p1[1] + c * p2[1] + d * p3[1],
+                        a * p0[2] + b * p1[2] + c * p2[2] + d * p3[2]))
+                    j = j + 1
+                i = i + 1
+        else:
+            for point in spline.points:
+                points.append((point.co[0], point.co[1], point.co[2]))
+            if spline.use_cyclic_u and points:
+                points.append(points[0])
+        return points
+
+    @staticmethod
+    def chord_points(points, chord_len):
+        # Walks a polyline, returning points which are each a chord's
+        # length from the last. Each new point is where a circle around
+        # the last leaves the polyline.
+        if not points:
+            return []
+
+        result = [points[0]]
+        c = points[0]
+        len_points = len(points)
+        s = 0
+        t_min = 0.0
+        len_sq = chord_len * chord_len
+        while s < len_points - 1:
+            a = points[s]
+            b = points[s + 1]
+            d = (b[0] - a[0], b[1] - a[1], b[2] - a[2])
+            f = (a[0] - c[0], a[1] - c[1], a[2] - c[2])
+            dd = d[0] * d[0] + d[1] * d[1] + d[2] * d[2]
+            fd = f[0] * d[0] + f[1] * d[1] + f[2] * d[2]
+            ff = f[0] * f[0] + f[1] * f[1] + f[2] * f[2]
+            disc = fd * fd - dd * (ff - len_sq)
+            if dd > 0.0 and disc >= 0.0:
+                t = (-fd + math.sqrt(disc)) / dd
+                if t >= t_min and t <= 1.0:
+                    c = (a[0] + t * d[0], a[1] + t * d[1], a[2] + t * d[2])
+                    result.append(c)
+                    t_min = t
+                    continue
+            s = s + 1
+            t_min = 0.0
+        return result
+
+    def execute(self, context):
+        arch_type = self.arch_type
+        path = self.path
+        sectors = max(2, self.sectors)
+        radius_center = max(0.000001, self.radius)
+        arch_weight = min(max(self.arch_weight, 0.0), 1.0)
+        arch_offset = min(max(self.arch_offset, -1.0), 1.0)
+        origin = self.origin
+        face_type = self.face_type
+
+        radius_inner = radius_center
+        radius_outer = radius_center
+        if arch_weight > 0.0:
+            radius_inner_limit = radius_center \
+                - radius_center * arch_weight
+            radius_outer_limit = radius_center \
+                + radius_center * arch_weight
+
+            arch_offset_01 = arch_offset * 0.5 + 0.5
+            radius_inner = arch_offset_01 * radius_center \
+                + (1.0 - arch_offset_01) * radius_inner_limit
+            radius_outer = (1.0 - arch_offset_01) * radius_center \
+                + arch_offset_01 * radius_outer_limit
+        create_faces = arch_weight > 0.0 and radius_inner > 0.0
+
+        # Arches meet at their outer springers, so they are spaced by the
+        # outer diameter. Each arch has a frame: the midpoint between its
+        # springers, the direction from its left springer to its right,
+        # and up.
+        span = 2.0 * radius_outer
+        springers = []
+        up = (0.0, 1.0, 0.0)
+        src_obj = None
+        if path == "CURVE":
+            src_obj = context.active_object
+            if src_obj is None or src_obj.type != "CURVE" \
+                or len(src_obj.data.splines) < 1:
+                self.report({"ERROR"}, "Active Curve path needs an active curve object")
+                return {"CANCELLED"}
+
+            polyline = ArcadeMeshMaker.sample_spline(
+                src_obj.data.splines[0], 64)
+            springers = ArcadeMeshMaker.chord_points(polyline, span)
+            up = (0.0, 0.0, 1.0)
+        else:
+            count = max(1, self.count)
+            x_start = origin[0] - 0.5 * count * span
+            springers = [(x_start + k * span, origin[1], 0.0)
+                for k in range(count + 1)]
+
+        arch_count = len(springers) - 1
+        if arch_count < 1:
+            self.report({"WARNING"}, "The curve is too short for an arch")
+            return {"CANCELLED"}
+
+        # The profile is computed once. Every arch places the same local
+        # coordinates in its own frame.
+        profile = ArcadeMeshMaker.calc_profile(arch_type, sectors, self.sharpness)
+        len_profile = len(profile)
+        outer_local = [(p[0] * radius_outer, p[1] * radius_outer) for p in profile]
+        inner_local = [(p[0] * radius_inner, p[1] * radius_inner) for p in profile]
+        vt_scalar = radius_inner / radius_outer
+        outer_vts = [(p[0] * 0.5 + 0.5, p[1] * 0.5) for p in profile]
+        inner_vts = [(p[0] * vt_scalar * 0.5 + 0.5, p[1] * vt_scalar * 0.5)
+            for p in profile]
+
+        vs = []
+        fs = []
+        vts = []
+        edges = []
+        prev_right_outer = -1
+        k = 0
+        while k < arch_count:
+            p_left = springers[k]
+            p_right = springers[k + 1]
+            mid = (
+                0.5 * (p_left[0] + p_right[0]),
+                0.5 * (p_left[1] + p_right[1]),
+                0.5 * (p_left[2] + p_right[2]))
+            d = (
+                (p_right[0] - p_left[0]) / span,
+                (p_right[1] - p_left[1]) / span,
+                (p_right[2] - p_left[2]) / span)
+
+            # The left springer of this arch is the right springer of the
+            # last, so its vertex is reused, not placed again.
+            outer = [0] * len_profile
+            j = 0
+            while j < len_profile:
+                if j == len_profile - 1 and prev_right_outer >= 0:
+                    outer[j] = prev_right_outer
+                else:
+                    x, y = outer_local[j]
+                    outer[j] = len(vs)
+                    vs.append((
+                        mid[0] + x * d[0] + y * up[0],
+                        mid[1] + x * d[1] + y * up[1],
+                        mid[2] + x * d[2] + y * up[2]))
+                j = j + 1
+            prev_right_outer = outer[0]
+
+            if create_faces:
+                inner = [0] * len_profile
+                j = 0
+                while j < len_profile:
+                    x, y = inner_local[j]
+                    inner[j] = len(vs)
+                    vs.append((
+                        mid[0] + x * d[0] + y * up[0],
+                        mid[1] + x * d[1] + y * up[1],
+                        mid[2] + x * d[2] + y * up[2]))
+                    j = j + 1
+
+                if face_type == "QUADS":
+                    j = 0
+                    while j < len_profile - 1:
+                        fs.append((outer[j], outer[j + 1], inner[j + 1], inner[j]))
+                        vts.append((outer_vts[j], outer_vts[j + 1],
+                            inner_vts[j + 1], inner_vts[j]))
+                        j = j + 1
+                else:
+                    fs.append(tuple(outer) + tuple(reversed(inner)))
+                    vts.append(tuple(outer_vts) + tuple(reversed(inner_vts)))
+            else:
+                j = 0
+                while j < len_profile - 1:
+                    edges.append((outer[j], outer[j + 1]))
+                    j = j + 1
+            k = k + 1
+
+        mesh_data = bpy.data.meshes.new(arch_type.title() + " Arcade")
+        mesh_data["generator"] = ArcadeMeshMaker.bl_idname
+        mesh_data.vertices.add(len(vs))
+        mesh_data.vertices.foreach_set("co", [c for v in vs for c in v])
+
+        if create_faces:
+            loop_starts = [0] * len(fs)
+            loop_verts = []
+            j = 0
+            for f in fs:
+                loop_starts[j] = len(loop_verts)
+                loop_verts.extend(f)
+                j = j + 1
+
+            mesh_data.loops.add(len(loop_verts))
+            mesh_data.loops.foreach_set("vertex_index", loop_verts)
+            mesh_data.polygons.add(len(fs))
+            mesh_data.polygons.foreach_set("loop_start", loop_starts)
+
+            uv_layer = mesh_data.uv_layers.new()
+            uv_layer.data.foreach_set("uv", [c
+                for f_vts in vts
+                for vt in f_vts
+                for c in vt])
+        else:
+            mesh_data.edges.add(len(edges))
+            mesh_data.edges.foreach_set(
+                "vertices", [h for e in edges for h in e])
+        mesh_data.update(calc_edges=True)
+
+        mesh_obj = bpy.data.objects.new(mesh_data.name, mesh_data)
+        if src_obj is not None:
+            mesh_obj.matrix_world = src_obj.matrix_world
+        else:
+            mesh_obj.location = context.scene.cursor.location
+        context.collection.objects.link(mesh_obj)
+
+        return {"FINISHED"}
+
+    @classmethod
+    def poll(cls, context):
+        return context.area.type == "VIEW_3D"
+
+
+def menu_func(self, context):
+    self.layout.operator(ArcadeMeshMaker.bl_idname, icon="MESH_DATA")
+
+
+def register():
+    bpy.utils.register_class(ArcadeMeshMaker)
+    bpy.types.VIEW3D_MT_mesh_add.append(menu_func)
+
+
+def unregister():
+    bpy.utils.unregister_class(ArcadeMeshMaker)
+    bpy.types.VIEW3D_MT_mesh_add.remove(menu_func)
@@ -0,0 +1,502 @@
+import bpy # type: ignore
+import math
+from bpy.props import ( # type: ignore
+    EnumProperty,
+    FloatProperty,
+    FloatVectorProperty,
+    IntProperty)
+
+bl_info = {
+    "name": "Create Circle Arrangement Mesh",
+    "author": "Jeremy Behreandt",
+    "version": (0, 1),
+    "blender": (4, 5, 2),
+    "category": "Add Mesh",
+    "description": "Creates a mesh with one face per region of overlapping circles.",
+    "tracker_url": "https://github.com/behreajj/blendergeom"
+}
+
+
+class CircleArrangementMeshMaker(bpy.types.Operator):
+    """Creates a mesh with one face per region of overlapping circles"""
+
+    bl_idname = "mesh.primitive_circle_arrangement_add"
+    bl_label = "Circle Arrangement"
+    bl_options = {"REGISTER", "UNDO"}
+
+    pattern: EnumProperty(
+        items=[
+            ("SEED", "Seed of Life", "Circles on a hexagonal lattice, ring by ring", 1),
+            ("VESICA", "Vesica Piscis", "Two circles which pass through each other's center", 2),
+            ("FOIL", "Foil", "Circles around a center which all pass through it", 3)],
+        name="Pattern",
+        default="SEED",
+        description="Circles to arrange") # type: ignore
+
+    rings: IntProperty(
+        name="Rings",
+        description="Rings of circles around the central circle",
+        min=1,
+        soft_max=16,
+        default=1) # type: ignore
+
+    foil_count: IntProperty(
+        name="Foils",
+        description="Number of circles in a foil",
+        min=2,
+        max=32,
+        default=4) # type: ignore
+
+    sectors: IntProperty(
+        name="Vertices",
+        description="Number of points per circle",
+        min=3,
+        soft_max=500,
+        default=32,
+        step=1) # type: ignore
+
+    radius: FloatProperty(
+        name="Radius",
+        description="Circle radius",
+        min=0.0001,
+        soft_max=100.0,
+        step=1,
+        precision=3,
+        default=0.5) # type: ignore
+
+    offset_angle: FloatProperty(
+        name="Angle",
+        description="Offset angle",
+        soft_min=0.0,
+        soft_max=math.tau,
+        step=57.2958,
+        default=0.0,
+        subtype="ANGLE",
+        unit="ROTATION") # type: ignore
+
+    origin: FloatVectorProperty(
+        name="Origin",
+        description="Pattern origin",
+        default=(0.0, 0.0),
+        step=1,
+        precision=3,
+        size=2,
+        subtype="TRANSLATION") # type: ignore
+
+    @staticmethod
+    def circ_intersect_all(centers, radii, tolerance=0.00001):
+        # Finds every point where two circles of a set cross. Returns
+        # a list of points and a list of the index pairs which made
+        # them, one pair per point. Circles are hashed into a uniform
+        # grid by their bounds, so only circles which share a cell are
+        # compared.
+        #
+        # This is a copy of the method in curves/utils/circ_intersect.py,
+        # kept here so that each script can be installed on its own.
+        len_circs = len(radii)
+        points = []
+        pairs = []
+        if len_circs < 2:
+            return points, pairs
+
+        r_sum = 0.0
+        for r in radii:
+            r_sum = r_sum + r
+        cell_size = max(tolerance, 2.0 * r_sum / len_circs)
+        to_cell = 1.0 / cell_size
+
+        bounds = [None] * len_circs
+        grid = {}
+        i = 0
+        while i < len_circs:
+            x, y = centers[i][0], centers[i][1]
+            r = radii[i]
+            lbx = math.floor((x - r) * to_cell)
+            lby = math.floor((y - r) * to_cell)
+            ubx = math.floor((x + r) * to_cell)
+            uby = math.floor((y + r) * to_cell)
+            bounds[i] = (lbx, lby, ubx, uby)
+
+            cx = lbx
+            while cx <= ubx:
+                cy = lby
+                while cy <= uby:
+                    key = (cx, cy)
+                    cell = grid.get(key)
+                    if cell is None:
+                        grid[key] = [i]
+                    else:
+                        cell.append(i)
+                    cy = cy + 1
+                cx = cx + 1
+            i = i + 1
+
+        for (cx, cy), cell in grid.items():
+            len_cell = len(cell)
+            j = 0
+            while j < len_cell:
+                a = cell[j]
+                a_bounds = bounds[a]
+                k = j + 1
+                while k < len_cell:
+                    b = cell[k]
+                    b_bounds = bounds[b]
+                    k = k + 1
+
+                    # A pair which shares many cells is only tested in
+                    # the first cell of the overlap of their bounds.
+                    if cx != max(a_bounds[0], b_bounds[0]) \
+                        or cy != max(a_bounds[1], b_bounds[1]):
+                        continue
+
+                    ax, ay = centers[a][0], centers[a][1]
+                    bx, by = centers[b][0], centers[b][1]
+                    ra = radii[a]
+                    rb = radii[b]
+                    dx = bx - ax
+                    dy = by - ay
+                    dsq = dx * dx + dy * dy
+                    if dsq > (ra + rb) ** 2 \
+                        or dsq < (ra - rb) ** 2 \
+                        or dsq < tolerance * tolerance:
+                        continue
+
+                    d = math.sqrt(dsq)
+                    d_inv = 1.0 / d
+                    t = (ra * ra - rb * rb + dsq) * 0.5 * d_inv
+                    hsq = ra * ra - t * t
+                    h = 0.0
+                    if hsq > 0.0:
+                        h = math.sqrt(hsq)
+
+                    mx = ax + t * dx * d_inv
+                    my = ay + t * dy * d_inv
+                    ox = -dy * h * d_inv
+                    oy = dx * h * d_inv
+
+                    pair = (min(a, b), max(a, b))
+                    points.append((mx + ox, my + oy))
+                    pairs.append(pair)
+                    if h > tolerance:
+                        points.append((mx - ox, my - oy))
+                        pairs.append(pair)
+                j = j + 1
+
+        return points, pairs
+
+    @staticmethod
+    def weld(points, tolerance=0.00001):
+        # Returns an index into a list of unique points for each point.
+        # Where three or more circles meet, each pair finds the point
+        # on its own, with a slightly different rounding error.
+        to_cell = 1.0 / tolerance
+        grid = {}
+        uniques = []
+        indices = [0] * len(points)
+        tol_sq = tolerance * tolerance
+
+        i = 0
+        for p in points:
+            cx = math.floor(p[0] * to_cell)
+            cy = math.floor(p[1] * to_cell)
+            found = -1
+            nx = cx - 1
+            while found < 0 and nx <= cx + 1:
+                ny = cy - 1
+                while found < 0 and ny <= cy + 1:
+                    for h in grid.get((nx, ny), ()):
+                        q = uniques[h]
+                        if (p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2 <= tol_sq:
+                            found = h
+                            break
+                    ny = ny + 1
+                nx = nx + 1
+
+            if found < 0:
+                found = len(uniques)
+                uniques.append(p)
+                grid.setdefault((cx, cy), []).append(found)
+            indices[i] = found
+            i = i + 1
+
+        return uniques, indices
+
+    @staticmethod
+    def calc_arrangement(centers, radii, sectors, tolerance=0.00001):
+        # Builds the planar subdivision made by a set of circles. The
+        # crossings are vertices and the arcs between them are edges.
+        # Each arc is a pair of half edges, one for each direction. A
+        # face is traced by walking half edges, at each vertex turning
+        # onto the next edge clockwise from the one it came in on. This
+        # keeps the face on the left, so regions wind counter-clockwise
+        # and the outer boundary of a cluster winds clockwise.
+        #
+        # A cluster of circles which lies inside the region of another,
+        # without touching it, is not cut out of that region.
+        points, pairs = CircleArrangementMeshMaker.circ_intersect_all(
+            centers, radii, tolerance)
+        vs, indices = CircleArrangementMeshMaker.weld(points, tolerance)
+
+        len_circs = len(radii)
+        on_circle = [None] * len_circs
+        i = 0
+        while i < len_circs:
+            on_circle[i] = set()
+            i = i + 1
+        for pair, h in zip(pairs, indices):
+            on_circle[pair[0]].add(h)
+            on_circle[pair[1]].add(h)
+
+        fs = []
+        he_orig = []
+        he_samples = []
+        he_angle = []
+        outgoing = [None] * len(vs)
+        h = 0
+        while h < len(vs):
+            outgoing[h] = []
+            h = h + 1
+
+        # Chord directions are measured a short, equal distance along
+        # each arc, so that arcs which leave a vertex on the same tangent
+        # are told apart by how sharply they curve.
+        r_min = min(radii) if len_circs > 0 else 1.0
+        probe = 0.001 * r_min
+
+        i = 0
+        while i < len_circs:
+            cx, cy = centers[i][0], centers[i][1]
+            r = radii[i]
+            circ_vs = on_circle[i]
+
+            # A circle which crosses no other is a face of its own.
+            if not circ_vs:
+                start = len(vs)
+                j = 0
+                while j < sectors:
+                    theta = math.tau * j / sectors
+                    vs.append((cx + r * math.cos(theta),
+                        cy + r * math.sin(theta)))
+                    j = j + 1
+                fs.append(tuple(range(start, start + sectors)))
+                i = i + 1
+                continue
+
+            knots = sorted(
+                (math.atan2(vs[h][1] - cy, vs[h][0] - cx) % math.tau, h)
+                for h in circ_vs)
+            len_knots = len(knots)
+            k = 0
+            while k < len_knots:
+                a0, v0 = knots[k]
+                a1, v1 = knots[(k + 1) % len_knots]
+                span = (a1 - a0) % math.tau
+                if span <= 0.0 or len_knots == 1:
+                    span = span + math.tau
+
+                seg_count = max(1, math.ceil(sectors * span / math.tau))
+                samples = [0] * (seg_count - 1)
+                j = 1
+                while j < seg_count:
+                    theta = a0 + span * j / seg_count
+                    samples[j - 1] = len(vs)
+                    vs.append((cx + r * math.cos(theta),
+                        cy + r * math.sin(theta)))
+                    j = j + 1
+
+                step = min(probe / r, span * 0.5)
+                fwd = a0 + step
+                bwd = a1 - step
+                fwd_dir = math.atan2(
+                    cy + r * math.sin(fwd) - vs[v0][1],
+                    cx + r * math.cos(fwd) - vs[v0][0])
+                bwd_dir = math.atan2(
+                    cy + r * math.sin(bwd) - vs[v1][1],
+                    cx + r * math.cos(bwd) - vs[v1][0])
+
+                # Half edges are stored in twin pairs, so the twin of
+                # half edge e is e ^ 1.
+                outgoing[v0].append(len(he_orig))
+                he_orig.append(v0)
+                he_samples.append(samples)
+                he_angle.append(fwd_dir)
+
+                outgoing[v1].append(len(he_orig))
+                he_orig.append(v1)
+                he_samples.append(samples[::-1])
+                he_angle.append(bwd_dir)
+                k = k + 1
+            i = i + 1
+
+        # Each vertex's half edges are sorted counter-clockwise, and
+        # each half edge records its place in that order.
+        len_hes = len(he_orig)
+        he_rank = [0] * len_hes
+        for out in outgoing:
+            out.sort(key=lambda e: he_angle[e])
+            k = 0
+            for e in out:
+                he_rank[e] = k
+                k = k + 1
+
+        visited = [False] * len_hes
+        e_start = 0
+        while e_start < len_hes:
+            if visited[e_start]:
+                e_start = e_start + 1
+                continue
+
+            loop = []
+            e = e_start
+            while not visited[e]:
+                visited[e] = True
+                loop.append(he_orig[e])
+                loop.extend(he_samples[e])
+
+                twin = e ^ 1
+                out = outgoing[he_orig[twin]]
+                e = out[he_rank[twin] - 1]
+
+            area = 0.0
+            len_loop = len(loop)
+            j = 0
+            while j < len_loop:
+                p = vs[loop[j]]
+                q = vs[loop[(j + 1) % len_loop]]
+                area = area + p[0] * q[1] - q[0] * p[1]
+                j = j + 1
+            if area > tolerance and len_loop > 2:
+                fs.append(tuple(loop))
+            e_start = e_start + 1
+
+        return vs, fs
+
+    @staticmethod
+    def calc_centers(pattern, radius, rings, foil_count, offset_angle):
+        # Returns the centers and radii of a pattern's circles about the
+        # origin, before they are rotated.
+        if pattern == "VESICA":
+            # 1 / math.sqrt(3) = 0.5773, 2 / math.sqrt(3) = 1.1547
+            r = radius * 1.1547005383792517
+            y = radius * 0.5773502691896258
+            return [(0.0, y), (0.0, -y)], [r, r]
+
+        if pattern == "FOIL":
+            half_radius = radius * 0.5
+            centers = [None] * foil_count
+            i = 0
+            while i < foil_count:
+                theta = offset_angle + math.tau * i / foil_count
+                centers[i] = (half_radius * math.cos(theta),
+                    half_radius * math.sin(theta))
+                i = i + 1
+            return centers, [half_radius] * foil_count
+
+        # Centers of a hexagonal lattice within a number of rings. The
+        # lattice is spaced by the radius, so each circle passes through
+        # the centers of its neighbors.
+        centers = []
+        q = -rings
+        while q <= rings:
+            r = max(-rings, -q - rings)
+            while r <= min(rings, -q + rings):
+                centers.append((
+                    radius * (q + 0.5 * r),
+                    radius * 0.8660254037844386 * r))
+                r = r + 1
+            q = q + 1
+        return centers, [radius] * len(centers)
+
+    def execute(self, context):
+        pattern = self.pattern
+        sectors = max(3, self.sectors)
+        radius = max(0.000001, self.radius)
+        rings = max(1, self.rings)
+        foil_count = max(2, self.foil_count)
+        offset_angle = self.offset_angle
+        origin = self.origin
+
+        # Foil circles are placed at their angles, rather than rotated
+        # after, so that the first sits on the offset.
+        centers, radii = CircleArrangementMeshMaker.calc_centers(
+            pattern, radius, rings, foil_count, offset_angle)
+        cosa = math.cos(offset_angle)
+        sina = math.sin(offset_angle)
+        if pattern == "FOIL":
+            cosa = 1.0
+            sina = 0.0
+
+        i = 0
+        while i < len(centers):
+            c = centers[i]
+            centers[i] = (cosa * c[0] - sina * c[1],
+                cosa * c[1] + sina * c[0])
+            i = i + 1
+
+        vs, fs = CircleArrangementMeshMaker.calc_arrangement(
+            centers, radii, sectors, 0.00001 * radius)
+
+        # Texture coordinates map the pattern's bounds to the unit
+        # square, keeping its aspect ratio.
+        lbx = min(v[0] for v in vs)
+        lby = min(v[1] for v in vs)
+        ubx = max(v[0] for v in vs)
+        uby = max(v[1] for v in vs)
+        to_uv = 1.0 / max(0.000001, ubx - lbx, uby - lby)
+
+        loop_starts = [0] * len(fs)
+        loop_verts = []
+        j = 0
+        for f in fs:
+            loop_starts[j] = len(loop_verts)
+            loop_verts.extend(f)
+            j = j + 1
+
+        mesh_name = "Circle Arrangement"
+        if pattern == "SEED":
+            mesh_name = "Seed of Life" if rings == 1 else "Flower of Life"
+        elif pattern == "VESICA":
+            mesh_name = "Vesica"
+        elif pattern == "FOIL":
+            mesh_name = "Foil"
+
+        mesh_data = bpy.data.meshes.new(mesh_name)
+        mesh_data["generator"] = CircleArrangementMeshMaker.bl_idname
+        mesh_data.vertices.add(len(vs))
+        mesh_data.vertices.foreach_set("co", [c
+            for v in vs
+            for c in (v[0] + origin[0], v[1] + origin[1], 0.0)])
+        mesh_data.loops.add(len(loop_verts))
+        mesh_data.loops.foreach_set("vertex_index", loop_verts)
+        mesh_data.polygons.add(len(fs))
+        mesh_data.polygons.foreach_set("loop_start", loop_starts)
+
+        uv_layer = mesh_data.uv_layers.new()
+        uv_layer.data.foreach_set("uv", [c
+            for h in loop_verts
+            for c in ((vs[h][0] - lbx) * to_uv, (vs[h][1] - lby) * to_uv)])
+        mesh_data.update(calc_edges=True)
+
+        mesh_obj = bpy.data.objects.new(mesh_data.name, mesh_data)
+        mesh_obj.location = context.scene.cursor.location
+        context.collection.objects.link(mesh_obj)
+
+        return {"FINISHED"}
+
+    @classmethod
+    def poll(cls, context):
+        return context.area.type == "VIEW_3D"
+
+
+def menu_func(self, context):
+    self.layout.operator(CircleArrangementMeshMaker.bl_idname, icon="MESH_DATA")
+
+
+def register():
+    bpy.utils.register_class(CircleArrangementMeshMaker)
+    bpy.types.VIEW3D_MT_mesh_add.append(menu_func)
+
+
+def unregister():
+    bpy.utils.unregister_class(CircleArrangementMeshMaker)
+    bpy.types.VIEW3D_MT_mesh_add.remove(menu_func)
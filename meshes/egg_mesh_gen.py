@@ -1,5 +1,6 @@
 import bpy # type: ignore
 import bmesh # type: ignore
+import functools
 import math
 from mathutils import Matrix # type: ignore
 from bpy.props import ( # type: ignore
@@ -66,11 +67,37 @@ class EggMeshMaker(bpy.types.Operator):
         items=[
             ("NGON", "NGon", "Fill with an ngon", 1),
             ("STROKE", "Stroke", "Connect vertices with edges only", 2),
-            ("TRI_FAN", "Tri Fan", "Fill with triangles sharing a central vertex", 3)],
+            ("TRI_FAN", "Tri Fan", "Fill with triangles sharing a central vertex", 3),
+            ("TRIS", "Tris", "Fill with a strip of triangles, without a central vertex", 4),
+            ("RIBBON", "Ribbon", "Connect vertices with a strip of constant width", 5)],
         name="Face Type",
         default="NGON",
         description="How to fill the egg") # type: ignore
 
+    stroke_width: FloatProperty(
+        name="Width",
+        description="Ribbon width",
+        min=0.0001,
+        soft_max=1.0,
+        step=1,
+        precision=3,
+        default=0.05) # type: ignore
+
+    join_type: EnumProperty(
+        items=[
+            ("MITER", "Miter", "Extend the sides of a ribbon to a point", 1),
+            ("ROUND", "Round", "Round the outer corners of a ribbon", 2)],
+        name="Join",
+        default="MITER",
+        description="How to join the sides of a ribbon at a corner") # type: ignore
+
+    lod_levels: IntProperty(
+        name="LOD Levels",
+        description="Number of levels of detail, each with half the vertices of the last",
+        min=1,
+        max=8,
+        default=1) # type: ignore
+
     @staticmethod
     def mesh_data_to_bmesh(
             vs, vts, vns,
@@ -134,19 +161,205 @@ class EggMeshMaker(bpy.types.Operator):
     def translate(v, t):
         return (v[0] + t[0], v[1] + t[1], 0.0)
 
-    def execute(self, context):
-        sectors_per_circle = max(3, self.sectors)
-        radius = max(0.000001, self.radius)
-        offset_angle = self.offset_angle
-        origin = self.origin
-        face_type = self.face_type
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def face_indices(face_type, len_vs):
+        # Face indices depend only on the face type and vertex count.
+        fs = []
+        if face_type == "NGON":
+            f = [0] * len_vs
+            g = 0
+            while g < len_vs:
+                f[g] = g
+                g = g + 1
+            fs = [tuple(f)]
+        elif face_type == "TRI_FAN":
+            len_fs = len_vs - 1
+            fs = [(0, 0, 0)] * len_fs
+            g = 0
+            while g < len_fs:
+                fs[g] = (
+                    len_vs - 1,
+                    g % (len_vs - 1),
+                    (g + 1) % (len_vs - 1))
+                g = g + 1
+        elif face_type == "TRIS":
+            # The egg is convex, so it can be zigzagged from both ends
+            # of the loop toward the middle. This avoids the slivers of
+            # a fan from one vertex.
+            len_fs = len_vs - 2
+            fs = [(0, 0, 0)] * len_fs
+            lo = 0
+            hi = len_vs - 1
+            g = 0
+            while g < len_fs:
+                if g % 2 == 0:
+                    fs[g] = (lo, lo + 1, hi)
+                    lo = lo + 1
+                else:
+                    fs[g] = (lo, hi - 1, hi)
+                    hi = hi - 1
+                g = g + 1
+        return tuple(fs)
 
-        pi_75pc = math.pi * 0.75
-        pi_half = math.pi * 0.5
-        pi_qrtr = math.pi * 0.25
+    @staticmethod
+    def calc_ribbon(
+            vs, vts, is_closed, width, join_type,
+            uv_scale, uv_cosa=1.0, uv_sina=0.0):
+        # Offsets the outline by half the width to either side. Each
+        # join has one vertex on its inner side and one or more on its
+        # outer side. Miters longer than four half widths are beveled,
+        # as in SVG. Texture coordinates are offset from those of the
+        # outline, so the ribbon keeps the shape's planar projection.
+        len_vs = len(vs)
+        half_width = max(0.000001, width * 0.5)
+        miter_limit = 4.0
+        round_step = math.pi / 12.0
+
+        # Find the unit direction of the edge leaving each vertex. An
+        # open outline's last vertex reuses the direction of its last
+        # edge, so its ends are cut square.
+        len_edges = len_vs
+        if not is_closed:
+            len_edges = len_vs - 1
+        dirs = [(1.0, 0.0)] * len_vs
+        i = 0
+        while i < len_edges:
+            v_curr = vs[i]
+            v_next = vs[(i + 1) % len_vs]
+            dx = v_next[0] - v_curr[0]
+            dy = v_next[1] - v_curr[1]
+            mag = math.sqrt(dx * dx + dy * dy)
+            if mag > 0.000001:
+                dirs[i] = (dx / mag, dy / mag)
+            i = i + 1
+        if not is_closed and len_vs > 1:
+            dirs[len_vs - 1] = dirs[len_vs - 2]
+
+        rvs = []
+        rvts = []
+        rights = [None] * len_vs
+        lefts = [None] * len_vs
+        fs = []
+
+        i = 0
+        while i < len_vs:
+            v = vs[i]
+            d1 = dirs[i]
+            d0 = dirs[(i - 1) % len_vs]
+            if not is_closed and i == 0:
+                d0 = d1
+
+            # Normals point to the left of each edge.
+            n0 = (-d0[1], d0[0])
+            n1 = (-d1[1], d1[0])
+            cross = d0[0] * d1[1] - d0[1] * d1[0]
+            dot = d0[0] * d1[0] + d0[1] * d1[1]
+
+            # The miter bisects the two normals. Its length is the half
+            # width over the cosine of half the turn.
+            mx = n0[0] + n1[0]
+            my = n0[1] + n1[1]
+            m_mag = math.sqrt(mx * mx + my * my)
+            cos_half = 0.0
+            if m_mag > 0.000001:
+                mx = mx / m_mag
+                my = my / m_mag
+                cos_half = mx * n0[0] + my * n0[1]
+
+            # For a left turn, the right side is outer.
+            side = 1.0
+            if cross < 0.0:
+                side = -1.0
+
+            # Shallow turns are mitered whatever the join type, since a
+            # rounded join would be indistinguishable.
+            angle = math.atan2(abs(cross), dot)
+            offsets = []
+            if cos_half * miter_limit >= 1.0 \
+                and (join_type == "MITER"
+                    or angle <= round_step + 0.000001):
+                miter_len = half_width / cos_half
+                offsets.append((-side * mx * miter_len,
+                                -side * my * miter_len))
+            elif join_type == "ROUND":
+                # A turn of a whole number of steps is not given an
+                # extra step by rounding error.
+                count = max(1, math.ceil(angle / round_step - 0.000001))
+                to_angle = side * angle / count
+                k = 0
+                while k < count + 1:
+                    a = k * to_angle
+                    cosa = math.cos(a)
+                    sina = math.sin(a)
+                    offsets.append((
+                        -side * half_width * (cosa * n0[0] - sina * n0[1]),
+                        -side * half_width * (cosa * n0[1] + sina * n0[0])))
+                    k = k + 1
+            else:
+                offsets.append((-side * half_width * n0[0],
+                                -side * half_width * n0[1]))
+                offsets.append((-side * half_width * n1[0],
+                                -side * half_width * n1[1]))
+
+            inner = (side * half_width * n0[0],
+                     side * half_width * n0[1])
+            if cos_half > 0.000001:
+                inner_len = half_width / cos_half
+                inner = (side * mx * inner_len,
+                         side * my * inner_len)
+
+            start = len(rvs)
+            for offset in [inner] + offsets:
+                rvs.append((v[0] + offset[0], v[1] + offset[1], 0.0))
+                du = uv_cosa * offset[0] - uv_sina * offset[1]
+                dv = uv_cosa * offset[1] + uv_sina * offset[0]
+                rvts.append((
+                    vts[i][0] + uv_scale * du,
+                    vts[i][1] + uv_scale * dv))
+            len_offsets = len(offsets)
+            outer_indices = list(range(start + 1, start + 1 + len_offsets))
+
+            if side > 0.0:
+                lefts[i] = [start]
+                rights[i] = outer_indices
+            else:
+                lefts[i] = outer_indices
+                rights[i] = [start]
+
+            # Fill the join between the outer vertices with a fan from
+            # the inner vertex.
+            k = 0
+            while k < len_offsets - 1:
+                if side > 0.0:
+                    fs.append((
+                        start,
+                        outer_indices[k],
+                        outer_indices[k + 1]))
+                else:
+                    fs.append((
+                        start,
+                        outer_indices[k + 1],
+                        outer_indices[k]))
+                k = k + 1
+
+            i = i + 1
+
+        i = 0
+        while i < len_edges:
+            j = (i + 1) % len_vs
+            fs.append((
+                rights[i][-1],
+                rights[j][0],
+                lefts[j][0],
+                lefts[i][-1]))
+            i = i + 1
+
+        return rvs, rvts, fs
+
+    @staticmethod
+    def arc_counts(sectors_per_circle):
         sqrt_3 = math.sqrt(3)
-        # (1 / (2 * sqrt(3))) / 1.2886751345948129
-        y_displace = 0.22400923773979597
 
         # 180deg / 360deg arclen = 0.5
         sectors_per_bottom = max(3, math.ceil(sectors_per_circle * 0.5))
@@ -158,74 +371,88 @@ class EggMeshMaker(bpy.types.Operator):
         # and should mirror each other.
         sectors_per_side = max(3, math.ceil(2.0 * sectors_per_circle * 0.125))
 
-        use_central_vert = face_type == "TRI_FAN"
-        len_vs = (sectors_per_bottom - 1) \
-            + (sectors_per_top - 1) \
-            + (sectors_per_side - 1) * 2
-        if use_central_vert:
-            len_vs = len_vs + 1
+        return (
+            sectors_per_side,
+            sectors_per_top,
+            sectors_per_side,
+            sectors_per_bottom)
 
-        vs = [(0.0, y_displace, 0.0)] * len_vs
-        vts = [(0.5, 0.5)] * len_vs
-        vns = [(0.0, 0.0, 1.0)] * len_vs
+    @staticmethod
+    def sample_arcs(counts, fine_counts=None, fine_arcs=None, stride=1):
+        # Returns the points of the egg's four arcs in unit space. The
+        # first point of each arc is excluded, as it is the last point of
+        # the previous arc. When a finer level's interval count is an
+        # exact multiple of this level's, its samples are reused.
+        pi_75pc = math.pi * 0.75
+        pi_half = math.pi * 0.5
+        pi_qrtr = math.pi * 0.25
+        sqrt_3 = math.sqrt(3)
 
-        i_to_theta = math.pi / (sectors_per_bottom - 1)
         i_radius = 1.0 / 1.2886751345948129
-
-        j_to_theta = pi_qrtr / (sectors_per_side - 1)
         j_radius = 2.0 / 1.2886751345948129
-
-        k_to_theta = pi_half / (sectors_per_top - 1)
         k_radius = (1.0 / sqrt_3) / 1.2886751345948129
-
-        m_to_theta = pi_qrtr / (sectors_per_side - 1)
         m_radius = 2.0 / 1.2886751345948129
 
-        j = 1
-        while j < sectors_per_side:
-            theta = j * j_to_theta
-            x = -i_radius + j_radius * math.cos(theta)
-            y = j_radius * math.sin(theta)
-            idx = j - 1
-            vs[idx] = (x, y , 0.0)
-            vts[idx] = (x * 0.5 + 0.5, (y - y_displace) * 0.5 + 0.5)
-            j = j + 1
-
-        k = 1
-        while k < sectors_per_top:
-            theta = pi_qrtr + k * k_to_theta
-            x = k_radius * math.cos(theta)
-            y = i_radius + k_radius * math.sin(theta)
-            idx = (sectors_per_side - 1) \
-                + k - 1
-            vs[idx] = (x, y , 0.0)
-            vts[idx] = (x * 0.5 + 0.5, (y - y_displace) * 0.5 + 0.5)
-            k = k + 1
+        # Center x, center y, radius, start angle, arc length.
+        arc_params = [
+            (-i_radius, 0.0, j_radius, 0.0, pi_qrtr),
+            (0.0, i_radius, k_radius, pi_qrtr, pi_half),
+            (i_radius, 0.0, m_radius, pi_75pc, pi_qrtr),
+            (0.0, 0.0, i_radius, math.pi, math.pi),
+        ]
 
-        m = 1
-        while m < sectors_per_side:
-            theta = pi_75pc + m * m_to_theta
-            x = i_radius + m_radius * math.cos(theta)
-            y = m_radius * math.sin(theta)
-            idx = (sectors_per_side - 1) \
-                + (sectors_per_top - 1) \
-                + m - 1
-            vs[idx] = (x, y , 0.0)
-            vts[idx] = (x * 0.5 + 0.5, (y - y_displace) * 0.5 + 0.5)
-            m = m + 1
-
-        i = 1
-        while i < sectors_per_bottom:
-            theta = math.pi + i * i_to_theta
-            x = i_radius * math.cos(theta)
-            y = i_radius * math.sin(theta)
-            idx = (sectors_per_side - 1) \
-                + (sectors_per_top - 1) \
-                + (sectors_per_side - 1) \
-                + i - 1
-            vs[idx] = (x, y , 0.0)
-            vts[idx] = (x * 0.5 + 0.5, (y - y_displace) * 0.5 + 0.5)
-            i = i + 1
+        arcs = [None] * 4
+        h = 0
+        while h < 4:
+            count = counts[h]
+            intervals = count - 1
+
+            if fine_arcs is not None \
+                and fine_counts[h] - 1 == intervals * stride:
+                fine_arc = fine_arcs[h]
+                arc = [(0.0, 0.0)] * intervals
+                j = 1
+                while j < count:
+                    arc[j - 1] = fine_arc[j * stride - 1]
+                    j = j + 1
+            else:
+                x_center, y_center, radius, theta_start, arc_len = \
+                    arc_params[h]
+                to_theta = arc_len / intervals
+                arc = [(0.0, 0.0)] * intervals
+                j = 1
+                while j < count:
+                    theta = theta_start + j * to_theta
+                    arc[j - 1] = (
+                        x_center + radius * math.cos(theta),
+                        y_center + radius * math.sin(theta))
+                    j = j + 1
+
+            arcs[h] = arc
+            h = h + 1
+
+        return arcs
+
+    @staticmethod
+    def calc_egg(arcs, radius, offset_angle, origin, use_central_vert):
+        # (1 / (2 * sqrt(3))) / 1.2886751345948129
+        y_displace = 0.22400923773979597
+
+        len_vs = len(arcs[0]) + len(arcs[1]) + len(arcs[2]) + len(arcs[3])
+        if use_central_vert:
+            len_vs = len_vs + 1
+
+        vs = [(0.0, y_displace, 0.0)] * len_vs
+        vts = [(0.5, 0.5)] * len_vs
+
+        idx = 0
+        for arc in arcs:
+            for point in arc:
+                x = point[0]
+                y = point[1]
+                vs[idx] = (x, y, 0.0)
+                vts[idx] = (x * 0.5 + 0.5, (y - y_displace) * 0.5 + 0.5)
+                idx = idx + 1
 
         origin_displace = EggMeshMaker.translate(
             origin, (0.0, -y_displace * radius))
@@ -241,41 +468,103 @@ class EggMeshMaker(bpy.types.Operator):
                 origin_displace)
             h = h + 1
 
-        fs = []
-        len_fs = 0
-        if face_type == "NGON":
-            len_fs = 1
-            f = [0] * len_vs
-            g = 0
-            while g < len_vs:
-                f[g] = g
-                g = g + 1
-            fs = [tuple(f)]
-        elif face_type == "TRI_FAN":
-            len_fs = len_vs - 1
-            fs = [(0, 0, 0)] * len_fs
-            g = 0
-            while g < len_fs:
-                fs[g] = (
-                    len_vs - 1,
-                    g % (len_vs - 1),
-                    (g + 1) % (len_vs - 1))
-                g = g + 1
+        return vs, vts
 
-        bm = EggMeshMaker.mesh_data_to_bmesh(
-            vs, vts, vns,
-            fs, fs, fs)
+    def execute(self, context):
+        sectors_per_circle = max(3, self.sectors)
+        radius = max(0.000001, self.radius)
+        offset_angle = self.offset_angle
+        origin = self.origin
+        face_type = self.face_type
+        stroke_width = self.stroke_width
+        join_type = self.join_type
+        lod_levels = max(1, self.lod_levels)
 
-        mesh_data = bpy.data.meshes.new("Egg")
-        bm.to_mesh(mesh_data)
-        bm.free()
+        use_central_vert = face_type == "TRI_FAN"
 
+        mesh_datas = []
+        fine_counts = None
+        fine_arcs = None
+        lod = 0
+        while lod < lod_levels:
+            stride = 1 << lod
+            sectors_lod = sectors_per_circle // stride
+            if lod > 0 and sectors_lod < 3:
+                break
+
+            # Where the finest level's interval count divides evenly by
+            # the stride, the coarse arc is a subset of its samples.
+            counts = EggMeshMaker.arc_counts(sectors_lod)
+            if fine_counts is not None:
+                counts = list(counts)
+                h = 0
+                while h < 4:
+                    fine_intervals = fine_counts[h] - 1
+                    if fine_intervals % stride == 0 \
+                        and fine_intervals // stride >= 2:
+                        counts[h] = fine_intervals // stride + 1
+                    h = h + 1
+
+            arcs = EggMeshMaker.sample_arcs(
+                counts, fine_counts, fine_arcs, stride)
+            if lod == 0:
+                fine_counts = counts
+                fine_arcs = arcs
+
+            vs, vts = EggMeshMaker.calc_egg(
+                arcs, radius, offset_angle, origin, use_central_vert)
+            if face_type == "RIBBON":
+                # Texture coordinates of the egg are not rotated with it.
+                vs, vts, fs = EggMeshMaker.calc_ribbon(
+                    vs, vts, True, stroke_width, join_type,
+                    0.5 / radius,
+                    math.cos(-offset_angle),
+                    math.sin(-offset_angle))
+            else:
+                fs = EggMeshMaker.face_indices(face_type, len(vs))
+            len_vs = len(vs)
+            vns = [(0.0, 0.0, 1.0)] * len_vs
+
+            bm = EggMeshMaker.mesh_data_to_bmesh(
+                vs, vts, vns,
+                fs, fs, fs)
+
+            mesh_name = "Egg"
+            if lod_levels > 1:
+                mesh_name = "Egg.LOD{}".format(lod)
+            mesh_data = bpy.data.meshes.new(mesh_name)
+            mesh_data["generator"] = EggMeshMaker.bl_idname
+            bm.to_mesh(mesh_data)
+            bm.free()
+
+            mesh_datas.append(mesh_data)
+            lod = lod + 1
+
+        mesh_data = mesh_datas[0]
         mesh_obj = bpy.data.objects.new(mesh_data.name, mesh_data)
         mesh_obj.location = context.scene.cursor.location
         context.collection.objects.link(mesh_obj)
 
+        if len(mesh_datas) > 1:
+            EggMeshMaker.tag_lods(mesh_obj, mesh_datas)
+
         return {"FINISHED"}
 
+    @staticmethod
+    def tag_lods(obj, mesh_datas):
+        # Meshes not assigned to the object are kept with a fake user so
+        # they survive saving. A level of detail switcher swaps between
+        # the meshes listed on the object.
+        names = [""] * len(mesh_datas)
+        k = 0
+        for mesh_data in mesh_datas:
+            mesh_data["lod_level"] = k
+            mesh_data.use_fake_user = True
+            names[k] = mesh_data.name
+            k = k + 1
+        obj["lod_meshes"] = names
+        obj["lod_level"] = 0
+
     @classmethod
     def poll(cls, context):
         return context.area.type == "VIEW_3D"
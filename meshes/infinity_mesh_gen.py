@@ -174,6 +174,7 @@ class InfinityMeshMaker(bpy.types.Operator):
             fs, fs, fs)
 
         mesh_data = bpy.data.meshes.new("InfinityLoop")
+        mesh_data["generator"] = InfinityMeshMaker.bl_idname
         bm.to_mesh(mesh_data)
         bm.free()
 
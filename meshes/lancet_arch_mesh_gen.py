@@ -1,5 +1,6 @@
 import bpy # type: ignore
 import bmesh # type: ignore
+import functools
 import math
 from bpy.props import ( # type: ignore
     EnumProperty,
@@ -87,6 +88,41 @@ class LancetArchMeshMaker(bpy.types.Operator):
         default="QUADS",
         description="How to fill the mesh") # type: ignore
 
+    depth: FloatProperty(
+        name="Depth",
+        description="Extrusion depth. At zero, the arch is flat",
+        min=0.0,
+        soft_max=100.0,
+        step=1,
+        precision=3,
+        default=0.0) # type: ignore
+
+    chamfer: FloatProperty(
+        name="Chamfer",
+        description="Chamfer of the solid's edges. Reduced if the caps would fold over",
+        min=0.0,
+        soft_max=1.0,
+        step=1,
+        precision=3,
+        default=0.0) # type: ignore
+
+    sweep_count: IntProperty(
+        name="Shape Keys",
+        description="Number of shape keys to bake from the sharpness to the sweep target",
+        min=0,
+        soft_max=32,
+        default=0) # type: ignore
+
+    sweep_stop: FloatProperty(
+        name="Sweep To",
+        description="Sharpness of the last shape key",
+        default=0.0,
+        step=1,
+        precision=3,
+        min=0.0,
+        max=1.0,
+        subtype="FACTOR") # type: ignore
+
     @staticmethod
     def circ_intersect_simplified(
         x_orig,
@@ -165,6 +201,252 @@ class LancetArchMeshMaker(bpy.types.Operator):
 
         return bm
 
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def face_indices(face_type, sectors):
+        # Face indices depend only on the face type and vertex count.
+        len_vs = (sectors * 2 + 1) * 2
+        fs = []
+        if face_type == "QUADS":
+            len_fs = sectors * 2
+            fs = [(0, 0, 0, 0)] * len_fs
+
+            k = 0
+            while k < len_fs:
+                fs[k] = (
+                    k,
+                    k + 1,
+                    len_vs - k - 2,
+                    len_vs - k - 1)
+                k = k + 1
+        else:
+            # Construct an n-gon face.
+            k = 0
+            f = [0] * len_vs
+            while k < len_vs:
+                f[k] = k
+                k = k + 1
+            fs = [tuple(f)]
+
+        return tuple(fs)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def solid_indices(face_type, sectors, ring_count):
+        # The front cap reuses the flat faces. The back cap reverses
+        # them, so that it faces away. Walls join each ring to the next.
+        # Texture coordinates of the walls follow those of the caps, with
+        # a seam where the outline closes.
+        cap_fs = LancetArchMeshMaker.face_indices(face_type, sectors)
+        len_ring = (sectors * 2 + 1) * 2
+        len_caps = len(cap_fs)
+        back_offset = len_ring * (ring_count - 1)
+        len_fs = len_caps * 2 + back_offset
+        v_fs = [()] * len_fs
+        vt_fs = [()] * len_fs
+
+        k = 0
+        while k < len_caps:
+            f = cap_fs[k]
+            f_rev = f[::-1]
+            v_fs[k] = f
+            vt_fs[k] = f
+            v_fs[len_caps + k] = tuple(back_offset + h for h in f_rev)
+            vt_fs[len_caps + k] = f_rev
+            k = k + 1
+
+        cursor = len_caps * 2
+        r = 0
+        while r < ring_count - 1:
+            v_curr = r * len_ring
+            v_next = v_curr + len_ring
+            vt_curr = len_ring + r * (len_ring + 1)
+            vt_next = vt_curr + len_ring + 1
+
+            k = 0
+            while k < len_ring:
+                k_next = (k + 1) % len_ring
+                v_fs[cursor] = (
+                    v_curr + k,
+                    v_next + k,
+                    v_next + k_next,
+                    v_curr + k_next)
+                vt_fs[cursor] = (
+                    vt_curr + k,
+                    vt_next + k,
+                    vt_next + k + 1,
+                    vt_curr + k + 1)
+                cursor = cursor + 1
+                k = k + 1
+
+            r = r + 1
+
+        return tuple(v_fs), tuple(vt_fs)
+
+    @staticmethod
+    def calc_miters(vs):
+        # Returns the offset of each vertex of a closed outline per unit
+        # of inset. The outline winds counter-clockwise, so its inward
+        # miter is to the left.
+        len_ring = len(vs)
+        miters = [(0.0, 0.0)] * len_ring
+        i = 0
+        while i < len_ring:
+            v_prev = vs[(i - 1) % len_ring]
+            v_curr = vs[i]
+            v_next = vs[(i + 1) % len_ring]
+
+            d0x = v_curr[0] - v_prev[0]
+            d0y = v_curr[1] - v_prev[1]
+            d0_mag = math.sqrt(d0x * d0x + d0y * d0y)
+            d1x = v_next[0] - v_curr[0]
+            d1y = v_next[1] - v_curr[1]
+            d1_mag = math.sqrt(d1x * d1x + d1y * d1y)
+
+            if d0_mag > 0.000001 and d1_mag > 0.000001:
+                d0x = d0x / d0_mag
+                d0y = d0y / d0_mag
+                d1x = d1x / d1_mag
+                d1y = d1y / d1_mag
+
+                mx = -d0y - d1y
+                my = d0x + d1x
+                m_mag = math.sqrt(mx * mx + my * my)
+                if m_mag > 0.000001:
+                    mx = mx / m_mag
+                    my = my / m_mag
+                    cos_half = max(0.000001, mx * -d0y + my * d0x)
+                    miters[i] = (mx / cos_half, my / cos_half)
+
+            i = i + 1
+
+        return miters
+
+    @staticmethod
+    def calc_chamfer_limit(vs):
+        # Returns the largest inset before a cap folds over itself. An
+        # edge collapses when its ends, moving along their miters, meet.
+        # The band pinches when a vertex reaches the inset of an edge on
+        # the far side of the band.
+        miters = LancetArchMeshMaker.calc_miters(vs)
+        len_ring = len(vs)
+        limit = float("inf")
+        j = 0
+        while j < len_ring:
+            j_next = (j + 1) % len_ring
+            a = vs[j]
+            b = vs[j_next]
+            ex = b[0] - a[0]
+            ey = b[1] - a[1]
+            e_mag = math.sqrt(ex * ex + ey * ey)
+            if e_mag > 0.000001:
+                dx = ex / e_mag
+                dy = ey / e_mag
+                m_a = miters[j]
+                m_b = miters[j_next]
+                closing = (m_a[0] - m_b[0]) * dx + (m_a[1] - m_b[1]) * dy
+                if closing > 0.000001:
+                    limit = min(limit, e_mag / closing)
+
+                i = 0
+                while i < len_ring:
+                    if i != j and i != j_next:
+                        px = vs[i][0] - a[0]
+                        py = vs[i][1] - a[1]
+                        t = px * dx + py * dy
+                        dist = px * -dy + py * dx
+                        if dist > 0.0 and t >= 0.0 and t <= e_mag:
+                            m_i = miters[i]
+                            approach = 1.0 - (m_i[0] * -dy + m_i[1] * dx)
+                            if approach > 0.000001:
+                                limit = min(limit, dist / approach)
+                    i = i + 1
+            j = j + 1
+
+        return limit
+
+    @staticmethod
+    def calc_solid(vs, vts, depth, chamfer):
+        # Extrudes the closed outline of the arch back along the z axis.
+        # With a chamfer, the caps are inset by the chamfer and meet the
+        # walls at 45 degrees. Returns the vertices of each ring, front
+        # to back, the texture coordinates of the caps then the walls,
+        # and the number of rings.
+        len_ring = len(vs)
+        depth = max(0.000001, depth)
+        chamfer = min(max(chamfer, 0.0), depth * 0.5)
+
+        # Each ring is an inset and a depth.
+        rings = [(0.0, 0.0), (0.0, -depth)]
+        if chamfer * 2.0 >= depth:
+            rings = [
+                (chamfer, 0.0),
+                (0.0, -chamfer),
+                (chamfer, -depth)]
+        elif chamfer > 0.0:
+            rings = [
+                (chamfer, 0.0),
+                (0.0, -chamfer),
+                (0.0, chamfer - depth),
+                (chamfer, -depth)]
+        ring_count = len(rings)
+
+        # Arc length along the outline is accumulated for the walls'
+        # texture coordinates.
+        miters = LancetArchMeshMaker.calc_miters(vs)
+        perimeter = [0.0] * (len_ring + 1)
+        i = 0
+        while i < len_ring:
+            v_curr = vs[i]
+            v_next = vs[(i + 1) % len_ring]
+            perimeter[i + 1] = perimeter[i] + math.sqrt(
+                (v_next[0] - v_curr[0]) ** 2
+                + (v_next[1] - v_curr[1]) ** 2)
+            i = i + 1
+
+        to_u = 1.0
+        if perimeter[len_ring] > 0.0:
+            to_u = 1.0 / perimeter[len_ring]
+
+        vs_solid = [(0.0, 0.0, 0.0)] * (len_ring * ring_count)
+        vts_solid = list(vts) + [(0.0, 0.0)] * ((len_ring + 1) * ring_count)
+
+        r = 0
+        while r < ring_count:
+            inset, z = rings[r]
+            vt_v = 1.0 + z / depth
+            v_offset = r * len_ring
+            vt_offset = len_ring + r * (len_ring + 1)
+
+            k = 0
+            while k < len_ring:
+                v = vs[k]
+                miter = miters[k]
+                vs_solid[v_offset + k] = (
+                    v[0] + inset * miter[0],
+                    v[1] + inset * miter[1],
+                    z)
+                vts_solid[vt_offset + k] = (perimeter[k] * to_u, vt_v)
+                k = k + 1
+
+            vts_solid[vt_offset + len_ring] = (1.0, vt_v)
+            r = r + 1
+
+        return vs_solid, vts_solid, ring_count
+
+    @staticmethod
+    def bake_shape_keys(obj, names, vs_sweep):
+        if obj.data.shape_keys is None:
+            obj.shape_key_add(name="Basis", from_mix=False)
+
+        len_keys = len(names)
+        k = 0
+        while k < len_keys:
+            shape_key = obj.shape_key_add(name=names[k], from_mix=False)
+            shape_key.data.foreach_set(
+                "co", [c for v in vs_sweep[k] for c in v])
+            k = k + 1
+
     @staticmethod
     def scale2(v, s):
         return (v[0] * s, v[1] * s)
@@ -181,15 +463,15 @@ class LancetArchMeshMaker(bpy.types.Operator):
     def translate3(v, t):
         return (v[0] + t[0], v[1] + t[1], v[2] + t[2])
 
-    def execute(self, context):
-        # TODO: Double check that arch offset is consistent between
-        # curve and mesh version.
-
-        sectors = max(3, self.sectors)
-        sharpness = min(max(self.sharpness, 0.0), 1.0)
-        arch_weight = min(max(self.arch_weight, 0.0), 1.0)
-        arch_offset = min(max(self.arch_offset, -1.0), 1.0)
-        radius_center = max(0.000001, self.radius)
+    @staticmethod
+    def calc_arch(
+            sectors, sharpness, radius,
+            arch_weight, arch_offset, origin):
+        sectors = max(3, sectors)
+        sharpness = min(max(sharpness, 0.0), 1.0)
+        arch_weight = min(max(arch_weight, 0.0), 1.0)
+        arch_offset = min(max(arch_offset, -1.0), 1.0)
+        radius_center = max(0.000001, radius)
 
         equilateral_arc_radius = 2.0
         equilateral_arc_x_offset = 1.0
@@ -254,9 +536,8 @@ class LancetArchMeshMaker(bpy.types.Operator):
 
         create_faces = arch_weight_gt_zero \
             and radius_inner_gt_zero
-        face_type = self.face_type
 
-        origin2 = self.origin
+        origin2 = origin
         origin3 = (origin2[0], origin2[1], 0.0)
 
         len_vs = sectors * 2 + 1
@@ -265,7 +546,6 @@ class LancetArchMeshMaker(bpy.types.Operator):
 
         vs = [(0.0, 0.0, 0.0)] * len_vs
         vts = [(0.5, 0.5)] * len_vs
-        vns = [(0.0, 0.0, 1.0)] * len_vs
 
         if create_faces:
             keystone_outer = (0.0, y_coord[1] * y_aspect_fix_outer, 0.0)
@@ -379,34 +659,73 @@ class LancetArchMeshMaker(bpy.types.Operator):
 
                 i = i + 1
 
-        fs = []
+        return vs, vts, create_faces
+
+    def execute(self, context):
+        # TODO: Double check that arch offset is consistent between
+        # curve and mesh version.
+
+        sectors = max(3, self.sectors)
+        face_type = self.face_type
+        depth = self.depth
+        chamfer = self.chamfer
+
+        vs, vts, create_faces = LancetArchMeshMaker.calc_arch(
+            sectors, self.sharpness, self.radius,
+            self.arch_weight, self.arch_offset, self.origin)
+
+        fs = ()
+        vt_fs = ()
         if create_faces:
-            if face_type == "QUADS":
-                len_fs = sectors * 2
-                fs = [(0, 0, 0, 0)] * len_fs
-
-                k = 0
-                while k < len_fs:
-                    fs[k] = (
-                        k,
-                        k + 1,
-                        len_vs - k - 2,
-                        len_vs - k - 1)
-                    k = k + 1
-            else:
-                # Construct an n-gon face.
-                k = 0
-                f = [0] * len_vs
-                while k < len_vs:
-                    f[k] = k
-                    k = k + 1
-                fs = [tuple(f)] # type: ignore
+            fs = LancetArchMeshMaker.face_indices(face_type, sectors)
+            vt_fs = fs
+
+        # Topology does not depend on sharpness, so every step of the
+        # sweep can be written as a shape key on the same mesh.
+        sweep_count = max(0, self.sweep_count)
+        sharpness_orig = min(max(self.sharpness, 0.0), 1.0)
+        sharpness_dest = min(max(self.sweep_stop, 0.0), 1.0)
+        names = [""] * sweep_count
+        arches_sweep = [None] * sweep_count
+        k = 0
+        while k < sweep_count:
+            t = (k + 1.0) / sweep_count
+            sharpness = (1.0 - t) * sharpness_orig + t * sharpness_dest
+            names[k] = "Sharpness {:.3f}".format(sharpness)
+            arches_sweep[k] = LancetArchMeshMaker.calc_arch(
+                sectors, sharpness, self.radius,
+                self.arch_weight, self.arch_offset, self.origin)
+            k = k + 1
+
+        # Only an arch with faces has a closed outline to extrude.
+        is_solid = create_faces and depth > 0.0
+        if is_solid:
+            # Keep the chamfer short of where the caps would fold over,
+            # for every step of the sweep.
+            chamfer_limit = LancetArchMeshMaker.calc_chamfer_limit(vs)
+            for arch in arches_sweep:
+                chamfer_limit = min(chamfer_limit,
+                    LancetArchMeshMaker.calc_chamfer_limit(arch[0]))
+            chamfer_max = 0.9 * chamfer_limit
+            if chamfer > chamfer_max:
+                self.report(
+                    {"WARNING"},
+                    "Chamfer reduced to {:.4f} so the caps do not fold".format(
+                        chamfer_max))
+                chamfer = chamfer_max
+
+            vs, vts, ring_count = LancetArchMeshMaker.calc_solid(
+                vs, vts, depth, chamfer)
+            fs, vt_fs = LancetArchMeshMaker.solid_indices(
+                face_type, sectors, ring_count)
+        vns = [(0.0, 0.0, 1.0)] * len(vs)
 
         bm = LancetArchMeshMaker.mesh_data_to_bmesh(
             vs, vts, vns,
-            fs, fs, fs)
+            fs, vt_fs, fs)
 
         mesh_data = bpy.data.meshes.new("Lancet Arch")
+        mesh_data["generator"] = LancetArchMeshMaker.bl_idname
         bm.to_mesh(mesh_data)
         bm.free()
 
@@ -414,6 +733,19 @@ class LancetArchMeshMaker(bpy.types.Operator):
         mesh_obj.location = context.scene.cursor.location
         context.collection.objects.link(mesh_obj)
 
+        if sweep_count > 0:
+            vs_sweep = [None] * sweep_count
+            k = 0
+            while k < sweep_count:
+                vs_k, vts_k, _ = arches_sweep[k]
+                if is_solid:
+                    vs_k, _, _ = LancetArchMeshMaker.calc_solid(
+                        vs_k, vts_k, depth, chamfer)
+                vs_sweep[k] = vs_k
+                k = k + 1
+
+            LancetArchMeshMaker.bake_shape_keys(mesh_obj, names, vs_sweep)
+
         return {"FINISHED"}
 
     @classmethod
@@ -68,6 +68,7 @@ class LineMeshMaker(bpy.types.Operator):
             bm.edges.new([bm_verts[j], bm_verts[j + 1]])
 
         mesh_data = bpy.data.meshes.new("Line")
+        mesh_data["generator"] = LineMeshMaker.bl_idname
         bm.to_mesh(mesh_data)
         bm.free()
 
@@ -67,11 +67,30 @@ class OctogramMeshMaker(bpy.types.Operator):
             ("NGON", "NGon", "Fill with an ngon", 1),
             ("QUAD_FAN", "Quads", "Fill with quads sharing a central vertex", 2),
             ("TRI_FAN", "Tris", "Fill with triangles sharing a central vertex", 3),
-            ("STROKE", "Stroke", "Connect vertices with edges only", 4)],
+            ("STROKE", "Stroke", "Connect vertices with edges only", 4),
+            ("EAR_CLIP", "Ear Clip", "Fill with triangles clipped from the outline", 5),
+            ("RIBBON", "Ribbon", "Connect vertices with a strip of constant width", 6)],
         name="Face Type",
         default="NGON",
         description="How to fill the vesica") # type: ignore
 
+    stroke_width: FloatProperty(
+        name="Width",
+        description="Ribbon width",
+        min=0.0001,
+        soft_max=1.0,
+        step=1,
+        precision=3,
+        default=0.05) # type: ignore
+
+    join_type: EnumProperty(
+        items=[
+            ("MITER", "Miter", "Extend the sides of a ribbon to a point", 1),
+            ("ROUND", "Round", "Round the outer corners of a ribbon", 2)],
+        name="Join",
+        default="MITER",
+        description="How to join the sides of a ribbon at a corner") # type: ignore
+
     @staticmethod
     def mesh_data_to_bmesh(
             vs, vts, vns,
@@ -140,6 +159,237 @@ class OctogramMeshMaker(bpy.types.Operator):
     def scale3(v, s):
         return (v[0] * s, v[1] * s, v[2] * s)
 
+    @staticmethod
+    def turn(a, b, c):
+        return (b[0] - a[0]) * (c[1] - b[1]) \
+            - (b[1] - a[1]) * (c[0] - b[0])
+
+    @staticmethod
+    def ear_clip(vs):
+        # Vertices are removed from a linked list of indices, so that
+        # clipping an ear does not shift the rest. Only reflex vertices
+        # can lie inside an ear, so only they are tested. The outline
+        # is assumed to wind counter-clockwise.
+        len_vs = len(vs)
+        if len_vs < 3:
+            return tuple()
+
+        prev_indices = [0] * len_vs
+        next_indices = [0] * len_vs
+        is_reflex = [False] * len_vs
+        k = 0
+        while k < len_vs:
+            prev_indices[k] = (k - 1) % len_vs
+            next_indices[k] = (k + 1) % len_vs
+            is_reflex[k] = OctogramMeshMaker.turn(
+                vs[(k - 1) % len_vs],
+                vs[k],
+                vs[(k + 1) % len_vs]) <= 0.0
+            k = k + 1
+
+        fs = []
+        remaining = len_vs
+        misses = 0
+        i = 0
+        while remaining > 3:
+            a = prev_indices[i]
+            c = next_indices[i]
+
+            is_ear = not is_reflex[i]
+            if is_ear:
+                va = vs[a]
+                vb = vs[i]
+                vc = vs[c]
+                j = next_indices[c]
+                while j != a:
+                    if is_reflex[j]:
+                        vj = vs[j]
+                        if OctogramMeshMaker.turn(va, vb, vj) >= 0.0 \
+                            and OctogramMeshMaker.turn(vb, vc, vj) >= 0.0 \
+                            and OctogramMeshMaker.turn(vc, va, vj) >= 0.0:
+                            is_ear = False
+                            break
+                    j = next_indices[j]
+
+            # A full lap without an ear means the outline is degenerate,
+            # so clip anyway rather than loop forever.
+            if is_ear or misses > remaining:
+                fs.append((a, i, c))
+                next_indices[a] = c
+                prev_indices[c] = a
+                remaining = remaining - 1
+                misses = 0
+
+                is_reflex[a] = OctogramMeshMaker.turn(
+                    vs[prev_indices[a]], vs[a], vs[c]) <= 0.0
+                is_reflex[c] = OctogramMeshMaker.turn(
+                    vs[a], vs[c], vs[next_indices[c]]) <= 0.0
+
+                # Skip past the neighbor so that successive ears come
+                # from around the outline rather than fanning from one.
+                i = next_indices[c]
+            else:
+                i = c
+                misses = misses + 1
+
+        fs.append((prev_indices[i], i, next_indices[i]))
+        return tuple(fs)
+
+    @staticmethod
+    def calc_ribbon(
+            vs, vts, is_closed, width, join_type,
+            uv_scale, uv_cosa=1.0, uv_sina=0.0):
+        # Offsets the outline by half the width to either side. Each
+        # join has one vertex on its inner side and one or more on its
+        # outer side. Miters longer than four half widths are beveled,
+        # as in SVG. Texture coordinates are offset from those of the
+        # outline, so the ribbon keeps the shape's planar projection.
+        len_vs = len(vs)
+        half_width = max(0.000001, width * 0.5)
+        miter_limit = 4.0
+        round_step = math.pi / 12.0
+
+        # Find the unit direction of the edge leaving each vertex. An
+        # open outline's last vertex reuses the direction of its last
+        # edge, so its ends are cut square.
+        len_edges = len_vs
+        if not is_closed:
+            len_edges = len_vs - 1
+        dirs = [(1.0, 0.0)] * len_vs
+        i = 0
+        while i < len_edges:
+            v_curr = vs[i]
+            v_next = vs[(i + 1) % len_vs]
+            dx = v_next[0] - v_curr[0]
+            dy = v_next[1] - v_curr[1]
+            mag = math.sqrt(dx * dx + dy * dy)
+            if mag > 0.000001:
+                dirs[i] = (dx / mag, dy / mag)
+            i = i + 1
+        if not is_closed and len_vs > 1:
+            dirs[len_vs - 1] = dirs[len_vs - 2]
+
+        rvs = []
+        rvts = []
+        rights = [None] * len_vs
+        lefts = [None] * len_vs
+        fs = []
+
+        i = 0
+        while i < len_vs:
+            v = vs[i]
+            d1 = dirs[i]
+            d0 = dirs[(i - 1) % len_vs]
+            if not is_closed and i == 0:
+                d0 = d1
+
+            # Normals point to the left of each edge.
+            n0 = (-d0[1], d0[0])
+            n1 = (-d1[1], d1[0])
+            cross = d0[0] * d1[1] - d0[1] * d1[0]
+            dot = d0[0] * d1[0] + d0[1] * d1[1]
+
+            # The miter bisects the two normals. Its length is the half
+            # width over the cosine of half the turn.
+            mx = n0[0] + n1[0]
+            my = n0[1] + n1[1]
+            m_mag = math.sqrt(mx * mx + my * my)
+            cos_half = 0.0
+            if m_mag > 0.000001:
+                mx = mx / m_mag
+                my = my / m_mag
+                cos_half = mx * n0[0] + my * n0[1]
+
+            # For a left turn, the right side is outer.
+            side = 1.0
+            if cross < 0.0:
+                side = -1.0
+
+            # Shallow turns are mitered whatever the join type, since a
+            # rounded join would be indistinguishable.
+            angle = math.atan2(abs(cross), dot)
+            offsets = []
+            if cos_half * miter_limit >= 1.0 \
+                and (join_type == "MITER"
+                    or angle <= round_step + 0.000001):
+                miter_len = half_width / cos_half
+                offsets.append((-side * mx * miter_len,
+                                -side * my * miter_len))
+            elif join_type == "ROUND":
+                # A turn of a whole number of steps is not given an
+                # extra step by rounding error.
+                count = max(1, math.ceil(angle / round_step - 0.000001))
+                to_angle = side * angle / count
+                k = 0
+                while k < count + 1:
+                    a = k * to_angle
+                    cosa = math.cos(a)
+                    sina = math.sin(a)
+                    offsets.append((
+                        -side * half_width * (cosa * n0[0] - sina * n0[1]),
+                        -side * half_width * (cosa * n0[1] + sina * n0[0])))
+                    k = k + 1
+            else:
+                offsets.append((-side * half_width * n0[0],
+                                -side * half_width * n0[1]))
+                offsets.append((-side * half_width * n1[0],
+                                -side * half_width * n1[1]))
+
+            inner = (side * half_width * n0[0],
+                     side * half_width * n0[1])
+            if cos_half > 0.000001:
+                inner_len = half_width / cos_half
+                inner = (side * mx * inner_len,
+                         side * my * inner_len)
+
+            start = len(rvs)
+            for offset in [inner] + offsets:
+                rvs.append((v[0] + offset[0], v[1] + offset[1], 0.0))
+                du = uv_cosa * offset[0] - uv_sina * offset[1]
+                dv = uv_cosa * offset[1] + uv_sina * offset[0]
+                rvts.append((
+                    vts[i][0] + uv_scale * du,
+                    vts[i][1] + uv_scale * dv))
+            len_offsets = len(offsets)
+            outer_indices = list(range(start + 1, start + 1 + len_offsets))
+
+            if side > 0.0:
+                lefts[i] = [start]
+                rights[i] = outer_indices
+            else:
+                lefts[i] = outer_indices
+                rights[i] = [start]
+
+            # Fill the join between the outer vertices with a fan from
+            # the inner vertex.
+            k = 0
+            while k < len_offsets - 1:
+                if side > 0.0:
+                    fs.append((
+                        start,
+                        outer_indices[k],
+                        outer_indices[k + 1]))
+                else:
+                    fs.append((
+                        start,
+                        outer_indices[k + 1],
+                        outer_indices[k]))
+                k = k + 1
+
+            i = i + 1
+
+        i = 0
+        while i < len_edges:
+            j = (i + 1) % len_vs
+            fs.append((
+                rights[i][-1],
+                rights[j][0],
+                lefts[j][0],
+                lefts[i][-1]))
+            i = i + 1
+
+        return rvs, rvts, fs
+
     @staticmethod
     def translate2(v, t):
         return (v[0] + t[0], v[1] + t[1])
@@ -303,13 +553,20 @@ class OctogramMeshMaker(bpy.types.Operator):
                     (g * 2 + idx_offset + 1) % (len_vs - 1),
                     (g * 2 + idx_offset + 2) % (len_vs - 1))
                 g = g + 1
-
+        elif face_type == "EAR_CLIP":
+            fs = OctogramMeshMaker.ear_clip(vs)
+        elif face_type == "RIBBON":
+            vs, vts, fs = OctogramMeshMaker.calc_ribbon(
+                vs, vts, True, self.stroke_width, self.join_type,
+                0.5 / radius)
+            vns = [(0.0, 0.0, 1.0)] * len(vs)
 
         bm = OctogramMeshMaker.mesh_data_to_bmesh(
             vs, vts, vns,
             fs, fs, fs)
 
         mesh_data = bpy.data.meshes.new("Octogram")
+        mesh_data["generator"] = OctogramMeshMaker.bl_idname
         bm.to_mesh(mesh_data)
         bm.free()
 
@@ -334,4 +591,4 @@ def register():
 
 def unregister():
     bpy.utils.unregister_class(OctogramMeshMaker)
-    bpy.types.VIEW3D_MT_meshs_add.remove(menu_func)
\ No newline at end of file
+    bpy.types.VIEW3D_MT_mesh_add.remove(menu_func)
\ No newline at end of file
@@ -1,5 +1,6 @@
 import bpy # type: ignore
 import bmesh # type: ignore
+import functools
 import math
 from bpy.props import ( # type: ignore
     FloatProperty,
@@ -67,6 +68,13 @@ class PolarGridMaker(bpy.types.Operator):
         size=2,
         subtype="TRANSLATION") # type: ignore
 
+    lod_levels: IntProperty(
+        name="LOD Levels",
+        description="Number of levels of detail, each with half the sectors of the last",
+        min=1,
+        max=8,
+        default=1) # type: ignore
+
     @staticmethod
     def mesh_data_to_bmesh(
             vs, vts, vns,
@@ -110,28 +118,68 @@ class PolarGridMaker(bpy.types.Operator):
 
         return bm
 
-    def execute(self, context):
-        rings = max(1, self.rings)
-        sectors = max(3, self.sectors)
-        max_radius = max(0.000002, self.radius)
-        offset_angle = self.offset_angle
-        origin = self.origin
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def face_indices(rings, sectors):
+        # Face indices depend only on the ring and sector counts.
+        ring_sec = rings * sectors
+        num_tris = sectors
+        num_quads = ring_sec - sectors
+        len_fs = num_tris + num_quads
+        fs = [(0, 0, 0, 0)] * len_fs
+
+        j = 0
+        while j < num_tris:
+            fs[j] = ( # type: ignore
+                0,
+                1 + j % sectors,
+                1 + (j + 1) % sectors)
+            j = j + 1
+
+        i = 0
+        while i < num_quads:
+            sector = i % sectors
+            ring = i // sectors
+
+            fs[num_tris + i] = (
+                ring * sectors + 1 + sector,
+                (ring + 1) * sectors + 1 + sector,
+                (ring + 1) * sectors + 1 + (sector + 1) % sectors,
+                ring * sectors + 1 + (sector + 1) % sectors)
+
+            i = i + 1
+
+        return tuple(fs)
+
+    @staticmethod
+    def sample_circle(sectors, offset_angle):
+        to_sector_theta = math.tau / sectors
+        unit_circle = [(1.0, 0.0)] * sectors
+        j = 0
+        while j < sectors:
+            theta = offset_angle + j * to_sector_theta
+            unit_circle[j] = (math.cos(theta), math.sin(theta))
+            j = j + 1
+        return unit_circle
 
+    @staticmethod
+    def calc_grid(rings, sectors, max_radius, origin, unit_circle, stride):
+        # Sector j of this grid uses sample j * stride of the unit circle,
+        # so a coarse grid can share the samples of a finer one.
         min_radius = max_radius / rings
         vt_max_radius = 0.5
         vt_min_radius = vt_max_radius / rings
 
-        to_sector_theta = math.tau / sectors
         to_ring_fac = 1.0
         if rings != 1:
             to_ring_fac = 1.0 / (rings - 1.0)
 
         ring_sec = rings * sectors
 
+        # The center vertex is placed at the origin, as are the rings.
         len_vs = 1 + ring_sec
-        vs = [(0.0, 0.0, 0.0)] * len_vs
+        vs = [(origin[0], origin[1], 0.0)] * len_vs
         vts = [(0.5, 0.5)] * len_vs
-        vns = [(0.0, 0.0, 1.0)] * len_vs
 
         k = 0
         while k < ring_sec:
@@ -142,10 +190,8 @@ class PolarGridMaker(bpy.types.Operator):
             u = 1.0 - t
             radius = u * min_radius + t * max_radius
             vt_radius = u * vt_min_radius + t * vt_max_radius
-            theta = offset_angle + sector * to_sector_theta
 
-            cosa = math.cos(theta)
-            sina = math.sin(theta)
+            cosa, sina = unit_circle[sector * stride]
 
             vs[1 + k] = (
                 origin[0] + radius * cosa,
@@ -155,46 +201,80 @@ class PolarGridMaker(bpy.types.Operator):
 
             k = k + 1
 
-        num_tris = sectors
-        num_quads = ring_sec - sectors
-        len_fs = num_tris + num_quads
-        fs = [(0, 0, 0, 0)] * len_fs
-
-        j = 0
-        while j < num_tris:
-            fs[j] = ( # type: ignore
-                0,
-                1 + j % sectors,
-                1 + (j + 1) % sectors)
-            j = j + 1
-
-        i = 0
-        while i < num_quads:
-            sector = i % sectors
-            ring = i // sectors
-
-            fs[num_tris + i] = (
-                ring * sectors + 1 + sector,
-                (ring + 1) * sectors + 1 + sector,
-                (ring + 1) * sectors + 1 + (sector + 1) % sectors,
-                ring * sectors + 1 + (sector + 1) % sectors)
-
-            i = i + 1
-
-        bm = PolarGridMaker.mesh_data_to_bmesh(
-            vs, vts, vns,
-            fs, fs, fs)
-
-        mesh_data = bpy.data.meshes.new("Polar.Grid")
-        bm.to_mesh(mesh_data)
-        bm.free()
+        return vs, vts
 
+    def execute(self, context):
+        rings = max(1, self.rings)
+        sectors = max(3, self.sectors)
+        max_radius = max(0.000002, self.radius)
+        offset_angle = self.offset_angle
+        origin = self.origin
+        lod_levels = max(1, self.lod_levels)
+
+        unit_circle = PolarGridMaker.sample_circle(sectors, offset_angle)
+
+        mesh_datas = []
+        lod = 0
+        while lod < lod_levels:
+            stride = 1 << lod
+            sectors_lod = sectors // stride
+            if lod > 0 and sectors_lod < 3:
+                break
+
+            # When the sector count does not divide evenly, this level
+            # is sampled on its own rather than from the finest level.
+            lod_circle = unit_circle
+            if sectors % stride != 0:
+                lod_circle = PolarGridMaker.sample_circle(
+                    sectors_lod, offset_angle)
+                stride = 1
+
+            vs, vts = PolarGridMaker.calc_grid(
+                rings, sectors_lod, max_radius, origin,
+                lod_circle, stride)
+            vns = [(0.0, 0.0, 1.0)] * len(vs)
+            fs = PolarGridMaker.face_indices(rings, sectors_lod)
+
+            bm = PolarGridMaker.mesh_data_to_bmesh(
+                vs, vts, vns,
+                fs, fs, fs)
+
+            mesh_name = "Polar.Grid"
+            if lod_levels > 1:
+                mesh_name = "Polar.Grid.LOD{}".format(lod)
+            mesh_data = bpy.data.meshes.new(mesh_name)
+            mesh_data["generator"] = PolarGridMaker.bl_idname
+            bm.to_mesh(mesh_data)
+            bm.free()
+
+            mesh_datas.append(mesh_data)
+            lod = lod + 1
+
+        mesh_data = mesh_datas[0]
         mesh_obj = bpy.data.objects.new(mesh_data.name, mesh_data)
         mesh_obj.location = context.scene.cursor.location
         context.collection.objects.link(mesh_obj)
 
+        if len(mesh_datas) > 1:
+            PolarGridMaker.tag_lods(mesh_obj, mesh_datas)
+
         return {"FINISHED"}
 
+    @staticmethod
+    def tag_lods(obj, mesh_datas):
+        # Meshes not assigned to the object are kept with a fake user so
+        # they survive saving. A level of detail switcher swaps between
+        # the meshes listed on the object.
+        names = [""] * len(mesh_datas)
+        k = 0
+        for mesh_data in mesh_datas:
+            mesh_data["lod_level"] = k
+            mesh_data.use_fake_user = True
+            names[k] = mesh_data.name
+            k = k + 1
+        obj["lod_meshes"] = names
+        obj["lod_level"] = 0
+
     @classmethod
     def poll(cls, context):
         return context.area.type == "VIEW_3D"
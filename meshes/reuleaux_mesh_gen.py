@@ -308,6 +308,7 @@ class ReuleauxMeshMaker(bpy.types.Operator):
             fs, fs, fs)
 
         mesh_data = bpy.data.meshes.new("Reuleaux Triangle")
+        mesh_data["generator"] = ReuleauxMeshMaker.bl_idname
         bm.to_mesh(mesh_data)
         bm.free()
 
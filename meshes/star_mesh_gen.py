@@ -1,7 +1,9 @@
 import bpy # type: ignore
 import bmesh # type: ignore
+import functools
 import math
 from bpy.props import ( # type: ignore
+    BoolProperty,
     EnumProperty,
     FloatProperty,
     FloatVectorProperty,
@@ -82,11 +84,53 @@ class StarMeshMaker(bpy.types.Operator):
     face_type: EnumProperty(
         items=[
             ("NGON", "NGon", "Fill with an ngon", 1),
-            ("STROKE", "Stroke", "Connect vertices with edges only", 2)],
+            ("STROKE", "Stroke", "Connect vertices with edges only", 2),
+            ("TRI_FAN", "Tri Fan", "Fill with triangles sharing a central vertex", 3),
+            ("TRIS", "Tris", "Fill with triangles clipped from the outline", 4),
+            ("RIBBON", "Ribbon", "Connect vertices with a strip of constant width", 5)],
         name="Face Type",
         default="NGON",
         description="How to fill the star") # type: ignore
 
+    stroke_width: FloatProperty(
+        name="Width",
+        description="Ribbon width",
+        min=0.0001,
+        soft_max=1.0,
+        step=1,
+        precision=3,
+        default=0.05) # type: ignore
+
+    join_type: EnumProperty(
+        items=[
+            ("MITER", "Miter", "Extend the sides of a ribbon to a point", 1),
+            ("ROUND", "Round", "Round the outer corners of a ribbon", 2)],
+        name="Join",
+        default="MITER",
+        description="How to join the sides of a ribbon at a corner") # type: ignore
+
+    animate: BoolProperty(
+        name="Animate",
+        description="Store parameters on the object so they can be keyframed",
+        default=False) # type: ignore
+
+    sweep_count: IntProperty(
+        name="Shape Keys",
+        description="Number of shape keys to bake from the inset to the sweep target",
+        min=0,
+        soft_max=32,
+        default=0) # type: ignore
+
+    sweep_stop: FloatProperty(
+        name="Sweep To",
+        description="Inset of the last shape key",
+        min=0.0,
+        max=1.0,
+        step=1,
+        precision=3,
+        subtype="FACTOR",
+        default=0.25) # type: ignore
+
     @staticmethod
     def mesh_data_to_bmesh(
             vs, vts, vns,
@@ -136,14 +180,293 @@ class StarMeshMaker(bpy.types.Operator):
 
         return bm
 
-    def execute(self, context):
-        sectors = self.sectors
-        skip = self.skip
-        radius = max(0.000001, self.radius)
-        inset = self.inset
-        offset_angle = self.offset_angle
-        origin = self.origin
-        face_type = self.face_type
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def face_indices(face_type, len_vs):
+        # Face indices depend only on the face type and vertex count.
+        fs = []
+        if face_type == "NGON":
+            f = [0] * len_vs
+            k = 0
+            while k < len_vs:
+                f[k] = k
+                k = k + 1
+            fs = [tuple(f)]
+        elif face_type == "TRI_FAN":
+            # A star is star-shaped about its center, so a fan from the
+            # center, appended as the last vertex, is always valid.
+            len_fs = len_vs - 1
+            fs = [(0, 0, 0)] * len_fs
+            k = 0
+            while k < len_fs:
+                fs[k] = (
+                    len_vs - 1,
+                    k % (len_vs - 1),
+                    (k + 1) % (len_vs - 1))
+                k = k + 1
+        return tuple(fs)
+
+    @staticmethod
+    def turn(a, b, c):
+        return (b[0] - a[0]) * (c[1] - b[1]) \
+            - (b[1] - a[1]) * (c[0] - b[0])
+
+    @staticmethod
+    def ear_clip(vs):
+        # Vertices are removed from a linked list of indices, so that
+        # clipping an ear does not shift the rest. Only reflex vertices
+        # can lie inside an ear, so only they are tested. The outline
+        # is assumed to wind counter-clockwise.
+        len_vs = len(vs)
+        if len_vs < 3:
+            return tuple()
+
+        prev_indices = [0] * len_vs
+        next_indices = [0] * len_vs
+        is_reflex = [False] * len_vs
+        k = 0
+        while k < len_vs:
+            prev_indices[k] = (k - 1) % len_vs
+            next_indices[k] = (k + 1) % len_vs
+            is_reflex[k] = StarMeshMaker.turn(
+                vs[(k - 1) % len_vs],
+                vs[k],
+                vs[(k + 1) % len_vs]) <= 0.0
+            k = k + 1
+
+        fs = []
+        remaining = len_vs
+        misses = 0
+        i = 0
+        while remaining > 3:
+            a = prev_indices[i]
+            c = next_indices[i]
+
+            is_ear = not is_reflex[i]
+            if is_ear:
+                va = vs[a]
+                vb = vs[i]
+                vc = vs[c]
+                j = next_indices[c]
+                while j != a:
+                    if is_reflex[j]:
+                        vj = vs[j]
+                        if StarMeshMaker.turn(va, vb, vj) >= 0.0 \
+                            and StarMeshMaker.turn(vb, vc, vj) >= 0.0 \
+                            and StarMeshMaker.turn(vc, va, vj) >= 0.0:
+                            is_ear = False
+                            break
+                    j = next_indices[j]
+
+            # A full lap without an ear means the outline is degenerate,
+            # so clip anyway rather than loop forever.
+            if is_ear or misses > remaining:
+                fs.append((a, i, c))
+                next_indices[a] = c
+                prev_indices[c] = a
+                remaining = remaining - 1
+                misses = 0
+
+                is_reflex[a] = StarMeshMaker.turn(
+                    vs[prev_indices[a]], vs[a], vs[c]) <= 0.0
+                is_reflex[c] = StarMeshMaker.turn(
+                    vs[a], vs[c], vs[next_indices[c]]) <= 0.0
+
+                # Skip past the neighbor so that successive ears come
+                # from around the outline rather than fanning from one.
+                i = next_indices[c]
+            else:
+                i = c
+                misses = misses + 1
+
+        fs.append((prev_indices[i], i, next_indices[i]))
+        return tuple(fs)
+
+    @staticmethod
+    def calc_fill(face_type, vs, vts, radius, stroke_width, join_type):
+        # Ears and ribbons depend on coordinates, not only on the vertex
+        # count, so they are not cached.
+        if face_type == "TRIS":
+            return vs, vts, StarMeshMaker.ear_clip(vs)
+        if face_type == "RIBBON":
+            return StarMeshMaker.calc_ribbon(
+                vs, vts, True, stroke_width, join_type,
+                0.5 / max(0.000001, radius))
+        return vs, vts, StarMeshMaker.face_indices(face_type, len(vs))
+
+    @staticmethod
+    def calc_ribbon(
+            vs, vts, is_closed, width, join_type,
+            uv_scale, uv_cosa=1.0, uv_sina=0.0):
+        # Offsets the outline by half the width to either side. Each
+        # join has one vertex on its inner side and one or more on its
+        # outer side. Miters longer than four half widths are beveled,
+        # as in SVG. Texture coordinates are offset from those of the
+        # outline, so the ribbon keeps the shape's planar projection.
+        len_vs = len(vs)
+        half_width = max(0.000001, width * 0.5)
+        miter_limit = 4.0
+        round_step = math.pi / 12.0
+
+        # Find the unit direction of the edge leaving each vertex. An
+        # open outline's last vertex reuses the direction of its last
+        # edge, so its ends are cut square.
+        len_edges = len_vs
+        if not is_closed:
+            len_edges = len_vs - 1
+        dirs = [(1.0, 0.0)] * len_vs
+        i = 0
+        while i < len_edges:
+            v_curr = vs[i]
+            v_next = vs[(i + 1) % len_vs]
+            dx = v_next[0] - v_curr[0]
+            dy = v_next[1] - v_curr[1]
+            mag = math.sqrt(dx * dx + dy * dy)
+            if mag > 0.000001:
+                dirs[i] = (dx / mag, dy / mag)
+            i = i + 1
+        if not is_closed and len_vs > 1:
+            dirs[len_vs - 1] = dirs[len_vs - 2]
+
+        rvs = []
+        rvts = []
+        rights = [None] * len_vs
+        lefts = [None] * len_vs
+        fs = []
+
+        i = 0
+        while i < len_vs:
+            v = vs[i]
+            d1 = dirs[i]
+            d0 = dirs[(i - 1) % len_vs]
+            if not is_closed and i == 0:
+                d0 = d1
+
+            # Normals point to the left of each edge.
+            n0 = (-d0[1], d0[0])
+            n1 = (-d1[1], d1[0])
+            cross = d0[0] * d1[1] - d0[1] * d1[0]
+            dot = d0[0] * d1[0] + d0[1] * d1[1]
+
+            # The miter bisects the two normals. Its length is the half
+            # width over the cosine of half the turn.
+            mx = n0[0] + n1[0]
+            my = n0[1] + n1[1]
+            m_mag = math.sqrt(mx * mx + my * my)
+            cos_half = 0.0
+            if m_mag > 0.000001:
+                mx = mx / m_mag
+                my = my / m_mag
+                cos_half = mx * n0[0] + my * n0[1]
+
+            # For a left turn, the right side is outer.
+            side = 1.0
+            if cross < 0.0:
+                side = -1.0
+
+            # Shallow turns are mitered whatever the join type, since a
+            # rounded join would be indistinguishable.
+            angle = math.atan2(abs(cross), dot)
+            offsets = []
+            if cos_half * miter_limit >= 1.0 \
+                and (join_type == "MITER"
+                    or angle <= round_step + 0.000001):
+                miter_len = half_width / cos_half
+                offsets.append((-side * mx * miter_len,
+                                -side * my * miter_len))
+            elif join_type == "ROUND":
+                # A turn of a whole number of steps is not given an
+                # extra step by rounding error.
+                count = max(1, math.ceil(angle / round_step - 0.000001))
+                to_angle = side * angle / count
+                k = 0
+                while k < count + 1:
+                    a = k * to_angle
+                    cosa = math.cos(a)
+                    sina = math.sin(a)
+                    offsets.append((
+                        -side * half_width * (cosa * n0[0] - sina * n0[1]),
+                        -side * half_width * (cosa * n0[1] + sina * n0[0])))
+                    k = k + 1
+            else:
+                offsets.append((-side * half_width * n0[0],
+                                -side * half_width * n0[1]))
+                offsets.append((-side * half_width * n1[0],
+                                -side * half_width * n1[1]))
+
+            inner = (side * half_width * n0[0],
+                     side * half_width * n0[1])
+            if cos_half > 0.000001:
+                inner_len = half_width / cos_half
+                inner = (side * mx * inner_len,
+                         side * my * inner_len)
+
+            start = len(rvs)
+            for offset in [inner] + offsets:
+                rvs.append((v[0] + offset[0], v[1] + offset[1], 0.0))
+                du = uv_cosa * offset[0] - uv_sina * offset[1]
+                dv = uv_cosa * offset[1] + uv_sina * offset[0]
+                rvts.append((
+                    vts[i][0] + uv_scale * du,
+                    vts[i][1] + uv_scale * dv))
+            len_offsets = len(offsets)
+            outer_indices = list(range(start + 1, start + 1 + len_offsets))
+
+            if side > 0.0:
+                lefts[i] = [start]
+                rights[i] = outer_indices
+            else:
+                lefts[i] = outer_indices
+                rights[i] = [start]
+
+            # Fill the join between the outer vertices with a fan from
+            # the inner vertex.
+            k = 0
+            while k < len_offsets - 1:
+                if side > 0.0:
+                    fs.append((
+                        start,
+                        outer_indices[k],
+                        outer_indices[k + 1]))
+                else:
+                    fs.append((
+                        start,
+                        outer_indices[k + 1],
+                        outer_indices[k]))
+                k = k + 1
+
+            i = i + 1
+
+        i = 0
+        while i < len_edges:
+            j = (i + 1) % len_vs
+            fs.append((
+                rights[i][-1],
+                rights[j][0],
+                lefts[j][0],
+                lefts[i][-1]))
+            i = i + 1
+
+        return rvs, rvts, fs
+
+    @staticmethod
+    def bake_shape_keys(obj, names, vs_sweep):
+        if obj.data.shape_keys is None:
+            obj.shape_key_add(name="Basis", from_mix=False)
+
+        len_keys = len(names)
+        k = 0
+        while k < len_keys:
+            shape_key = obj.shape_key_add(name=names[k], from_mix=False)
+            shape_key.data.foreach_set(
+                "co", [c for v in vs_sweep[k] for c in v])
+            k = k + 1
+
+    @staticmethod
+    def calc_star(
+            sectors, skip, radius, inset, offset_angle, origin,
+            use_central_vert=False):
+        radius = max(0.000001, radius)
 
         x_center = origin[0]
         y_center = origin[1]
@@ -162,7 +485,6 @@ class StarMeshMaker(bpy.types.Operator):
 
         vs = [(0.0, 0.0, 0.0)] * len_vs
         vts = [(0.5, 0.5)] * len_vs
-        vns = [(0.0, 0.0, 1.0)] * len_vs
 
         to_theta = math.tau / len_vs
 
@@ -203,14 +525,84 @@ class StarMeshMaker(bpy.types.Operator):
                     0.5 + vt_radius * cos_a,
                     0.5 + vt_radius * sin_a)
 
-        fs = []
-        if face_type == "NGON":
-            f = [0] * len_vs
-            k = 0
-            while k < len_vs:
-                f[k] = k
-                k = k + 1
-            fs = [tuple(f)]
+        if use_central_vert:
+            vs.append((x_center, y_center, 0.0))
+            vts.append((0.5, 0.5))
+
+        return vs, vts, not_valid
+
+    @staticmethod
+    def update_object(obj):
+        # Rewrites the coordinates of an animated star in place from the
+        # parameters stored on its object. The mesh is only rebuilt if
+        # the vertex count, or the faces that depend on coordinates,
+        # have changed.
+        mesh_data = obj.data
+        face_type = obj.get("face_type", "NGON")
+        radius = obj.get("radius", 0.5)
+        vs, vts, not_valid = StarMeshMaker.calc_star(
+            obj.get("sectors", 5),
+            obj.get("skip", (1, 1)),
+            radius,
+            obj.get("inset", 0.5),
+            obj.get("offset_angle", math.pi * 0.5),
+            obj.get("origin", (0.0, 0.0)),
+            face_type == "TRI_FAN")
+        vs, vts, fs = StarMeshMaker.calc_fill(
+            face_type, vs, vts, radius,
+            obj.get("stroke_width", 0.05),
+            obj.get("join_type", "MITER"))
+        len_vs = len(vs)
+
+        is_changed = len_vs != len(mesh_data.vertices)
+        if not is_changed \
+            and (face_type == "TRIS" or face_type == "RIBBON"):
+            len_loops = len(mesh_data.loops)
+            loop_vs = [0] * len_loops
+            mesh_data.loops.foreach_get("vertex_index", loop_vs)
+            is_changed = loop_vs != [h for f in fs for h in f]
+
+        if is_changed:
+            vns = [(0.0, 0.0, 1.0)] * len_vs
+            bm = StarMeshMaker.mesh_data_to_bmesh(
+                vs, vts, vns,
+                fs, fs, fs)
+            bm.to_mesh(mesh_data)
+            bm.free()
+            return
+
+        mesh_data.vertices.foreach_set(
+            "co", [c for v in vs for c in v])
+
+        uv_layer = mesh_data.uv_layers.active
+        len_loops = len(mesh_data.loops)
+        if uv_layer is not None and len_loops > 0:
+            loop_vs = [0] * len_loops
+            mesh_data.loops.foreach_get("vertex_index", loop_vs)
+            uv_layer.data.foreach_set(
+                "uv", [c for h in loop_vs for c in vts[h]])
+
+        mesh_data.update()
+
+    def execute(self, context):
+        sectors = self.sectors
+        skip = self.skip
+        radius = max(0.000001, self.radius)
+        inset = self.inset
+        offset_angle = self.offset_angle
+        origin = self.origin
+        face_type = self.face_type
+        stroke_width = self.stroke_width
+        join_type = self.join_type
+        use_central_vert = face_type == "TRI_FAN"
+
+        vs, vts, not_valid = StarMeshMaker.calc_star(
+            sectors, skip, radius, inset, offset_angle, origin,
+            use_central_vert)
+        vs, vts, fs = StarMeshMaker.calc_fill(
+            face_type, vs, vts, radius, stroke_width, join_type)
+        len_vs = len(vs)
+        vns = [(0.0, 0.0, 1.0)] * len_vs
 
         bm = StarMeshMaker.mesh_data_to_bmesh(
             vs, vts, vns,
@@ -235,6 +627,7 @@ class StarMeshMaker(bpy.types.Operator):
             else:
                 mesh_name = "Polygon"
         mesh_data = bpy.data.meshes.new(mesh_name)
+        mesh_data["generator"] = StarMeshMaker.bl_idname
         bm.to_mesh(mesh_data)
         bm.free()
 
@@ -242,6 +635,54 @@ class StarMeshMaker(bpy.types.Operator):
         mesh_obj.location = context.scene.cursor.location
         context.collection.objects.link(mesh_obj)
 
+        sweep_count = max(0, self.sweep_count)
+        if sweep_count > 0 and not not_valid:
+            # Insets strictly between zero and one share a topology, so
+            # the sweep can be written as shape keys on the same mesh.
+            inset_dest = self.sweep_stop
+            names = []
+            vs_sweep = []
+
+            k = 0
+            while k < sweep_count:
+                t = (k + 1.0) / sweep_count
+                inset_k = (1.0 - t) * inset + t * inset_dest
+                vs_k, vts_k, not_valid_k = StarMeshMaker.calc_star(
+                    sectors, skip, radius, inset_k, offset_angle, origin,
+                    use_central_vert)
+                vs_k, _, fs_k = StarMeshMaker.calc_fill(
+                    face_type, vs_k, vts_k, radius, stroke_width, join_type)
+                if not_valid_k or len(vs_k) != len_vs:
+                    self.report(
+                        {"WARNING"},
+                        "Skipped inset {:.3f}, vertex count differs".format(
+                            inset_k))
+                elif fs_k != fs:
+                    self.report(
+                        {"WARNING"},
+                        "Skipped inset {:.3f}, faces differ".format(
+                            inset_k))
+                else:
+                    names.append("Inset {:.3f}".format(inset_k))
+                    vs_sweep.append(vs_k)
+                k = k + 1
+
+            StarMeshMaker.bake_shape_keys(mesh_obj, names, vs_sweep)
+
+        if self.animate:
+            # Custom properties on the object can be keyframed. The frame
+            # change handler reads them back to rewrite coordinates.
+            mesh_obj["generator"] = StarMeshMaker.bl_idname
+            mesh_obj["sectors"] = sectors
+            mesh_obj["skip"] = (skip[0], skip[1])
+            mesh_obj["radius"] = radius
+            mesh_obj["inset"] = inset
+            mesh_obj["offset_angle"] = offset_angle
+            mesh_obj["origin"] = (origin[0], origin[1])
+            mesh_obj["face_type"] = face_type
+            mesh_obj["stroke_width"] = stroke_width
+            mesh_obj["join_type"] = join_type
+
         return {"FINISHED"}
 
     @classmethod
@@ -249,6 +690,14 @@ class StarMeshMaker(bpy.types.Operator):
         return context.area.type == "VIEW_3D"
 
 
+@bpy.app.handlers.persistent
+def frame_change_post(scene, depsgraph=None):
+    for obj in scene.objects:
+        if obj.get("generator") == StarMeshMaker.bl_idname \
+            and obj.type == "MESH":
+            StarMeshMaker.update_object(obj)
+
+
 def menu_func(self, context):
     self.layout.operator(StarMeshMaker.bl_idname, icon="MESH_DATA")
 
@@ -256,8 +705,10 @@ def menu_func(self, context):
 def register():
     bpy.utils.register_class(StarMeshMaker)
     bpy.types.VIEW3D_MT_mesh_add.append(menu_func)
+    bpy.app.handlers.frame_change_post.append(frame_change_post)
 
 
 def unregister():
     bpy.utils.unregister_class(StarMeshMaker)
-    bpy.types.VIEW3D_MT_mesh_add.remove(menu_func)
\ No newline at end of file
+    bpy.types.VIEW3D_MT_mesh_add.remove(menu_func)
+    bpy.app.handlers.frame_change_post.remove(frame_change_post)
\ No newline at end of file
@@ -0,0 +1,672 @@
+import bpy # type: ignore
+import math
+from bpy.props import ( # type: ignore
+    BoolProperty,
+    EnumProperty,
+    FloatProperty,
+    FloatVectorProperty,
+    IntProperty,
+    IntVectorProperty)
+
+bl_info = {
+    "name": "Create Tiling Mesh",
+    "author": "Jeremy Behreandt",
+    "version": (0, 1),
+    "blender": (4, 5, 2),
+    "category": "Add Mesh",
+    "description": "Creates a mesh tiling of octograms or stars.",
+    "tracker_url": "https://github.com/behreajj/blendergeom"
+}
+
+
+class TilingMeshMaker(bpy.types.Operator):
+    """Creates a mesh tiling of octograms or stars"""
+
+    bl_idname = "mesh.primitive_tiling_add"
+    bl_label = "Tiling"
+    bl_options = {"REGISTER", "UNDO"}
+
+    motif: EnumProperty(
+        items=[
+            ("OCTOGRAM", "Octogram", "Octogram, or Rub el Hizb", 1),
+            ("STAR", "Star", "Star", 2)],
+        name="Motif",
+        default="OCTOGRAM",
+        description="Shape placed on each tile") # type: ignore
+
+    sub_type: EnumProperty(
+        items=[
+            ("COMPOUND", "Compound", "Compound", 1),
+            ("COMPOUND_INVERSE", "Compound Inverse", "Compound inverse", 2),
+            ("ISOGONAL", "Isogonal", "Isogonal", 3),
+            ("ISOTOXAL", "Isotoxal", "Isotoxal", 4)],
+        name="Type",
+        default="COMPOUND",
+        description="Type of octogram") # type: ignore
+
+    sectors: IntProperty(
+        name="Vertices",
+        description="Number of star points",
+        min=3,
+        soft_max=32,
+        default=6,
+        step=1) # type: ignore
+
+    inset: FloatProperty(
+        name="Inset",
+        description="Radius factor for inset star vertices",
+        min=0.0,
+        max=1.0,
+        step=1,
+        precision=3,
+        subtype="FACTOR",
+        default=0.5) # type: ignore
+
+    lattice: EnumProperty(
+        items=[
+            ("SQUARE", "Square", "Tiles in rows and columns", 1),
+            ("HEX", "Hexagonal", "Tiles in rows offset by half a tile", 2)],
+        name="Lattice",
+        default="SQUARE",
+        description="Arrangement of tiles") # type: ignore
+
+    count: IntVectorProperty(
+        name="Count",
+        description="Number of columns and rows",
+        default=(4, 4),
+        min=1,
+        soft_max=64,
+        size=2) # type: ignore
+
+    spacing: FloatProperty(
+        name="Spacing",
+        description="Distance between tile centers as a factor of the motif's diameter",
+        min=0.0001,
+        soft_max=4.0,
+        step=1,
+        precision=3,
+        default=1.0) # type: ignore
+
+    radius: FloatProperty(
+        name="Radius",
+        description="Motif radius",
+        min=0.0001,
+        soft_max=100.0,
+        step=1,
+        precision=3,
+        default=0.5) # type: ignore
+
+    offset_angle: FloatProperty(
+        name="Angle",
+        description="Motif offset angle",
+        soft_min=0.0,
+        soft_max=math.tau,
+        step=57.2958,
+        default=0.0,
+        subtype="ANGLE",
+        unit="ROTATION") # type: ignore
+
+    origin: FloatVectorProperty(
+        name="Origin",
+        description="Tiling origin",
+        default=(0.0, 0.0),
+        step=1,
+        precision=3,
+        size=2,
+        subtype="TRANSLATION") # type: ignore
+
+    face_type: EnumProperty(
+        items=[
+            ("NGON", "NGon", "Fill with an ngon", 1),
+            ("TRI_FAN", "Tris", "Fill with triangles sharing a central vertex", 2),
+            ("STROKE", "Stroke", "Connect vertices with edges only", 3)],
+        name="Face Type",
+        default="NGON",
+        description="How to fill each motif") # type: ignore
+
+    fill_gaps: BoolProperty(
+        name="Fill Gaps",
+        description="Fill the gaps between motifs, so that neighboring tiles share edges",
+        default=True) # type: ignore
+
+    @staticmethod
+    def calc_motif(motif, sub_type, sectors, inset, offset_angle):
+        # Returns the motif's outline at unit radius, rotated.
+        points = []
+        if motif == "STAR":
+            len_points = sectors * 2
+            to_theta = math.tau / len_points
+            inset_radius = (1.0 - inset) * math.cos(to_theta)
+            if inset <= 0.0 or inset >= 1.0:
+                len_points = sectors
+                to_theta = math.tau / len_points
+
+            j = 0
+            while j < len_points:
+                v_radius = 1.0
+                if len_points > sectors and j % 2 == 1:
+                    v_radius = inset_radius
+                angle = offset_angle + j * to_theta
+                points.append((
+                    v_radius * math.cos(angle),
+                    v_radius * math.sin(angle)))
+                j = j + 1
+            return points
+
+        if sub_type == "COMPOUND_INVERSE":
+            points = [
+                (1.0, 0.0),
+                (0.7071067811865476, 0.2928932188134524),
+                (0.2928932188134524, 0.2928932188134524),
+                (0.2928932188134524, 0.7071067811865476),
+                (0.0, 1.0),
+                (-0.2928932188134524, 0.7071067811865476),
+                (-0.2928932188134524, 0.2928932188134524),
+                (-0.7071067811865476, 0.2928932188134524),
+                (-1.0, 0.0),
+                (-0.7071067811865476, -0.2928932188134524),
+                (-0.2928932188134524, -0.2928932188134524),
+                (-0.2928932188134524, -0.7071067811865476),
+                (0.0, -1.0),
+                (0.2928932188134524, -0.7071067811865476),
+                (0.2928932188134524, -0.2928932188134524),
+                (0.7071067811865476, -0.2928932188134524),
+            ]
+        elif sub_type == "ISOGONAL":
+            points = [
+                (0.6464466094067263, 0.0),
+                (1.0, 0.3535533905932738),
+                (0.3535533905932738, 0.3535533905932738),
+                (0.3535533905932738, 1.0),
+                (0.0, 0.6464466094067263),
+                (-0.3535533905932738, 1.0),
+                (-0.3535533905932738, 0.3535533905932738),
+                (-1.0, 0.3535533905932738),
+                (-0.6464466094067263, 0.0),
+                (-1.0, -0.3535533905932738),
+                (-0.3535533905932738, -0.3535533905932738),
+                (-0.3535533905932738, -1.0),
+                (0.0, -0.6464466094067263),
+                (0.3535533905932738, -1.0),
+                (0.3535533905932738, -0.3535533905932738),
+                (1.0, -0.3535533905932738),
+            ]
+        elif sub_type == "ISOTOXAL":
+            points = [
+                (1.0, 0.0),
+                (0.6, 0.2),
+                (1.0, 1.0),
+                (0.2, 0.6),
+                (0.0, 1.0),
+                (-0.2, 0.6),
+                (-1.0, 1.0),
+                (-0.6, 0.2),
+                (-1.0, 0.0),
+                (-0.6, -0.2),
+                (-1.0, -1.0),
+                (-0.2, -0.6),
+                (0.0, -1.0),
+                (0.2, -0.6),
+                (1.0, -1.0),
+                (0.6, -0.2),
+            ]
+        else:
+            points = [
+                (1.0, 0.0),
+                (0.7071067811865476, 0.2928932188134524),
+                (0.7071067811865476, 0.7071067811865476),
+                (0.2928932188134524, 0.7071067811865476),
+                (0.0, 1.0),
+                (-0.2928932188134524, 0.7071067811865476),
+                (-0.7071067811865476, 0.7071067811865476),
+                (-0.7071067811865476, 0.2928932188134524),
+                (-1.0, 0.0),
+                (-0.7071067811865476, -0.2928932188134524),
+                (-0.7071067811865476, -0.7071067811865476),
+                (-0.2928932188134524, -0.7071067811865476),
+                (0.0, -1.0),
+                (0.2928932188134524, -0.7071067811865476),
+                (0.7071067811865476, -0.7071067811865476),
+                (0.7071067811865476, -0.2928932188134524),
+            ]
+
+        cosa = math.cos(offset_angle)
+        sina = math.sin(offset_angle)
+        return [(cosa * p[0] - sina * p[1], cosa * p[1] + sina * p[0])
+            for p in points]
+
+    @staticmethod
+    def calc_centers(lattice, columns, rows, spacing):
+        # Returns tile centers, with the tiling centered on the origin.
+        # Hexagonal rows are offset by half a tile and spaced so that
+        # each tile is equidistant from its six neighbors.
+        row_step = spacing
+        if lattice == "HEX":
+            row_step = spacing * 0.8660254037844386
+
+        x_shift = -0.5 * (columns - 1) * spacing
+        y_shift = -0.5 * (rows - 1) * row_step
+        if lattice == "HEX" and rows > 1:
+            x_shift = x_shift - 0.25 * spacing
+
+        centers = [None] * (columns * rows)
+        k = 0
+        j = 0
+        while j < rows:
+            x_row = x_shift
+            if lattice == "HEX" and j % 2 == 1:
+                x_row = x_row + 0.5 * spacing
+            y = y_shift + j * row_step
+            i = 0
+            while i < columns:
+                centers[k] = (x_row + i * spacing, y)
+                k = k + 1
+                i = i + 1
+            j = j + 1
+        return centers
+
+    @staticmethod
+    def calc_cell(lattice, spacing):
+        # Returns the corners of a tile's cell, the region nearer to its
+        # center than to any other center, counter-clockwise. Cells of
+        # neighboring tiles share an edge, whose midpoint is half way
+        # between the two centers.
+        if lattice == "HEX":
+            # Neighbors lie at multiples of 60 degrees, so the cell is a
+            # hexagon with corners at 30 degrees and an inradius of half
+            # the spacing.
+            r = spacing / 1.7320508075688772
+            return [(r * math.cos(math.radians(30.0 + 60.0 * k)),
+                     r * math.sin(math.radians(30.0 + 60.0 * k)))
+                for k in range(6)]
+
+        h = spacing * 0.5
+        return [(h, h), (-h, h), (-h, -h), (h, -h)]
+
+    @staticmethod
+    def angle_of(p):
+        # Returns the angle of a point about the origin in [0, tau).
+        return math.atan2(p[1], p[0]) % math.tau
+
+    @staticmethod
+    def on_edges(p, cell, tolerance):
+        # Returns the indices of the cell edges a point lies on, or None
+        # if the point is outside the cell.
+        len_cell = len(cell)
+        edges = []
+        k = 0
+        while k < len_cell:
+            a = cell[k]
+            b = cell[(k + 1) % len_cell]
+            ex = b[0] - a[0]
+            ey = b[1] - a[1]
+            cross = ex * (p[1] - a[1]) - ey * (p[0] - a[0])
+            if cross < -tolerance * math.sqrt(ex * ex + ey * ey):
+                return None
+            if cross <= tolerance * math.sqrt(ex * ex + ey * ey):
+                edges.append(k)
+            k = k + 1
+        return edges
+
+    @staticmethod
+    def add_outline(outline, p, index, tolerance):
+        # Appends a point to a cell's outline unless it is already there.
+        for q in outline:
+            if math.hypot(p[0] - q[1][0], p[1] - q[1][1]) <= tolerance:
+                return
+        outline.append((TilingMeshMaker.angle_of(p), p, index))
+
+    @staticmethod
+    def nearest(angles, phi):
+        # Returns the index of the angle nearest to phi.
+        tau = math.tau
+        best = 0
+        best_diff = tau
+        k = 0
+        for angle in angles:
+            diff = abs((angle - phi + math.pi) % tau - math.pi)
+            if diff < best_diff:
+                best = k
+                best_diff = diff
+            k = k + 1
+        return best
+
+    @staticmethod
+    def calc_template(
+            points, radius, cell, face_type, fill_gaps, tolerance):
+        # Returns the vertices, faces and texture coordinates of one
+        # tile, relative to its center. The gap between the motif and
+        # the cell is split into faces by rays from the center. Rays
+        # pass through each cell edge's midpoint and each point where
+        # the motif touches the cell, so that each face lies between
+        # the two outlines. Cell edges are split where this cell's or
+        # its neighbor's motif touches them, so neighbors share whole
+        # edges. If the motif does not fit inside its cell, no gaps are
+        # filled and fits is False.
+        tau = math.tau
+        motif = [(radius * p[0], radius * p[1]) for p in points]
+        len_cell = len(cell)
+
+        # A motif which crosses its cell overlaps its neighbors.
+        touches = []
+        fits = fill_gaps and face_type != "STROKE"
+        if fits:
+            for p in motif:
+                edges = TilingMeshMaker.on_edges(p, cell, tolerance)
+                if edges is None:
+                    fits = False
+                    break
+                if edges:
+                    touches.append((p, edges))
+
+        mids = [(
+            0.5 * (cell[k][0] + cell[(k + 1) % len_cell][0]),
+            0.5 * (cell[k][1] + cell[(k + 1) % len_cell][1]))
+            for k in range(len_cell)]
+
+        vs = list(motif)
+        if fits:
+            # Insert a motif vertex where each ray through a midpoint
+            # crosses the motif's outline. The motif is star-shaped
+            # about its center, so the ray crosses it once.
+            for m in mids:
+                phi = TilingMeshMaker.angle_of(m)
+                len_vs = len(vs)
+                k = 0
+                while k < len_vs:
+                    a = vs[k]
+                    b = vs[(k + 1) % len_vs]
+                    phi_a = TilingMeshMaker.angle_of(a)
+                    phi_b = TilingMeshMaker.angle_of(b)
+                    d_a = (phi_a - phi + math.pi) % tau - math.pi
+                    if abs(d_a) * math.hypot(a[0], a[1]) <= tolerance:
+                        break
+                    d_b = (phi_b - phi) % tau
+                    d_ab = (phi_b - phi_a) % tau
+                    if 0.0 < d_b < d_ab:
+                        # Intersect the ray with the edge from a to b.
+                        ux = math.cos(phi)
+                        uy = math.sin(phi)
+                        ex = b[0] - a[0]
+                        ey = b[1] - a[1]
+                        denom = ux * ey - uy * ex
+                        t = (a[0] * ey - a[1] * ex) / denom
+                        vs.insert(k + 1, (t * ux, t * uy))
+                        break
+                    k = k + 1
+
+        len_motif = len(vs)
+        fs = []
+        if face_type == "TRI_FAN":
+            # A tile's center is never shared with another tile.
+            vs.append((0.0, 0.0))
+            k = 0
+            while k < len_motif:
+                fs.append((len_motif, k, (k + 1) % len_motif))
+                k = k + 1
+        else:
+            fs.append(tuple(range(len_motif)))
+
+        if fits:
+            # Collect points on the cell's outline: its corners, edge
+            # midpoints, the motif's touches, and the touches of each
+            # neighbor's motif, which mirror those on the far edge.
+            outline = []
+
+            for p, edges in touches:
+                TilingMeshMaker.add_outline(
+                    outline, p, vs.index(p), tolerance)
+            for p, edges in touches:
+                for k in edges:
+                    m = mids[k]
+                    TilingMeshMaker.add_outline(
+                        outline,
+                        (p[0] - 2.0 * m[0], p[1] - 2.0 * m[1]), -1,
+                        tolerance)
+            for p in cell:
+                TilingMeshMaker.add_outline(outline, p, -1, tolerance)
+            for p in mids:
+                TilingMeshMaker.add_outline(outline, p, -1, tolerance)
+            outline.sort()
+
+            for entry in outline:
+                if entry[2] < 0:
+                    vs.append(entry[1])
+            outline_indices = []
+            cursor = len_motif
+            if face_type == "TRI_FAN":
+                cursor = cursor + 1
+            for entry in outline:
+                if entry[2] < 0:
+                    outline_indices.append(cursor)
+                    cursor = cursor + 1
+                else:
+                    outline_indices.append(entry[2])
+
+            motif_angles = [
+                TilingMeshMaker.angle_of(vs[k]) for k in range(len_motif)]
+            outline_angles = [entry[0] for entry in outline]
+            rays = sorted(set(
+                [TilingMeshMaker.angle_of(m) for m in mids]
+                + [TilingMeshMaker.angle_of(p) for p, edges in touches]))
+            len_rays = len(rays)
+            len_outline = len(outline)
+
+            h = 0
+            while h < len_rays:
+                phi_0 = rays[h]
+                phi_1 = rays[(h + 1) % len_rays]
+
+                # Walk the cell counter-clockwise from one ray to the
+                # next, then the motif back clockwise.
+                face = []
+                k = TilingMeshMaker.nearest(outline_angles, phi_0)
+                k_stop = TilingMeshMaker.nearest(outline_angles, phi_1)
+                face.append(outline_indices[k])
+                while k != k_stop:
+                    k = (k + 1) % len_outline
+                    face.append(outline_indices[k])
+
+                k = TilingMeshMaker.nearest(motif_angles, phi_1)
+                k_stop = TilingMeshMaker.nearest(motif_angles, phi_0)
+                if k != face[-1]:
+                    face.append(k)
+                while k != k_stop:
+                    k = (k - 1) % len_motif
+                    face.append(k)
+                if face[-1] == face[0]:
+                    face.pop()
+
+                if len(face) > 2:
+                    fs.append(tuple(face))
+                h = h + 1
+
+        to_vt = 0.5 / radius
+        vts = [tuple((0.5 + to_vt * vs[k][0], 0.5 + to_vt * vs[k][1])
+            for k in f) for f in fs]
+        return vs, fs, vts, fits
+
+    @staticmethod
+    def calc_tiling(
+            template_vs, template_fs, template_vts, centers,
+            tolerance=0.000001):
+        # Places the tile at every center. Vertices are welded as they
+        # are placed: each is looked up in a spatial hash of the vertices
+        # placed so far, with cells as wide as the tolerance, so a vertex
+        # only needs to be compared with those in its own and adjacent
+        # cells. This keeps the cost linear in the number of tiles.
+        to_cell = 1.0 / tolerance
+        tol_sq = tolerance * tolerance
+        grid = {}
+        vs = []
+        fs = []
+        vts = []
+        len_template = len(template_vs)
+
+        for center in centers:
+            loop = [0] * len_template
+            k = 0
+            while k < len_template:
+                x = center[0] + template_vs[k][0]
+                y = center[1] + template_vs[k][1]
+                cx = math.floor(x * to_cell)
+                cy = math.floor(y * to_cell)
+
+                found = -1
+                nx = cx - 1
+                while found < 0 and nx <= cx + 1:
+                    ny = cy - 1
+                    while found < 0 and ny <= cy + 1:
+                        for h in grid.get((nx, ny), ()):
+                            v = vs[h]
+                            if (x - v[0]) ** 2 + (y - v[1]) ** 2 <= tol_sq:
+                                found = h
+                                break
+                        ny = ny + 1
+                    nx = nx + 1
+
+                if found < 0:
+                    found = len(vs)
+                    vs.append((x, y))
+                    cell = grid.get((cx, cy))
+                    if cell is None:
+                        grid[(cx, cy)] = [found]
+                    else:
+                        cell.append(found)
+                loop[k] = found
+                k = k + 1
+
+            for f in template_fs:
+                fs.append(tuple(loop[h] for h in f))
+            vts.extend(template_vts)
+
+        return vs, fs, vts
+
+    @staticmethod
+    def check_topology(fs):
+        # Returns the number of edges shared by two faces and the number
+        # which are not manifold: used by more than two faces, or twice
+        # in the same direction.
+        directed = {}
+        for f in fs:
+            len_f = len(f)
+            k = 0
+            while k < len_f:
+                key = (f[k], f[(k + 1) % len_f])
+                directed[key] = directed.get(key, 0) + 1
+                k = k + 1
+
+        shared = 0
+        bad = 0
+        for key, count in directed.items():
+            if count > 1:
+                bad = bad + 1
+            elif key[0] < key[1] and (key[1], key[0]) in directed:
+                shared = shared + 1
+        return shared, bad
+
+    def execute(self, context):
+        motif = self.motif
+        sectors = max(3, self.sectors)
+        inset = self.inset
+        lattice = self.lattice
+        columns = max(1, self.count[0])
+        rows = max(1, self.count[1])
+        radius = max(0.000001, self.radius)
+        spacing = max(0.000001, self.spacing) * 2.0 * radius
+        offset_angle = self.offset_angle
+        origin = self.origin
+        face_type = self.face_type
+
+        fill_gaps = self.fill_gaps
+        tolerance = 0.000001 * radius
+
+        points = TilingMeshMaker.calc_motif(
+            motif, self.sub_type, sectors, inset, offset_angle)
+        cell = TilingMeshMaker.calc_cell(lattice, spacing)
+        template_vs, template_fs, template_vts, fits = \
+            TilingMeshMaker.calc_template(
+                points, radius, cell, face_type, fill_gaps, tolerance)
+        if fill_gaps and face_type != "STROKE" and not fits:
+            self.report(
+                {"WARNING"},
+                "Motifs overlap their neighbors, so gaps are not filled")
+
+        centers = TilingMeshMaker.calc_centers(
+            lattice, columns, rows, spacing)
+        vs, fs, vts = TilingMeshMaker.calc_tiling(
+            template_vs, template_fs, template_vts, centers, tolerance)
+
+        if fits and len(centers) > 1:
+            shared, bad = TilingMeshMaker.check_topology(fs)
+            if shared < 1 or bad > 0:
+                self.report(
+                    {"WARNING"},
+                    "Tiles share {} edges, {} are not manifold".format(
+                        shared, bad))
+
+        mesh_data = bpy.data.meshes.new(motif.title() + ".Tiling")
+        mesh_data["generator"] = TilingMeshMaker.bl_idname
+        mesh_data.vertices.add(len(vs))
+        mesh_data.vertices.foreach_set("co", [c
+            for v in vs
+            for c in (v[0] + origin[0], v[1] + origin[1], 0.0)])
+
+        if face_type == "STROKE":
+            # Outlines which touch share an edge only once.
+            edges = set()
+            for f in fs:
+                len_f = len(f)
+                k = 0
+                while k < len_f:
+                    a = f[k]
+                    b = f[(k + 1) % len_f]
+                    edges.add((min(a, b), max(a, b)))
+                    k = k + 1
+            mesh_data.edges.add(len(edges))
+            mesh_data.edges.foreach_set(
+                "vertices", [h for e in edges for h in e])
+        else:
+            loop_starts = [0] * len(fs)
+            loop_verts = []
+            j = 0
+            for f in fs:
+                loop_starts[j] = len(loop_verts)
+                loop_verts.extend(f)
+                j = j + 1
+
+            mesh_data.loops.add(len(loop_verts))
+            mesh_data.loops.foreach_set("vertex_index", loop_verts)
+            mesh_data.polygons.add(len(fs))
+            mesh_data.polygons.foreach_set("loop_start", loop_starts)
+
+            uv_layer = mesh_data.uv_layers.new()
+            uv_layer.data.foreach_set("uv", [c
+                for f_vts in vts
+                for vt in f_vts
+                for c in vt])
+        mesh_data.update(calc_edges=True)
+
+        mesh_obj = bpy.data.objects.new(mesh_data.name, mesh_data)
+        mesh_obj.location = context.scene.cursor.location
+        context.collection.objects.link(mesh_obj)
+
+        return {"FINISHED"}
+
+    @classmethod
+    def poll(cls, context):
+        return context.area.type == "VIEW_3D"
+
+
+def menu_func(self, context):
+    self.layout.operator(TilingMeshMaker.bl_idname, icon="MESH_DATA")
+
+
+def register():
+    bpy.utils.register_class(TilingMeshMaker)
+    bpy.types.VIEW3D_MT_mesh_add.append(menu_func)
+
+
+def unregister():
+    bpy.utils.unregister_class(TilingMeshMaker)
+    bpy.types.VIEW3D_MT_mesh_add.remove(menu_func)
@@ -1,5 +1,6 @@
 import bpy # type: ignore
 import bmesh # type: ignore
+import functools
 import math
 from bpy.props import ( # type: ignore
     EnumProperty,
@@ -79,6 +80,24 @@ class TudorArchMeshMaker(bpy.types.Operator):
         default="QUADS",
         description="How to fill the mesh") # type: ignore
 
+    depth: FloatProperty(
+        name="Depth",
+        description="Extrusion depth. At zero, the arch is flat",
+        min=0.0,
+        soft_max=100.0,
+        step=1,
+        precision=3,
+        default=0.0) # type: ignore
+
+    chamfer: FloatProperty(
+        name="Chamfer",
+        description="Chamfer of the solid's edges. Reduced if the caps would fold over",
+        min=0.0,
+        soft_max=1.0,
+        step=1,
+        precision=3,
+        default=0.0) # type: ignore
+
     @staticmethod
     def mesh_data_to_bmesh(
             vs, vts, vns,
@@ -126,6 +145,239 @@ class TudorArchMeshMaker(bpy.types.Operator):
 
         return bm
 
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def face_indices(face_type, sector_count_total):
+        # Face indices depend only on the face type and vertex count.
+        len_vs = sector_count_total * 2
+        fs = []
+        if face_type == "QUADS":
+            len_fs = sector_count_total - 1
+            fs = [(0, 0, 0, 0)] * len_fs
+
+            k = 0
+            while k < len_fs:
+                fs[k] = (
+                    k,
+                    k + 1,
+                    len_vs - k - 2,
+                    len_vs - k - 1)
+                k = k + 1
+        else:
+            # Construct an n-gon face.
+            k = 0
+            f = [0] * len_vs
+            while k < len_vs:
+                f[k] = k
+                k = k + 1
+            fs = [tuple(f)]
+
+        return tuple(fs)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def solid_indices(face_type, sector_count_total, ring_count):
+        # The front cap reuses the flat faces. The back cap reverses
+        # them, so that it faces away. Walls join each ring to the next.
+        # Texture coordinates of the walls follow those of the caps, with
+        # a seam where the outline closes.
+        cap_fs = TudorArchMeshMaker.face_indices(face_type, sector_count_total)
+        len_ring = sector_count_total * 2
+        len_caps = len(cap_fs)
+        back_offset = len_ring * (ring_count - 1)
+        len_fs = len_caps * 2 + back_offset
+        v_fs = [()] * len_fs
+        vt_fs = [()] * len_fs
+
+        k = 0
+        while k < len_caps:
+            f = cap_fs[k]
+            f_rev = f[::-1]
+            v_fs[k] = f
+            vt_fs[k] = f
+            v_fs[len_caps + k] = tuple(back_offset + h for h in f_rev)
+            vt_fs[len_caps + k] = f_rev
+            k = k + 1
+
+        cursor = len_caps * 2
+        r = 0
+        while r < ring_count - 1:
+            v_curr = r * len_ring
+            v_next = v_curr + len_ring
+            vt_curr = len_ring + r * (len_ring + 1)
+            vt_next = vt_curr + len_ring + 1
+
+            k = 0
+            while k < len_ring:
+                k_next = (k + 1) % len_ring
+                v_fs[cursor] = (
+                    v_curr + k,
+                    v_next + k,
+                    v_next + k_next,
+                    v_curr + k_next)
+                vt_fs[cursor] = (
+                    vt_curr + k,
+                    vt_next + k,
+                    vt_next + k + 1,
+                    vt_curr + k + 1)
+                cursor = cursor + 1
+                k = k + 1
+
+            r = r + 1
+
+        return tuple(v_fs), tuple(vt_fs)
+
+    @staticmethod
+    def calc_miters(vs):
+        # Returns the offset of each vertex of a closed outline per unit
+        # of inset. The outline winds counter-clockwise, so its inward
+        # miter is to the left.
+        len_ring = len(vs)
+        miters = [(0.0, 0.0)] * len_ring
+        i = 0
+        while i < len_ring:
+            v_prev = vs[(i - 1) % len_ring]
+            v_curr = vs[i]
+            v_next = vs[(i + 1) % len_ring]
+
+            d0x = v_curr[0] - v_prev[0]
+            d0y = v_curr[1] - v_prev[1]
+            d0_mag = math.sqrt(d0x * d0x + d0y * d0y)
+            d1x = v_next[0] - v_curr[0]
+            d1y = v_next[1] - v_curr[1]
+            d1_mag = math.sqrt(d1x * d1x + d1y * d1y)
+
+            if d0_mag > 0.000001 and d1_mag > 0.000001:
+                d0x = d0x / d0_mag
+                d0y = d0y / d0_mag
+                d1x = d1x / d1_mag
+                d1y = d1y / d1_mag
+
+                mx = -d0y - d1y
+                my = d0x + d1x
+                m_mag = math.sqrt(mx * mx + my * my)
+                if m_mag > 0.000001:
+                    mx = mx / m_mag
+                    my = my / m_mag
+                    cos_half = max(0.000001, mx * -d0y + my * d0x)
+                    miters[i] = (mx / cos_half, my / cos_half)
+
+            i = i + 1
+
+        return miters
+
+    @staticmethod
+    def calc_chamfer_limit(vs):
+        # Returns the largest inset before a cap folds over itself. An
+        # edge collapses when its ends, moving along their miters, meet.
+        # The band pinches when a vertex reaches the inset of an edge on
+        # the far side of the band.
+        miters = TudorArchMeshMaker.calc_miters(vs)
+        len_ring = len(vs)
+        limit = float("inf")
+        j = 0
+        while j < len_ring:
+            j_next = (j + 1) % len_ring
+            a = vs[j]
+            b = vs[j_next]
+            ex = b[0] - a[0]
+            ey = b[1] - a[1]
+            e_mag = math.sqrt(ex * ex + ey * ey)
+            if e_mag > 0.000001:
+                dx = ex / e_mag
+                dy = ey / e_mag
+                m_a = miters[j]
+                m_b = miters[j_next]
+                closing = (m_a[0] - m_b[0]) * dx + (m_a[1] - m_b[1]) * dy
+                if closing > 0.000001:
+                    limit = min(limit, e_mag / closing)
+
+                i = 0
+                while i < len_ring:
+                    if i != j and i != j_next:
+                        px = vs[i][0] - a[0]
+                        py = vs[i][1] - a[1]
+                        t = px * dx + py * dy
+                        dist = px * -dy + py * dx
+                        if dist > 0.0 and t >= 0.0 and t <= e_mag:
+                            m_i = miters[i]
+                            approach = 1.0 - (m_i[0] * -dy + m_i[1] * dx)
+                            if approach > 0.000001:
+                                limit = min(limit, dist / approach)
+                    i = i + 1
+            j = j + 1
+
+        return limit
+
+    @staticmethod
+    def calc_solid(vs, vts, depth, chamfer):
+        # Extrudes the closed outline of the arch back along the z axis.
+        # With a chamfer, the caps are inset by the chamfer and meet the
+        # walls at 45 degrees. Returns the vertices of each ring, front
+        # to back, the texture coordinates of the caps then the walls,
+        # and the number of rings.
+        len_ring = len(vs)
+        depth = max(0.000001, depth)
+        chamfer = min(max(chamfer, 0.0), depth * 0.5)
+
+        # Each ring is an inset and a depth.
+        rings = [(0.0, 0.0), (0.0, -depth)]
+        if chamfer * 2.0 >= depth:
+            rings = [
+                (chamfer, 0.0),
+                (0.0, -chamfer),
+                (chamfer, -depth)]
+        elif chamfer > 0.0:
+            rings = [
+                (chamfer, 0.0),
+                (0.0, -chamfer),
+                (0.0, chamfer - depth),
+                (chamfer, -depth)]
+        ring_count = len(rings)
+
+        # Arc length along the outline is accumulated for the walls'
+        # texture coordinates.
+        miters = TudorArchMeshMaker.calc_miters(vs)
+        perimeter = [0.0] * (len_ring + 1)
+        i = 0
+        while i < len_ring:
+            v_curr = vs[i]
+            v_next = vs[(i + 1) % len_ring]
+            perimeter[i + 1] = perimeter[i] + math.sqrt(
+                (v_next[0] - v_curr[0]) ** 2
+                + (v_next[1] - v_curr[1]) ** 2)
+            i = i + 1
+
+        to_u = 1.0
+        if perimeter[len_ring] > 0.0:
+            to_u = 1.0 / perimeter[len_ring]
+
+        vs_solid = [(0.0, 0.0, 0.0)] * (len_ring * ring_count)
+        vts_solid = list(vts) + [(0.0, 0.0)] * ((len_ring + 1) * ring_count)
+
+        r = 0
+        while r < ring_count:
+            inset, z = rings[r]
+            vt_v = 1.0 + z / depth
+            v_offset = r * len_ring
+            vt_offset = len_ring + r * (len_ring + 1)
+
+            k = 0
+            while k < len_ring:
+                v = vs[k]
+                miter = miters[k]
+                vs_solid[v_offset + k] = (
+                    v[0] + inset * miter[0],
+                    v[1] + inset * miter[1],
+                    z)
+                vts_solid[vt_offset + k] = (perimeter[k] * to_u, vt_v)
+                k = k + 1
+
+            vts_solid[vt_offset + len_ring] = (1.0, vt_v)
+            r = r + 1
+
+        return vs_solid, vts_solid, ring_count
+
     @staticmethod
     def scale2(v, s):
         return (v[0] * s, v[1] * s)
@@ -367,34 +619,37 @@ class TudorArchMeshMaker(bpy.types.Operator):
             vs[cursor] = v_start
             cursor = cursor + 1
 
-        fs = []
+        fs = ()
+        vt_fs = ()
         if create_faces:
-            if face_type == "QUADS":
-                len_fs = sector_count_total - 1
-                fs = [(0, 0, 0, 0)] * len_fs
-
-                k = 0
-                while k < len_fs:
-                    fs[k] = (
-                        k,
-                        k + 1,
-                        len_vs - k - 2,
-                        len_vs - k - 1)
-                    k = k + 1
-            else:
-                # Construct an n-gon face.
-                k = 0
-                f = [0] * len_vs
-                while k < len_vs:
-                    f[k] = k
-                    k = k + 1
-                fs = [tuple(f)] # type: ignore
+            fs = TudorArchMeshMaker.face_indices(
+                face_type, sector_count_total)
+            vt_fs = fs
+
+        # Only an arch with faces has a closed outline to extrude.
+        depth = self.depth
+        if create_faces and depth > 0.0:
+            # Keep the chamfer short of where the caps would fold over.
+            chamfer = self.chamfer
+            chamfer_max = 0.9 * TudorArchMeshMaker.calc_chamfer_limit(vs)
+            if chamfer > chamfer_max:
+                self.report(
+                    {"WARNING"},
+                    "Chamfer reduced to {:.4f} so the caps do not fold".format(
+                        chamfer_max))
+                chamfer = chamfer_max
+            vs, vts, ring_count = TudorArchMeshMaker.calc_solid(
+                vs, vts, depth, chamfer)
+            fs, vt_fs = TudorArchMeshMaker.solid_indices(
+                face_type, sector_count_total, ring_count)
+            vns = [(0.0, 0.0, 1.0)] * len(vs)
 
         bm = TudorArchMeshMaker.mesh_data_to_bmesh(
             vs, vts, vns,
-            fs, fs, fs)
+            fs, vt_fs, fs)
 
         mesh_data = bpy.data.meshes.new("Tudor Arch")
+        mesh_data["generator"] = TudorArchMeshMaker.bl_idname
         bm.to_mesh(mesh_data)
         bm.free()
 
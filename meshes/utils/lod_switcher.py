@@ -0,0 +1,301 @@
+import bpy # type: ignore
+import math
+from bpy.props import ( # type: ignore
+    BoolProperty,
+    FloatProperty)
+
+bl_info = {
+    "name": "LOD Switcher",
+    "author": "Jeremy Behreandt",
+    "version": (0, 1),
+    "blender": (4, 5, 2),
+    "category": "Object",
+    "description": "Swaps generated shapes between their levels of detail by camera distance.",
+    "tracker_url": "https://github.com/behreajj/blendergeom"
+}
+
+# Objects with levels of detail list their meshes in a "lod_meshes"
+# custom property, finest first. Only objects whose transform or bounds
+# changed, or all of them when the camera changed, are re-evaluated.
+#
+# Objects are keyed by pointer, so that renaming one does not drop it.
+# Tracked objects map to the name they are looked up by, which is kept
+# up to date as they are updated.
+lod_state = {
+    "busy": False,
+    "camera": None,
+    "stale": True,
+    "tracked": {},
+    "animated": set(),
+    "transforms": {},
+}
+
+
+class LodSwitcher(bpy.types.Operator):
+    """Selects levels of detail by projected screen size"""
+
+    bl_idname = "object.lod_switch_refresh"
+    bl_label = "Refresh LODs"
+    bl_options = {"REGISTER"}
+
+    @staticmethod
+    def camera_key(cam_obj):
+        if cam_obj is None:
+            return None
+        cam_data = cam_obj.data
+        return (
+            tuple(tuple(row) for row in cam_obj.matrix_world),
+            cam_data.type,
+            cam_data.angle,
+            cam_data.ortho_scale)
+
+    @staticmethod
+    def transform_key(obj):
+        return (
+            tuple(tuple(row) for row in obj.matrix_world),
+            tuple(obj.dimensions))
+
+    @staticmethod
+    def is_animated(obj):
+        while obj is not None:
+            anim_data = obj.animation_data
+            if (anim_data is not None and anim_data.action is not None) \
+                or len(obj.constraints) > 0:
+                return True
+            obj = obj.parent
+        return False
+
+    @staticmethod
+    def screen_size(obj, cam_obj):
+        # Returns the bounding radius of the object as a fraction of the
+        # half height of the camera view.
+        dims = obj.dimensions
+        radius = 0.5 * max(dims[0], dims[1], dims[2])
+        cam_data = cam_obj.data
+
+        if cam_data.type == "ORTHO":
+            return radius / max(0.000001, 0.5 * cam_data.ortho_scale)
+
+        obj_loc = obj.matrix_world.translation
+        cam_loc = cam_obj.matrix_world.translation
+        dist = (obj_loc - cam_loc).length
+        half_tan = math.tan(0.5 * cam_data.angle)
+        return radius / max(0.000001, dist * half_tan)
+
+    @staticmethod
+    def level_for_size(size, threshold, len_levels):
+        if size >= threshold:
+            return 0
+        if size <= 0.0:
+            return len_levels - 1
+        # Each halving of the screen size drops one level.
+        level = 1 + math.floor(math.log2(threshold / size))
+        return min(len_levels - 1, max(0, level))
+
+    @staticmethod
+    def apply_level(obj, cam_obj, threshold):
+        names = obj.get("lod_meshes")
+        if not names:
+            return
+        len_levels = len(names)
+        size = LodSwitcher.screen_size(obj, cam_obj)
+        level = LodSwitcher.level_for_size(size, threshold, len_levels)
+        if obj.get("lod_level", 0) == level and obj.data is not None \
+            and obj.data.name == names[level]:
+            return
+
+        mesh_data = bpy.data.meshes.get(names[level])
+        if mesh_data is not None:
+            obj.data = mesh_data
+            obj["lod_level"] = level
+
+    @staticmethod
+    def rebuild_registry(scene):
+        tracked = {}
+        animated = set()
+        for obj in scene.objects:
+            if obj.type == "MESH" and obj.get("lod_meshes"):
+                ptr = obj.as_pointer()
+                tracked[ptr] = obj.name
+                if LodSwitcher.is_animated(obj):
+                    animated.add(ptr)
+        lod_state["tracked"] = tracked
+        lod_state["animated"] = animated
+        lod_state["transforms"] = {}
+        lod_state["stale"] = False
+
+    @staticmethod
+    def find_objects(scene, ptrs):
+        # Returns the tracked objects with the given pointers. An object
+        # which is not found under its name was renamed without being
+        # updated, or removed, so the registry is rebuilt to find it.
+        tracked = lod_state["tracked"]
+        objects = scene.objects
+        found = []
+        missing = []
+        for ptr in ptrs:
+            obj = objects.get(tracked.get(ptr, ""))
+            if obj is not None and obj.as_pointer() == ptr:
+                found.append(obj)
+            else:
+                missing.append(ptr)
+
+        if missing:
+            LodSwitcher.rebuild_registry(scene)
+            tracked = lod_state["tracked"]
+            for ptr in missing:
+                obj = objects.get(tracked.get(ptr, ""))
+                if obj is not None:
+                    found.append(obj)
+        return found
+
+    @staticmethod
+    def refresh(scene, ptrs):
+        # Re-evaluates the given objects, plus all tracked objects if the
+        # camera has changed since the last call.
+        cam_obj = scene.camera
+        if cam_obj is None:
+            return
+
+        cam_key = LodSwitcher.camera_key(cam_obj)
+        if cam_key != lod_state["camera"]:
+            lod_state["camera"] = cam_key
+            ptrs = list(lod_state["tracked"])
+
+        if not ptrs:
+            return
+
+        threshold = scene.lod_switch_threshold
+        objs = LodSwitcher.find_objects(scene, ptrs)
+        transforms = lod_state["transforms"]
+
+        lod_state["busy"] = True
+        try:
+            for obj in objs:
+                transforms[obj.as_pointer()] = LodSwitcher.transform_key(obj)
+                LodSwitcher.apply_level(obj, cam_obj, threshold)
+        finally:
+            lod_state["busy"] = False
+
+    def execute(self, context):
+        scene = context.scene
+        LodSwitcher.rebuild_registry(scene)
+        lod_state["camera"] = None
+        LodSwitcher.refresh(scene, set())
+        return {"FINISHED"}
+
+
+@bpy.app.handlers.persistent
+def depsgraph_update_post(scene, depsgraph):
+    if lod_state["busy"] or not scene.lod_switch_enabled:
+        return
+
+    if lod_state["stale"]:
+        LodSwitcher.rebuild_registry(scene)
+        lod_state["camera"] = None
+
+    tracked = lod_state["tracked"]
+    animated = lod_state["animated"]
+    dirty = set()
+    for update in depsgraph.updates:
+        id_orig = update.id.original
+        if not isinstance(id_orig, bpy.types.Object):
+            continue
+
+        # New objects, or ones that gained levels of detail or animation,
+        # are picked up as they are updated.
+        ptr = id_orig.as_pointer()
+        if ptr not in tracked:
+            if id_orig.type != "MESH" or not id_orig.get("lod_meshes"):
+                continue
+            dirty.add(ptr)
+        tracked[ptr] = id_orig.name
+        if LodSwitcher.is_animated(id_orig):
+            animated.add(ptr)
+        else:
+            animated.discard(ptr)
+
+        if update.is_updated_transform or update.is_updated_geometry:
+            dirty.add(ptr)
+
+    LodSwitcher.refresh(scene, dirty)
+
+
+@bpy.app.handlers.persistent
+def frame_change_post(scene, depsgraph=None):
+    if lod_state["busy"] or not scene.lod_switch_enabled:
+        return
+
+    if lod_state["stale"]:
+        LodSwitcher.rebuild_registry(scene)
+        lod_state["camera"] = None
+
+    # Only animated objects can have moved due to a frame change.
+    objs = LodSwitcher.find_objects(scene, list(lod_state["animated"]))
+    transforms = lod_state["transforms"]
+    dirty = set()
+    for obj in objs:
+        ptr = obj.as_pointer()
+        if transforms.get(ptr) != LodSwitcher.transform_key(obj):
+            dirty.add(ptr)
+
+    LodSwitcher.refresh(scene, dirty)
+
+
+@bpy.app.handlers.persistent
+def load_post(*args):
+    # Loading a file, or undoing, may move objects to new pointers.
+    lod_state["stale"] = True
+    lod_state["camera"] = None
+
+
+class LodSwitcherPanel(bpy.types.Panel):
+    """Settings for switching levels of detail"""
+
+    bl_idname = "VIEW3D_PT_lod_switcher"
+    bl_label = "LOD Switcher"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "View"
+
+    def draw(self, context):
+        scene = context.scene
+        layout = self.layout
+        layout.prop(scene, "lod_switch_enabled")
+        layout.prop(scene, "lod_switch_threshold")
+        layout.label(text="Tracked: {}".format(len(lod_state["tracked"])))
+        layout.operator(LodSwitcher.bl_idname)
+
+
+def register():
+    bpy.types.Scene.lod_switch_enabled = BoolProperty(
+        name="Switch LODs",
+        description="Swap generated shapes between their levels of detail by camera distance",
+        default=True)
+    bpy.types.Scene.lod_switch_threshold = FloatProperty(
+        name="Threshold",
+        description="Screen size, as a fraction of the half view height, below which the first coarser level is used",
+        min=0.0001,
+        soft_max=1.0,
+        step=1,
+        precision=3,
+        default=0.25)
+    bpy.utils.register_class(LodSwitcher)
+    bpy.utils.register_class(LodSwitcherPanel)
+    bpy.app.handlers.depsgraph_update_post.append(depsgraph_update_post)
+    bpy.app.handlers.frame_change_post.append(frame_change_post)
+    bpy.app.handlers.load_post.append(load_post)
+    bpy.app.handlers.undo_post.append(load_post)
+    bpy.app.handlers.redo_post.append(load_post)
+
+
+def unregister():
+    bpy.app.handlers.depsgraph_update_post.remove(depsgraph_update_post)
+    bpy.app.handlers.frame_change_post.remove(frame_change_post)
+    bpy.app.handlers.load_post.remove(load_post)
+    bpy.app.handlers.undo_post.remove(load_post)
+    bpy.app.handlers.redo_post.remove(load_post)
+    bpy.utils.unregister_class(LodSwitcherPanel)
+    bpy.utils.unregister_class(LodSwitcher)
+    del bpy.types.Scene.lod_switch_threshold
+    del bpy.types.Scene.lod_switch_enabled
\ No newline at end of file
@@ -83,7 +83,8 @@ class VesicaMeshMaker(bpy.types.Operator):
             ("NGON", "NGon", "Fill with an ngon", 1),
             ("QUAD_STRIP", "Quad Strip", "Fill with quads except for the tips", 2),
             ("STROKE", "Stroke", "Connect vertices with edges only", 3),
-            ("TRI_FAN", "Tri Fan", "Fill with triangles sharing a central vertex", 4)],
+            ("TRI_FAN", "Tri Fan", "Fill with triangles sharing a central vertex", 4),
+            ("TRIS", "Tris", "Fill with a strip of triangles, without a central vertex", 5)],
         name="Face Type",
         default="NGON",
         description="How to fill the vesica") # type: ignore
@@ -315,12 +316,29 @@ class VesicaMeshMaker(bpy.types.Operator):
                     j % (len_vs - 1),
                     (j + 1) % (len_vs - 1))
                 j = j + 1
+        elif face_type == "TRIS":
+            # The vesica is convex, so it can be zigzagged from the right
+            # tip to the left, like the quad strip split along diagonals.
+            len_fs = len_vs - 2
+            fs = [(0, 0, 0)] * len_fs
+            lo = 0
+            hi = len_vs - 1
+            j = 0
+            while j < len_fs:
+                if j % 2 == 0:
+                    fs[j] = (lo, lo + 1, hi)
+                    lo = lo + 1
+                else:
+                    fs[j] = (lo, hi - 1, hi)
+                    hi = hi - 1
+                j = j + 1
 
         bm = VesicaMeshMaker.mesh_data_to_bmesh(
             vs, vts, vns,
             fs, fs, fs)
 
         mesh_data = bpy.data.meshes.new("Arc")
+        mesh_data["generator"] = VesicaMeshMaker.bl_idname
         bm.to_mesh(mesh_data)
         bm.free()
 
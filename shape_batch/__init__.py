@@ -0,0 +1,26 @@
+bl_info = {
+    "name": "Create Shape Batch",
+    "author": "Jeremy Behreandt",
+    "version": (0, 1),
+    "blender": (4, 5, 2),
+    "category": "Object",
+    "description": "Creates many shapes at once, computed in worker processes.",
+    "tracker_url": "https://github.com/behreajj/blendergeom"
+}
+
+# Worker processes import this package to reach the kernels, so bpy is
+# only imported once the add-on is registered.
+
+
+def register():
+    from . import cleanup
+    from . import operators
+    operators.register()
+    cleanup.register()
+
+
+def unregister():
+    from . import cleanup
+    from . import operators
+    cleanup.unregister()
+    operators.unregister()
@@ -0,0 +1,179 @@
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+
+from . import kernels
+
+# This module must not import bpy. Kernel results are stored one file
+# per entry, named by a hash of the shape and its parameters, under a
+# directory named by the kernel code version. When the kernels change,
+# entries are looked up in a new directory and the old one is removed.
+#
+# A file is a header followed by the raw bytes of each array, in native
+# byte order, so it is only valid on the machine which wrote it. It is
+# memory mapped when loaded, so pages of an array are read from disk
+# only when foreach_set reaches them.
+cache_state = {
+    "pruned": set(),
+}
+
+MAGIC = b"SBCA"
+
+# Bump when the layout of cache files changes.
+FORMAT_VERSION = 1
+
+# Magic, format version, kind and array count.
+HEADER = struct.Struct("<4sBBH")
+
+# Key, type code, byte offset and byte length of each array.
+ENTRY = struct.Struct("<16sc7xQQ")
+
+# Arrays in a cache file start on 8 byte boundaries.
+ALIGN = 8
+
+KINDS = ("MESH", "CURVE")
+
+
+def default_directory():
+    # The cache is shared by Blender sessions and the command line tool,
+    # so it is kept in the user's cache directory rather than in
+    # Blender's own folders.
+    env_dir = os.environ.get("SHAPE_BATCH_CACHE")
+    if env_dir:
+        return env_dir
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    return os.path.join(base, "shape_batch")
+
+
+def version_name():
+    return "v{}_{}".format(FORMAT_VERSION, kernels.code_version())
+
+
+def prepare(root):
+    # Returns the directory of entries for the current kernels. Entries
+    # left by other versions are removed the first time a root is used
+    # by this process.
+    directory = os.path.join(root, version_name())
+    os.makedirs(directory, exist_ok=True)
+
+    if root not in cache_state["pruned"]:
+        cache_state["pruned"].add(root)
+        current = version_name()
+        for entry in os.scandir(root):
+            if entry.is_dir() and entry.name.startswith("v") \
+                and entry.name != current:
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+    return directory
+
+
+def entry_key(row):
+    # Rows are keyed by their resolved parameters, so a row which leaves
+    # out a default and one which gives it share an entry.
+    shape, params = kernels.resolve(row)
+    key = json.dumps([shape, params], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def entry_path(directory, key):
+    # Entries are spread over subfolders so that no one folder holds too
+    # many files.
+    return os.path.join(directory, key[:2], key + ".bin")
+
+
+def load(directory, key):
+    # Returns the kind and arrays of an entry, as views onto the mapped
+    # file, or None if there is no valid entry.
+    try:
+        with open(entry_path(directory, key), "rb") as bin_file:
+            mapped = mmap.mmap(bin_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    # A file which is truncated or from another format is a miss, and
+    # is replaced when the entry is stored again.
+    try:
+        magic, version, kind, array_count = HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC or version != FORMAT_VERSION \
+            or kind >= len(KINDS):
+            raise ValueError(magic)
+
+        size = len(mapped)
+        view = memoryview(mapped)
+        arrays = {}
+        i = 0
+        while i < array_count:
+            name, typecode, offset, nbytes = ENTRY.unpack_from(
+                mapped, HEADER.size + i * ENTRY.size)
+            if offset + nbytes > size:
+                raise ValueError(offset)
+            arrays[name.rstrip(b"\0").decode("ascii")] = \
+                view[offset:offset + nbytes].cast(typecode.decode("ascii"))
+            i = i + 1
+        view.release()
+    except (struct.error, ValueError, TypeError):
+        return None
+
+    return KINDS[kind], arrays
+
+
+def store(directory, key, kind, arrays):
+    path = entry_path(directory, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    entries = []
+    offset = HEADER.size + len(arrays) * ENTRY.size
+    offset = (offset + ALIGN - 1) // ALIGN * ALIGN
+    for name, buf in arrays.items():
+        nbytes = len(buf) * buf.itemsize
+        entries.append(ENTRY.pack(
+            name.encode("ascii"), buf.typecode.encode("ascii"), offset, nbytes))
+        offset = offset + (nbytes + ALIGN - 1) // ALIGN * ALIGN
+
+    # Files are written under a temporary name and then renamed, so that
+    # other processes never map a file which is only partly written.
+    temp_path = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        with open(temp_path, "wb") as bin_file:
+            bin_file.write(HEADER.pack(
+                MAGIC, FORMAT_VERSION, KINDS.index(kind), len(arrays)))
+            for entry in entries:
+                bin_file.write(entry)
+            for buf in arrays.values():
+                bin_file.write(b"\0" * (-bin_file.tell() % ALIGN))
+                bin_file.write(memoryview(buf).cast("B"))
+        os.replace(temp_path, path)
+    except OSError:
+        # A cache which cannot be written only costs time.
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def compute(row, directory=None):
+    # Runs a row's kernel and stores the result, without looking for an
+    # existing entry, so the arrays returned are always arrays.
+    kind, arrays = kernels.generate(row)
+    if directory is not None:
+        store(directory, entry_key(row), kind, arrays)
+    return kind, arrays
+
+
+def generate(row, directory=None):
+    # Returns the kind and arrays of a row's shape, from the cache if an
+    # entry exists, otherwise from its kernel.
+    if directory is not None:
+        cached = load(directory, entry_key(row))
+        if cached is not None:
+            return cached
+    return compute(row, directory)
@@ -0,0 +1,102 @@
+import bpy # type: ignore
+from bpy.props import BoolProperty # type: ignore
+
+# Every generator tags the data it makes with its operator's idname.
+GENERATOR_PREFIXES = ("mesh.primitive_", "curve.primitive_")
+
+
+class ShapeOrphanPurger(bpy.types.Operator):
+    """Removes unused meshes and curves made by the shape generators"""
+
+    bl_idname = "outliner.shape_orphans_purge"
+    bl_label = "Purge Shape Orphans"
+    bl_options = {"REGISTER", "UNDO"}
+
+    include_lods: BoolProperty(
+        name="Unlisted LODs",
+        description="Also remove levels of detail which are kept by a fake user but no longer listed by any object",
+        default=True) # type: ignore
+
+    @staticmethod
+    def is_generated(data):
+        generator = data.get("generator")
+        if isinstance(generator, str) \
+            and generator.startswith(GENERATOR_PREFIXES):
+            return True
+        return "lod_level" in data
+
+    @staticmethod
+    def find_orphans(include_lods):
+        # Levels of detail have a fake user, so that they are saved while
+        # not assigned to their object. They are only orphans once no
+        # object lists them.
+        lod_names = set()
+        if include_lods:
+            for obj in bpy.data.objects:
+                names = obj.get("lod_meshes")
+                if names:
+                    lod_names.update(names)
+
+        orphans = []
+        for collection in (bpy.data.meshes, bpy.data.curves):
+            for data in collection:
+                if data.library is not None:
+                    continue
+
+                users = data.users
+                if data.use_fake_user:
+                    if not include_lods or users > 1 \
+                        or "lod_level" not in data \
+                        or data.name in lod_names:
+                        continue
+                elif users > 0:
+                    continue
+
+                if ShapeOrphanPurger.is_generated(data):
+                    orphans.append(data)
+        return orphans
+
+    def execute(self, context):
+        orphans = ShapeOrphanPurger.find_orphans(self.include_lods)
+        if not orphans:
+            self.report({"INFO"}, "No shape orphans found")
+            return {"CANCELLED"}
+
+        mesh_count = 0
+        for data in orphans:
+            if isinstance(data, bpy.types.Mesh):
+                mesh_count = mesh_count + 1
+        curve_count = len(orphans) - mesh_count
+
+        # Each removal on its own searches the whole file for users of
+        # the datablock; a batch removal searches once.
+        bpy.data.batch_remove(orphans)
+        self.report({"INFO"}, "Removed {} meshes and {} curves".format(
+            mesh_count, curve_count))
+        return {"FINISHED"}
+
+    def invoke(self, context, event):
+        count = len(ShapeOrphanPurger.find_orphans(self.include_lods))
+        if count < 1:
+            self.report({"INFO"}, "No shape orphans found")
+            return {"CANCELLED"}
+        return context.window_manager.invoke_confirm(
+            self, event,
+            title=self.bl_label,
+            message="Remove {} unused shape datablocks?".format(count),
+            confirm_text="Purge",
+            icon="WARNING")
+
+
+def menu_func(self, context):
+    self.layout.operator(ShapeOrphanPurger.bl_idname, icon="ORPHAN_DATA")
+
+
+def register():
+    bpy.utils.register_class(ShapeOrphanPurger)
+    bpy.types.TOPBAR_MT_file_cleanup.append(menu_func)
+
+
+def unregister():
+    bpy.types.TOPBAR_MT_file_cleanup.remove(menu_func)
+    bpy.utils.unregister_class(ShapeOrphanPurger)
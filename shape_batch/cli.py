@@ -0,0 +1,372 @@
+"""Builds an asset library of shapes from a manifest.
+
+Run from Blender in background mode, with arguments after "--":
+
+    blender --background --factory-startup --python shape_batch/cli.py -- \\
+        --manifest ornaments.jsonl --output ~/assets/ornaments --jobs 4
+
+The manifest is a CSV file with a header, or a JSON lines file, where
+each row holds a shape and its parameters, for example
+{"shape": "FOIL", "foil_type": "BARBED", "foil_count": 5}. Invalid rows
+are reported and skipped. With no manifest, a built-in set of
+ornaments is used. Rows are split into shards. Each shard is written to
+its own .blend file by its own Blender process. Shards whose rows and
+generator code have not changed since the last run are skipped. Shapes
+are read from, and stored in, the same cache as Blender sessions use.
+The output directory can then be added as an asset library in
+Blender's preferences.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+
+# This file is run as a script, so the package is not yet importable.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shape_batch import cache # noqa: E402
+from shape_batch import kernels # noqa: E402
+from shape_batch import manifest # noqa: E402
+
+CATALOG_FILE = "blender_assets.cats.txt"
+CATALOG_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://github.com/behreajj/blendergeom")
+
+# Bump when the layout of shard files changes.
+FORMAT_VERSION = 1
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="shape_batch/cli.py",
+        description="Builds an asset library of shapes from a manifest.")
+    parser.add_argument(
+        "--manifest",
+        help="CSV or JSON lines file of rows, one shape per row")
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Stop at the first invalid row rather than skipping it")
+    parser.add_argument(
+        "--output",
+        required=True,
+        help="Asset library directory to write shards to")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=max(1, (os.cpu_count() or 1) - 1),
+        help="Number of Blender processes to run at once")
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=0,
+        help="Number of shard files, or 0 for four per job")
+    parser.add_argument(
+        "--blender",
+        help="Blender executable, if not run from Blender")
+    parser.add_argument(
+        "--cache",
+        default=cache.default_directory(),
+        help="Directory of computed shapes shared with Blender sessions")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Compute every shape, without reading or writing the cache")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild every shard, whether changed or not")
+    parser.add_argument(
+        "--shard-file",
+        help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def script_args():
+    # Blender passes its own arguments through; the script's follow "--".
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1:]
+    return sys.argv[1:]
+
+
+def ornament_rows():
+    # Every foil count and type, star skip and pick combinations and
+    # lancet arches across sharpness values.
+    rows = []
+    for foil_type in ("BARBED", "OVERLAP", "REGULAR"):
+        for foil_count in range(3, 13):
+            rows.append({
+                "shape": "FOIL",
+                "foil_type": foil_type,
+                "foil_count": foil_count})
+
+    for sectors in range(5, 13):
+        for skip in range(1, 4):
+            for pick in range(1, 4):
+                rows.append({
+                    "shape": "STAR",
+                    "sectors": sectors,
+                    "skip": [skip, pick]})
+
+    steps = 10
+    for i in range(0, steps + 1):
+        for face_type in ("NGON", "QUADS"):
+            rows.append({
+                "shape": "LANCET_ARCH",
+                "sharpness": i / steps,
+                "arch_weight": 0.25,
+                "face_type": face_type})
+
+    return rows
+
+
+def read_manifest(path, strict):
+    reader = manifest.ManifestReader(path, strict=strict)
+    rows = list(reader)
+    for error in reader.errors:
+        print(error, file=sys.stderr)
+    if reader.invalid_count > 0:
+        print("Skipped {} invalid rows".format(reader.invalid_count),
+            file=sys.stderr)
+    return rows
+
+
+def row_key(row):
+    return json.dumps(row, sort_keys=True, separators=(",", ":"))
+
+
+def code_digest():
+    # Output depends on the writers and this script as well as the
+    # kernels, so all of them are hashed.
+    sha = hashlib.sha1(kernels.code_version().encode("ascii"))
+    here = os.path.dirname(os.path.abspath(__file__))
+    for file_name in ("operators.py", "cli.py"):
+        with open(os.path.join(here, file_name), "rb") as src_file:
+            sha.update(src_file.read())
+    sha.update(str(FORMAT_VERSION).encode("ascii"))
+    return sha.hexdigest()
+
+
+def shard_rows(rows, shard_count):
+    # Rows are assigned by a hash of their parameters rather than by
+    # their position, so that adding a row changes only one shard.
+    shards = [[] for _ in range(shard_count)]
+    for row in rows:
+        key = row_key(row)
+        digest = hashlib.sha1(key.encode("utf-8")).digest()
+        shards[int.from_bytes(digest[:4], "little") % shard_count].append(row)
+    return shards
+
+
+def shard_digest(rows, code):
+    sha = hashlib.sha1(code.encode("ascii"))
+    for key in sorted(row_key(row) for row in rows):
+        sha.update(key.encode("utf-8"))
+        sha.update(b"\n")
+    return sha.hexdigest()
+
+
+def shard_paths(output, index):
+    stem = os.path.join(output, "shapes_{:03d}".format(index))
+    return stem + ".blend", stem + ".json"
+
+
+def catalog_id(shape):
+    return str(uuid.uuid5(CATALOG_NAMESPACE, "shape_batch/" + shape))
+
+
+def write_catalogs(output):
+    lines = [
+        "# This is an Asset Catalog Definition file for Blender.",
+        "#",
+        "# Empty lines and lines starting with `#` will be ignored.",
+        "# The first non-ignored line should be the version indicator.",
+        "# Other lines are of the format \"UUID:catalog/path/for/assets:simple catalog name\"",
+        "",
+        "VERSION 1",
+        ""]
+    for shape, entry in kernels.SHAPES.items():
+        lines.append("{}:Shapes/{}:Shapes-{}".format(
+            catalog_id(shape), entry["label"], entry["label"].replace(" ", "-")))
+    with open(os.path.join(output, CATALOG_FILE), "w", encoding="utf-8") as cat_file:
+        cat_file.write("\n".join(lines) + "\n")
+
+
+def asset_name(shape, params):
+    # Names list the parameters which differ from the shape's defaults,
+    # so that every asset in the library has a distinct name.
+    defaults = kernels.SHAPES[shape]["defaults"]
+    parts = []
+    for key, value in params.items():
+        if key == "origin" or value == defaults[key]:
+            continue
+        if isinstance(value, float):
+            value = "{:.3f}".format(value)
+        elif isinstance(value, (list, tuple)):
+            value = "-".join(str(v) for v in value)
+        parts.append("{} {}".format(key.replace("_", " ").title(), value))
+
+    name = kernels.describe(shape, params)
+    if parts:
+        name = name + " " + ", ".join(parts)
+    return name
+
+
+def build_shard(shard_file):
+    # Runs inside a background Blender process, one per shard.
+    import bpy # type: ignore
+    from shape_batch.operators import ShapeBatchMaker
+
+    with open(shard_file, "r", encoding="utf-8") as in_file:
+        shard = json.load(in_file)
+
+    cache_dir = shard["cache"]
+    collection = bpy.context.scene.collection
+    ids = set()
+    for row in shard["rows"]:
+        kind, arrays = cache.generate(row, cache_dir)
+        shape, params = kernels.resolve(row)
+        obj = ShapeBatchMaker.write_row(
+            row, kind, arrays, collection, asset_name(shape, params))
+        obj.asset_mark()
+        asset_data = obj.asset_data
+        asset_data.catalog_id = catalog_id(shape)
+        asset_data.description = row_key(row)
+        asset_data.tags.new(kernels.SHAPES[shape]["label"])
+        ids.add(obj)
+
+    blend_path = shard["blend"]
+    if os.path.exists(blend_path):
+        os.remove(blend_path)
+    bpy.data.libraries.write(blend_path, ids, fake_user=True, compress=True)
+
+    # The sidecar is written last, so a shard that failed part way
+    # through is rebuilt on the next run.
+    with open(shard["sidecar"], "w", encoding="utf-8") as out_file:
+        json.dump({
+            "digest": shard["digest"],
+            "count": len(ids)}, out_file)
+
+
+def blender_binary(args):
+    if args.blender:
+        return args.blender
+    try:
+        import bpy # type: ignore
+        return bpy.app.binary_path
+    except ImportError:
+        return "blender"
+
+
+def build_library(args):
+    start = time.perf_counter()
+    output = os.path.abspath(os.path.expanduser(args.output))
+    os.makedirs(output, exist_ok=True)
+
+    if args.manifest:
+        rows = read_manifest(args.manifest, args.strict)
+    else:
+        rows = ornament_rows()
+
+    jobs = max(1, args.jobs)
+    shard_count = args.shards
+    if shard_count < 1:
+        shard_count = jobs * 4
+    shard_count = max(1, min(shard_count, len(rows)))
+
+    # Stale cache entries are removed here, once, rather than by each
+    # shard's process.
+    cache_dir = None
+    if not args.no_cache:
+        cache_dir = cache.prepare(os.path.abspath(os.path.expanduser(args.cache)))
+
+    code = code_digest()
+    pending = []
+    for index, shard in enumerate(shard_rows(rows, shard_count)):
+        blend_path, sidecar_path = shard_paths(output, index)
+        digest = shard_digest(shard, code)
+
+        if not args.force and os.path.exists(blend_path) \
+            and os.path.exists(sidecar_path):
+            with open(sidecar_path, "r", encoding="utf-8") as sidecar_file:
+                if json.load(sidecar_file).get("digest") == digest:
+                    continue
+
+        if os.path.exists(sidecar_path):
+            os.remove(sidecar_path)
+        shard_file = os.path.join(output, "shapes_{:03d}.rows.json".format(index))
+        with open(shard_file, "w", encoding="utf-8") as out_file:
+            json.dump({
+                "blend": blend_path,
+                "sidecar": sidecar_path,
+                "digest": digest,
+                "cache": cache_dir,
+                "rows": shard}, out_file)
+        pending.append(shard_file)
+
+    # Shards left over from a run with a larger shard count are removed.
+    index = shard_count
+    while True:
+        blend_path, sidecar_path = shard_paths(output, index)
+        if not os.path.exists(blend_path) and not os.path.exists(sidecar_path):
+            break
+        for path in (blend_path, sidecar_path):
+            if os.path.exists(path):
+                os.remove(path)
+        index = index + 1
+
+    write_catalogs(output)
+
+    print("{} rows in {} shards, {} to build".format(
+        len(rows), shard_count, len(pending)))
+
+    binary = blender_binary(args)
+    script = os.path.abspath(__file__)
+    running = []
+    failed = []
+    while pending or running:
+        while pending and len(running) < jobs:
+            shard_file = pending.pop()
+            proc = subprocess.Popen([
+                binary, "--background", "--factory-startup",
+                "--python-exit-code", "1",
+                "--python", script, "--",
+                "--output", output, "--shard-file", shard_file],
+                stdout=subprocess.DEVNULL)
+            running.append((proc, shard_file))
+
+        time.sleep(0.05)
+        still_running = []
+        for proc, shard_file in running:
+            returncode = proc.poll()
+            if returncode is None:
+                still_running.append((proc, shard_file))
+            elif returncode != 0:
+                failed.append(shard_file)
+            else:
+                os.remove(shard_file)
+        running = still_running
+
+    print("Built library in {:.3f} s".format(time.perf_counter() - start))
+    for shard_file in failed:
+        print("Failed: {}".format(shard_file), file=sys.stderr)
+    return 1 if failed else 0
+
+
+def main(argv):
+    args = parse_args(argv)
+    if args.shard_file:
+        build_shard(args.shard_file)
+        return 0
+    return build_library(args)
+
+
+if __name__ == "__main__":
+    # Blender ignores the exit code of a script unless it exits itself.
+    code = main(script_args())
+    if code:
+        sys.exit(code)
@@ -0,0 +1,1465 @@
+import array
+import functools
+import hashlib
+import math
+
+# This module must not import bpy. It is loaded by worker processes,
+# which run outside of Blender, so each kernel is a port of the bpy-free
+# body of its operator's execute method. Results are flat arrays which
+# can be written to a datablock in bulk with foreach_set.
+
+MESH_ARRAYS = (
+    ("co", "f"),
+    ("uv", "f"),
+    ("loop_starts", "i"),
+    ("loop_verts", "i"),
+    ("edges", "i"))
+
+CURVE_ARRAYS = (
+    ("knot_counts", "i"),
+    ("cyclic", "i"),
+    ("resolution", "i"),
+    ("co", "f"),
+    ("handle_left", "f"),
+    ("handle_right", "f"),
+    ("left_types", "i"),
+    ("right_types", "i"))
+
+HANDLE_TYPES = ("FREE", "VECTOR", "ALIGNED", "AUTO")
+
+
+@functools.lru_cache(maxsize=1)
+def code_version():
+    # Changes whenever this file changes, so that anything derived from
+    # kernel output can tell when it is stale.
+    with open(__file__, "rb") as kernels_file:
+        return hashlib.sha1(kernels_file.read()).hexdigest()[:16]
+
+
+def pack_mesh(vs, vts, fs, stroke="OPEN", vt_fs=None):
+    # Texture coordinates are expanded per loop here, so that the writer
+    # does no per-element work. They are indexed like the vertices
+    # unless separate indices are given. A mesh without faces is
+    # connected with edges, either as an open or a closed stroke.
+    co = array.array("f", [c for v in vs for c in v])
+    uv = array.array("f")
+    loop_starts = array.array("i")
+    loop_verts = array.array("i")
+    edges = array.array("i")
+
+    if vt_fs is None:
+        vt_fs = fs
+    for f, vt_f in zip(fs, vt_fs):
+        loop_starts.append(len(loop_verts))
+        loop_verts.extend(f)
+        for h in vt_f:
+            uv.extend(vts[h])
+
+    len_vs = len(vs)
+    if len(fs) <= 0 and len_vs > 1:
+        len_edges = len_vs - 1
+        if stroke == "CLOSED":
+            len_edges = len_vs
+        h = 0
+        while h < len_edges:
+            edges.append(h)
+            edges.append((h + 1) % len_vs)
+            h = h + 1
+
+    return {
+        "co": co,
+        "uv": uv,
+        "loop_starts": loop_starts,
+        "loop_verts": loop_verts,
+        "edges": edges}
+
+
+def pack_curve(splines, res_u):
+    # Each spline is a pair of a cyclic flag and a list of knots, where
+    # a knot is a coordinate, a left handle, a right handle and the
+    # indices of the left and right handle types.
+    arrays = {}
+    for key, typecode in CURVE_ARRAYS:
+        arrays[key] = array.array(typecode)
+
+    for cyclic, knots in splines:
+        arrays["knot_counts"].append(len(knots))
+        arrays["cyclic"].append(1 if cyclic else 0)
+        arrays["resolution"].append(res_u)
+        for co, handle_left, handle_right, left_type, right_type in knots:
+            arrays["co"].extend(co)
+            arrays["handle_left"].extend(handle_left)
+            arrays["handle_right"].extend(handle_right)
+            arrays["left_types"].append(left_type)
+            arrays["right_types"].append(right_type)
+
+    return arrays
+
+
+def calc_ribbon(
+        vs, vts, is_closed, width, join_type,
+        uv_scale, uv_cosa=1.0, uv_sina=0.0):
+    # Offsets the outline by half the width to either side. Each
+    # join has one vertex on its inner side and one or more on its
+    # outer side. Miters longer than four half widths are beveled,
+    # as in SVG. Texture coordinates are offset from those of the
+    # outline, so the ribbon keeps the shape's planar projection.
+    len_vs = len(vs)
+    half_width = max(0.000001, width * 0.5)
+    miter_limit = 4.0
+    round_step = math.pi / 12.0
+
+    # Find the unit direction of the edge leaving each vertex. An
+    # open outline's last vertex reuses the direction of its last
+    # edge, so its ends are cut square.
+    len_edges = len_vs
+    if not is_closed:
+        len_edges = len_vs - 1
+    dirs = [(1.0, 0.0)] * len_vs
+    i = 0
+    while i < len_edges:
+        v_curr = vs[i]
+        v_next = vs[(i + 1) % len_vs]
+        dx = v_next[0] - v_curr[0]
+        dy = v_next[1] - v_curr[1]
+        mag = math.sqrt(dx * dx + dy * dy)
+        if mag > 0.000001:
+            dirs[i] = (dx / mag, dy / mag)
+        i = i + 1
+    if not is_closed and len_vs > 1:
+        dirs[len_vs - 1] = dirs[len_vs - 2]
+
+    rvs = []
+    rvts = []
+    rights = [None] * len_vs
+    lefts = [None] * len_vs
+    fs = []
+
+    i = 0
+    while i < len_vs:
+        v = vs[i]
+        d1 = dirs[i]
+        d0 = dirs[(i - 1) % len_vs]
+        if not is_closed and i == 0:
+            d0 = d1
+
+        # Normals point to the left of each edge.
+        n0 = (-d0[1], d0[0])
+        n1 = (-d1[1], d1[0])
+        cross = d0[0] * d1[1] - d0[1] * d1[0]
+        dot = d0[0] * d1[0] + d0[1] * d1[1]
+
+        # The miter bisects the two normals. Its length is the half
+        # width over the cosine of half the turn.
+        mx = n0[0] + n1[0]
+        my = n0[1] + n1[1]
+        m_mag = math.sqrt(mx * mx + my * my)
+        cos_half = 0.0
+        if m_mag > 0.000001:
+            mx = mx / m_mag
+            my = my / m_mag
+            cos_half = mx * n0[0] + my * n0[1]
+
+        # For a left turn, the right side is outer.
+        side = 1.0
+        if cross < 0.0:
+            side = -1.0
+
+        # Shallow turns are mitered whatever the join type, since a
+        # rounded join would be indistinguishable.
+        angle = math.atan2(abs(cross), dot)
+        offsets = []
+        if cos_half * miter_limit >= 1.0 \
+            and (join_type == "MITER"
+                or angle <= round_step + 0.000001):
+            miter_len = half_width / cos_half
+            offsets.append((-side * mx * miter_len,
+                            -side * my * miter_len))
+        elif join_type == "ROUND":
+            # A turn of a whole number of steps is not given an
+            # extra step by rounding error.
+            count = max(1, math.ceil(angle / round_step - 0.000001))
+            to_angle = side * angle / count
+            k = 0
+            while k < count + 1:
+                a = k * to_angle
+                cosa = math.cos(a)
+                sina = math.sin(a)
+                offsets.append((
+                    -side * half_width * (cosa * n0[0] - sina * n0[1]),
+                    -side * half_width * (cosa * n0[1] + sina * n0[0])))
+                k = k + 1
+        else:
+            offsets.append((-side * half_width * n0[0],
+                            -side * half_width * n0[1]))
+            offsets.append((-side * half_width * n1[0],
+                            -side * half_width * n1[1]))
+
+        inner = (side * half_width * n0[0],
+                 side * half_width * n0[1])
+        if cos_half > 0.000001:
+            inner_len = half_width / cos_half
+            inner = (side * mx * inner_len,
+                     side * my * inner_len)
+
+        start = len(rvs)
+        for offset in [inner] + offsets:
+            rvs.append((v[0] + offset[0], v[1] + offset[1], 0.0))
+            du = uv_cosa * offset[0] - uv_sina * offset[1]
+            dv = uv_cosa * offset[1] + uv_sina * offset[0]
+            rvts.append((
+                vts[i][0] + uv_scale * du,
+                vts[i][1] + uv_scale * dv))
+        len_offsets = len(offsets)
+        outer_indices = list(range(start + 1, start + 1 + len_offsets))
+
+        if side > 0.0:
+            lefts[i] = [start]
+            rights[i] = outer_indices
+        else:
+            lefts[i] = outer_indices
+            rights[i] = [start]
+
+        # Fill the join between the outer vertices with a fan from
+        # the inner vertex.
+        k = 0
+        while k < len_offsets - 1:
+            if side > 0.0:
+                fs.append((
+                    start,
+                    outer_indices[k],
+                    outer_indices[k + 1]))
+            else:
+                fs.append((
+                    start,
+                    outer_indices[k + 1],
+                    outer_indices[k]))
+            k = k + 1
+
+        i = i + 1
+
+    i = 0
+    while i < len_edges:
+        j = (i + 1) % len_vs
+        fs.append((
+            rights[i][-1],
+            rights[j][0],
+            lefts[j][0],
+            lefts[i][-1]))
+        i = i + 1
+
+    return rvs, rvts, fs
+
+
+def turn(a, b, c):
+    return (b[0] - a[0]) * (c[1] - b[1]) \
+        - (b[1] - a[1]) * (c[0] - b[0])
+
+
+def ear_clip(vs):
+    # Vertices are removed from a linked list of indices, so that
+    # clipping an ear does not shift the rest. Only reflex vertices
+    # can lie inside an ear, so only they are tested. The outline
+    # is assumed to wind counter-clockwise.
+    len_vs = len(vs)
+    if len_vs < 3:
+        return tuple()
+
+    prev_indices = [0] * len_vs
+    next_indices = [0] * len_vs
+    is_reflex = [False] * len_vs
+    k = 0
+    while k < len_vs:
+        prev_indices[k] = (k - 1) % len_vs
+        next_indices[k] = (k + 1) % len_vs
+        is_reflex[k] = turn(
+            vs[(k - 1) % len_vs],
+            vs[k],
+            vs[(k + 1) % len_vs]) <= 0.0
+        k = k + 1
+
+    fs = []
+    remaining = len_vs
+    misses = 0
+    i = 0
+    while remaining > 3:
+        a = prev_indices[i]
+        c = next_indices[i]
+
+        is_ear = not is_reflex[i]
+        if is_ear:
+            va = vs[a]
+            vb = vs[i]
+            vc = vs[c]
+            j = next_indices[c]
+            while j != a:
+                if is_reflex[j]:
+                    vj = vs[j]
+                    if turn(va, vb, vj) >= 0.0 \
+                        and turn(vb, vc, vj) >= 0.0 \
+                        and turn(vc, va, vj) >= 0.0:
+                        is_ear = False
+                        break
+                j = next_indices[j]
+
+        # A full lap without an ear means the outline is degenerate,
+        # so clip anyway rather than loop forever.
+        if is_ear or misses > remaining:
+            fs.append((a, i, c))
+            next_indices[a] = c
+            prev_indices[c] = a
+            remaining = remaining - 1
+            misses = 0
+
+            is_reflex[a] = turn(
+                vs[prev_indices[a]], vs[a], vs[c]) <= 0.0
+            is_reflex[c] = turn(
+                vs[a], vs[c], vs[next_indices[c]]) <= 0.0
+
+            # Skip past the neighbor so that successive ears come
+            # from around the outline rather than fanning from one.
+            i = next_indices[c]
+        else:
+            i = c
+            misses = misses + 1
+
+    fs.append((prev_indices[i], i, next_indices[i]))
+    return tuple(fs)
+
+
+@functools.lru_cache(maxsize=128)
+def zigzag_face_indices(len_vs):
+    # A convex loop is zigzagged from both of its ends toward the middle
+    # without a central vertex.
+    len_fs = max(0, len_vs - 2)
+    fs = [(0, 0, 0)] * len_fs
+    lo = 0
+    hi = len_vs - 1
+    k = 0
+    while k < len_fs:
+        if k % 2 == 0:
+            fs[k] = (lo, lo + 1, hi)
+            lo = lo + 1
+        else:
+            fs[k] = (lo, hi - 1, hi)
+            hi = hi - 1
+        k = k + 1
+    return tuple(fs)
+
+
+@functools.lru_cache(maxsize=128)
+def arc_face_indices(arc_type, sectors):
+    fs = []
+    if arc_type == "CHORD":
+        fs = [tuple(range(0, sectors))]
+
+    elif arc_type == "CHORD_TRIS":
+        fs = zigzag_face_indices(sectors)
+
+    elif arc_type == "PIE":
+        len_fs = sectors - 1
+        fs = [(0, 0, 0)] * len_fs
+        k = 0
+        while k < len_fs:
+            fs[k] = (0, k + 1, k + 2)
+            k = k + 1
+
+    elif arc_type == "SECTOR":
+        len_fs = sectors - 1
+        sec_arc_2 = sectors * 2
+        fs = [(0, 0, 0, 0)] * len_fs
+        k = 0
+        while k < len_fs:
+            fs[k] = (
+                k,
+                k + 1,
+                sec_arc_2 - k - 2,
+                sec_arc_2 - k - 1)
+            k = k + 1
+
+    elif arc_type == "CIRCLE":
+        fs = [(0, 0, 0)] * sectors
+        k = 0
+        while k < sectors:
+            fs[k] = (0, 1 + k, 1 + (k + 1) % sectors)
+            k = k + 1
+
+    elif arc_type == "ANNULUS":
+        fs = [(0, 0, 0, 0)] * sectors
+        k = 0
+        while k < sectors:
+            fs[k] = (
+                k % sectors,
+                (k + 1) % sectors,
+                sectors + (-k - 2) % sectors,
+                sectors + (-k - 1) % sectors)
+            k = k + 1
+
+    return tuple(fs)
+
+
+def arc_mesh(params):
+    arc_type = params["arc_type"]
+    sectors_per_circle = max(3, params["sectors"])
+    radius = max(0.000001, params["radius"])
+    r_scalar = min(1.0 - 0.000001, max(0.000001, params["r_scalar"]))
+    start_angle = params["start_angle"]
+    stop_angle = params["stop_angle"]
+    x_orig, y_orig = params["origin"]
+    stroke_width = params["stroke_width"]
+    join_type = params["join_type"]
+    r_inner = radius * r_scalar
+
+    angle0 = start_angle % math.tau
+    angle1 = stop_angle % math.tau
+    arc_len = (angle1 - angle0) % math.tau
+
+    if arc_len < 0.00139 \
+        or abs(math.tau - (stop_angle - start_angle)) < 0.00139:
+
+        j_to_theta = math.tau / sectors_per_circle
+
+        if arc_type == "SECTOR" and r_inner > 0.00001:
+            len_vs = sectors_per_circle * 2
+            vs = [(0.0, 0.0, 0.0)] * len_vs
+            vts = [(0.5, 0.5)] * len_vs
+
+            j = 0
+            while j < sectors_per_circle:
+                theta = start_angle + j * j_to_theta
+                cos_theta = math.cos(theta)
+                sin_theta = math.sin(theta)
+
+                vs[j] = (x_orig + radius * cos_theta,
+                    y_orig + radius * sin_theta, 0.0)
+                vts[j] = (0.5 * cos_theta + 0.5,
+                    0.5 * sin_theta + 0.5)
+
+                j = j + 1
+
+                vs[len_vs - j] = (x_orig + r_inner * cos_theta,
+                    y_orig + r_inner * sin_theta, 0.0)
+                vts[len_vs - j] = (0.5 * r_scalar * cos_theta + 0.5,
+                    0.5 * r_scalar * sin_theta + 0.5)
+
+            return pack_mesh(vs, vts,
+                arc_face_indices("ANNULUS", sectors_per_circle))
+
+        # A ribbon skips the central vertex and closes around the
+        # circle.
+        is_ribbon = arc_type == "RIBBON"
+        offset = 1
+        if is_ribbon:
+            offset = 0
+        len_vs = sectors_per_circle + offset
+        vs = [(x_orig, y_orig, 0.0)] * len_vs
+        vts = [(0.5, 0.5)] * len_vs
+
+        j = 0
+        while j < sectors_per_circle:
+            theta = start_angle + j * j_to_theta
+            cos_theta = math.cos(theta)
+            sin_theta = math.sin(theta)
+
+            vs[offset + j] = (x_orig + radius * cos_theta,
+                y_orig + radius * sin_theta, 0.0)
+            vts[offset + j] = (0.5 * cos_theta + 0.5,
+                0.5 * sin_theta + 0.5)
+
+            j = j + 1
+
+        if is_ribbon:
+            return pack_mesh(*calc_ribbon(
+                vs, vts, True, stroke_width, join_type, 0.5 / radius))
+
+        return pack_mesh(vs, vts,
+            arc_face_indices("CIRCLE", sectors_per_circle))
+
+    fudge = 0
+    if arc_len % (math.pi * 0.5) > 0.00001:
+        fudge = fudge + 1
+    sectors_per_arc = max(2, math.ceil(fudge
+        + sectors_per_circle * arc_len / math.tau))
+
+    to_step = 1.0 / (sectors_per_arc - 1.0)
+    dest_angle = angle0 + arc_len
+
+    fs = arc_face_indices(arc_type, sectors_per_arc)
+    len_vs = sectors_per_arc
+    if arc_type == "PIE":
+        len_vs = sectors_per_arc + 1
+    elif arc_type == "SECTOR":
+        len_vs = sectors_per_arc * 2
+
+    vs = [(x_orig, y_orig, 0.0)] * len_vs
+    vts = [(0.5, 0.5)] * len_vs
+
+    # Pie arcs are offset by their central vertex.
+    offset = 0
+    if arc_type == "PIE":
+        offset = 1
+
+    j = 0
+    while j < sectors_per_arc:
+        t = j * to_step
+        angle = (1.0 - t) * angle0 + t * dest_angle
+        cosa = math.cos(angle)
+        sina = math.sin(angle)
+
+        vs[offset + j] = (x_orig + radius * cosa,
+            y_orig + radius * sina, 0.0)
+        if arc_type != "STROKE":
+            vts[offset + j] = (0.5 * cosa + 0.5, 0.5 * sina + 0.5)
+
+        if arc_type == "SECTOR":
+            vs[len_vs - 1 - j] = (x_orig + r_inner * cosa,
+                y_orig + r_inner * sina, 0.0)
+            vts[len_vs - 1 - j] = (0.5 * r_scalar * cosa + 0.5,
+                0.5 * r_scalar * sina + 0.5)
+
+        j = j + 1
+
+    if arc_type == "RIBBON":
+        return pack_mesh(*calc_ribbon(
+            vs, vts, False, stroke_width, join_type, 0.5 / radius))
+
+    return pack_mesh(vs, vts, fs, "OPEN")
+
+
+def egg_mesh(params):
+    sectors_per_circle = max(3, params["sectors"])
+    radius = max(0.000001, params["radius"])
+    offset_angle = params["offset_angle"]
+    origin = params["origin"]
+    face_type = params["face_type"]
+    stroke_width = params["stroke_width"]
+    join_type = params["join_type"]
+
+    pi_75pc = math.pi * 0.75
+    pi_half = math.pi * 0.5
+    pi_qrtr = math.pi * 0.25
+    sqrt_3 = math.sqrt(3)
+
+    sectors_per_bottom = max(3, math.ceil(sectors_per_circle * 0.5))
+    sectors_per_top = max(3, math.ceil((sectors_per_circle / sqrt_3) * 0.25))
+    sectors_per_side = max(3, math.ceil(2.0 * sectors_per_circle * 0.125))
+
+    i_radius = 1.0 / 1.2886751345948129
+    j_radius = 2.0 / 1.2886751345948129
+    k_radius = (1.0 / sqrt_3) / 1.2886751345948129
+    m_radius = 2.0 / 1.2886751345948129
+
+    # (1 / (2 * sqrt(3))) / 1.2886751345948129
+    y_displace = 0.22400923773979597
+
+    # Count, center x, center y, radius, start angle, arc length. The
+    # first point of each arc is excluded, as it is the last point of
+    # the previous arc.
+    arc_params = (
+        (sectors_per_side, -i_radius, 0.0, j_radius, 0.0, pi_qrtr),
+        (sectors_per_top, 0.0, i_radius, k_radius, pi_qrtr, pi_half),
+        (sectors_per_side, i_radius, 0.0, m_radius, pi_75pc, pi_qrtr),
+        (sectors_per_bottom, 0.0, 0.0, i_radius, math.pi, math.pi))
+
+    use_central_vert = face_type == "TRI_FAN"
+    len_vs = sectors_per_side * 2 + sectors_per_top + sectors_per_bottom - 4
+    if use_central_vert:
+        len_vs = len_vs + 1
+
+    cosa = math.cos(offset_angle)
+    sina = math.sin(offset_angle)
+    x_displace = origin[0]
+    y_origin = origin[1] - y_displace * radius
+
+    # The central vertex, if any, is last.
+    x_center = -sina * y_displace * radius
+    y_center = cosa * y_displace * radius
+    vs = [(x_displace + x_center, y_origin + y_center, 0.0)] * len_vs
+    vts = [(0.5, 0.5)] * len_vs
+
+    idx = 0
+    for count, x_arc, y_arc, r_arc, theta_start, arc_len in arc_params:
+        to_theta = arc_len / (count - 1)
+        j = 1
+        while j < count:
+            theta = theta_start + j * to_theta
+            x = x_arc + r_arc * math.cos(theta)
+            y = y_arc + r_arc * math.sin(theta)
+            vts[idx] = (x * 0.5 + 0.5, (y - y_displace) * 0.5 + 0.5)
+
+            x = x * radius
+            y = y * radius
+            vs[idx] = (
+                x_displace + cosa * x - sina * y,
+                y_origin + cosa * y + sina * x,
+                0.0)
+            idx = idx + 1
+            j = j + 1
+
+    fs = ()
+    if face_type == "NGON":
+        fs = (tuple(range(0, len_vs)),)
+    elif face_type == "TRI_FAN":
+        len_fs = len_vs - 1
+        fs = [(0, 0, 0)] * len_fs
+        g = 0
+        while g < len_fs:
+            fs[g] = (len_vs - 1, g % len_fs, (g + 1) % len_fs)
+            g = g + 1
+    elif face_type == "TRIS":
+        fs = zigzag_face_indices(len_vs)
+    elif face_type == "RIBBON":
+        # Texture coordinates of the egg are not rotated with it.
+        return pack_mesh(*calc_ribbon(
+            vs, vts, True, stroke_width, join_type, 0.5 / radius,
+            math.cos(-offset_angle), math.sin(-offset_angle)))
+
+    return pack_mesh(vs, vts, fs, "CLOSED")
+
+
+@functools.lru_cache(maxsize=128)
+def polar_grid_face_indices(rings, sectors):
+    ring_sec = rings * sectors
+    num_tris = sectors
+    num_quads = ring_sec - sectors
+    fs = [(0, 0, 0, 0)] * (num_tris + num_quads)
+
+    j = 0
+    while j < num_tris:
+        fs[j] = (0, 1 + j % sectors, 1 + (j + 1) % sectors)
+        j = j + 1
+
+    i = 0
+    while i < num_quads:
+        sector = i % sectors
+        ring = i // sectors
+
+        fs[num_tris + i] = (
+            ring * sectors + 1 + sector,
+            (ring + 1) * sectors + 1 + sector,
+            (ring + 1) * sectors + 1 + (sector + 1) % sectors,
+            ring * sectors + 1 + (sector + 1) % sectors)
+
+        i = i + 1
+
+    return tuple(fs)
+
+
+def polar_grid_mesh(params):
+    rings = max(1, params["rings"])
+    sectors = max(3, params["sectors"])
+    max_radius = max(0.000002, params["radius"])
+    offset_angle = params["offset_angle"]
+    origin = params["origin"]
+
+    min_radius = max_radius / rings
+    vt_max_radius = 0.5
+    vt_min_radius = vt_max_radius / rings
+
+    to_ring_fac = 1.0
+    if rings != 1:
+        to_ring_fac = 1.0 / (rings - 1.0)
+
+    to_sector_theta = math.tau / sectors
+    unit_circle = [(1.0, 0.0)] * sectors
+    j = 0
+    while j < sectors:
+        theta = offset_angle + j * to_sector_theta
+        unit_circle[j] = (math.cos(theta), math.sin(theta))
+        j = j + 1
+
+    ring_sec = rings * sectors
+    len_vs = 1 + ring_sec
+    vs = [(origin[0], origin[1], 0.0)] * len_vs
+    vts = [(0.5, 0.5)] * len_vs
+
+    k = 0
+    while k < ring_sec:
+        sector = k % sectors
+        ring = k // sectors
+
+        t = ring * to_ring_fac
+        u = 1.0 - t
+        radius = u * min_radius + t * max_radius
+        vt_radius = u * vt_min_radius + t * vt_max_radius
+
+        cosa, sina = unit_circle[sector]
+
+        vs[1 + k] = (
+            origin[0] + radius * cosa,
+            origin[1] + radius * sina,
+            0.0)
+        vts[1 + k] = (cosa * vt_radius + 0.5, sina * vt_radius + 0.5)
+
+        k = k + 1
+
+    return pack_mesh(vs, vts, polar_grid_face_indices(rings, sectors))
+
+
+def star_mesh(params):
+    sectors = max(3, params["sectors"])
+    radius = max(0.000001, params["radius"])
+    inset = params["inset"]
+    offset_angle = params["offset_angle"]
+    x_center, y_center = params["origin"]
+    v_skip, v_pick = params["skip"]
+
+    not_valid = v_skip < 1 \
+        or v_pick < 1 \
+        or inset <= 0.0 \
+        or inset >= 1.0
+
+    pick_skip = v_pick + v_skip
+    len_vs = pick_skip * sectors
+    if not_valid:
+        len_vs = sectors
+
+    vs = [(0.0, 0.0, 0.0)] * len_vs
+    vts = [(0.5, 0.5)] * len_vs
+
+    to_theta = math.tau / len_vs
+    cos_theta = math.cos(to_theta)
+    v_inset_radius = (1.0 - inset) * radius * cos_theta
+    vt_inset_radius = (1.0 - inset) * 0.5 * cos_theta
+
+    j = 0
+    while j < len_vs:
+        v_radius = radius
+        vt_radius = 0.5
+        if not not_valid and j % pick_skip >= v_pick:
+            v_radius = v_inset_radius
+            vt_radius = vt_inset_radius
+
+        angle = offset_angle + j * to_theta
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+
+        vs[j] = (
+            x_center + v_radius * cos_a,
+            y_center + v_radius * sin_a,
+            0.0)
+        vts[j] = (
+            0.5 + vt_radius * cos_a,
+            0.5 + vt_radius * sin_a)
+
+        j = j + 1
+
+    # Ears and ribbons depend on coordinates, not only on the vertex
+    # count. A fan's central vertex is appended last.
+    face_type = params["face_type"]
+    fs = ()
+    if face_type == "NGON":
+        fs = (tuple(range(0, len_vs)),)
+    elif face_type == "TRI_FAN":
+        vs.append((x_center, y_center, 0.0))
+        vts.append((0.5, 0.5))
+        fs = tuple(
+            (len_vs, k, (k + 1) % len_vs) for k in range(len_vs))
+    elif face_type == "TRIS":
+        fs = ear_clip(vs)
+    elif face_type == "RIBBON":
+        return pack_mesh(*calc_ribbon(
+            vs, vts, True, params["stroke_width"], params["join_type"],
+            0.5 / radius))
+
+    return pack_mesh(vs, vts, fs, "CLOSED")
+
+
+@functools.lru_cache(maxsize=128)
+def lancet_face_indices(face_type, sectors):
+    len_vs = (sectors * 2 + 1) * 2
+    if face_type != "QUADS":
+        return (tuple(range(0, len_vs)),)
+
+    len_fs = sectors * 2
+    fs = [(0, 0, 0, 0)] * len_fs
+    k = 0
+    while k < len_fs:
+        fs[k] = (
+            k,
+            k + 1,
+            len_vs - k - 2,
+            len_vs - k - 1)
+        k = k + 1
+    return tuple(fs)
+
+
+@functools.lru_cache(maxsize=128)
+def lancet_solid_indices(face_type, sectors, ring_count):
+    # The front cap reuses the flat faces. The back cap reverses
+    # them, so that it faces away. Walls join each ring to the next.
+    # Texture coordinates of the walls follow those of the caps, with
+    # a seam where the outline closes.
+    cap_fs = lancet_face_indices(face_type, sectors)
+    len_ring = (sectors * 2 + 1) * 2
+    len_caps = len(cap_fs)
+    back_offset = len_ring * (ring_count - 1)
+    len_fs = len_caps * 2 + back_offset
+    v_fs = [()] * len_fs
+    vt_fs = [()] * len_fs
+
+    k = 0
+    while k < len_caps:
+        f = cap_fs[k]
+        f_rev = f[::-1]
+        v_fs[k] = f
+        vt_fs[k] = f
+        v_fs[len_caps + k] = tuple(back_offset + h for h in f_rev)
+        vt_fs[len_caps + k] = f_rev
+        k = k + 1
+
+    cursor = len_caps * 2
+    r = 0
+    while r < ring_count - 1:
+        v_curr = r * len_ring
+        v_next = v_curr + len_ring
+        vt_curr = len_ring + r * (len_ring + 1)
+        vt_next = vt_curr + len_ring + 1
+
+        k = 0
+        while k < len_ring:
+            k_next = (k + 1) % len_ring
+            v_fs[cursor] = (
+                v_curr + k,
+                v_next + k,
+                v_next + k_next,
+                v_curr + k_next)
+            vt_fs[cursor] = (
+                vt_curr + k,
+                vt_next + k,
+                vt_next + k + 1,
+                vt_curr + k + 1)
+            cursor = cursor + 1
+            k = k + 1
+
+        r = r + 1
+
+    return tuple(v_fs), tuple(vt_fs)
+
+
+def calc_miters(vs):
+    # Returns the offset of each vertex of a closed outline per unit
+    # of inset. The outline winds counter-clockwise, so its inward
+    # miter is to the left.
+    len_ring = len(vs)
+    miters = [(0.0, 0.0)] * len_ring
+    i = 0
+    while i < len_ring:
+        v_prev = vs[(i - 1) % len_ring]
+        v_curr = vs[i]
+        v_next = vs[(i + 1) % len_ring]
+
+        d0x = v_curr[0] - v_prev[0]
+        d0y = v_curr[1] - v_prev[1]
+        d0_mag = math.sqrt(d0x * d0x + d0y * d0y)
+        d1x = v_next[0] - v_curr[0]
+        d1y = v_next[1] - v_curr[1]
+        d1_mag = math.sqrt(d1x * d1x + d1y * d1y)
+
+        if d0_mag > 0.000001 and d1_mag > 0.000001:
+            d0x = d0x / d0_mag
+            d0y = d0y / d0_mag
+            d1x = d1x / d1_mag
+            d1y = d1y / d1_mag
+
+            mx = -d0y - d1y
+            my = d0x + d1x
+            m_mag = math.sqrt(mx * mx + my * my)
+            if m_mag > 0.000001:
+                mx = mx / m_mag
+                my = my / m_mag
+                cos_half = max(0.000001, mx * -d0y + my * d0x)
+                miters[i] = (mx / cos_half, my / cos_half)
+
+        i = i + 1
+
+    return miters
+
+
+def calc_chamfer_limit(vs):
+    # Returns the largest inset before a cap folds over itself. An
+    # edge collapses when its ends, moving along their miters, meet.
+    # The band pinches when a vertex reaches the inset of an edge on
+    # the far side of the band.
+    miters = calc_miters(vs)
+    len_ring = len(vs)
+    limit = float("inf")
+    j = 0
+    while j < len_ring:
+        j_next = (j + 1) % len_ring
+        a = vs[j]
+        b = vs[j_next]
+        ex = b[0] - a[0]
+        ey = b[1] - a[1]
+        e_mag = math.sqrt(ex * ex + ey * ey)
+        if e_mag > 0.000001:
+            dx = ex / e_mag
+            dy = ey / e_mag
+            m_a = miters[j]
+            m_b = miters[j_next]
+            closing = (m_a[0] - m_b[0]) * dx + (m_a[1] - m_b[1]) * dy
+            if closing > 0.000001:
+                limit = min(limit, e_mag / closing)
+
+            i = 0
+            while i < len_ring:
+                if i != j and i != j_next:
+                    px = vs[i][0] - a[0]
+                    py = vs[i][1] - a[1]
+                    t = px * dx + py * dy
+                    dist = px * -dy + py * dx
+                    if dist > 0.0 and t >= 0.0 and t <= e_mag:
+                        m_i = miters[i]
+                        approach = 1.0 - (m_i[0] * -dy + m_i[1] * dx)
+                        if approach > 0.000001:
+                            limit = min(limit, dist / approach)
+                i = i + 1
+        j = j + 1
+
+    return limit
+
+
+def calc_solid(vs, vts, depth, chamfer):
+    # Extrudes the closed outline of the arch back along the z axis.
+    # With a chamfer, the caps are inset by the chamfer and meet the
+    # walls at 45 degrees. Returns the vertices of each ring, front
+    # to back, the texture coordinates of the caps then the walls,
+    # and the number of rings.
+    len_ring = len(vs)
+    depth = max(0.000001, depth)
+    chamfer = min(max(chamfer, 0.0), depth * 0.5)
+
+    # Each ring is an inset and a depth.
+    rings = [(0.0, 0.0), (0.0, -depth)]
+    if chamfer * 2.0 >= depth:
+        rings = [
+            (chamfer, 0.0),
+            (0.0, -chamfer),
+            (chamfer, -depth)]
+    elif chamfer > 0.0:
+        rings = [
+            (chamfer, 0.0),
+            (0.0, -chamfer),
+            (0.0, chamfer - depth),
+            (chamfer, -depth)]
+    ring_count = len(rings)
+
+    # Arc length along the outline is accumulated for the walls'
+    # texture coordinates.
+    miters = calc_miters(vs)
+    perimeter = [0.0] * (len_ring + 1)
+    i = 0
+    while i < len_ring:
+        v_curr = vs[i]
+        v_next = vs[(i + 1) % len_ring]
+        perimeter[i + 1] = perimeter[i] + math.sqrt(
+            (v_next[0] - v_curr[0]) ** 2
+            + (v_next[1] - v_curr[1]) ** 2)
+        i = i + 1
+
+    to_u = 1.0
+    if perimeter[len_ring] > 0.0:
+        to_u = 1.0 / perimeter[len_ring]
+
+    vs_solid = [(0.0, 0.0, 0.0)] * (len_ring * ring_count)
+    vts_solid = list(vts) + [(0.0, 0.0)] * ((len_ring + 1) * ring_count)
+
+    r = 0
+    while r < ring_count:
+        inset, z = rings[r]
+        vt_v = 1.0 + z / depth
+        v_offset = r * len_ring
+        vt_offset = len_ring + r * (len_ring + 1)
+
+        k = 0
+        while k < len_ring:
+            v = vs[k]
+            miter = miters[k]
+            vs_solid[v_offset + k] = (
+                v[0] + inset * miter[0],
+                v[1] + inset * miter[1],
+                z)
+            vts_solid[vt_offset + k] = (perimeter[k] * to_u, vt_v)
+            k = k + 1
+
+        vts_solid[vt_offset + len_ring] = (1.0, vt_v)
+        r = r + 1
+
+    return vs_solid, vts_solid, ring_count
+
+
+def lancet_arch_mesh(params):
+    sectors = max(3, params["sectors"])
+    sharpness = min(max(params["sharpness"], 0.0), 1.0)
+    arch_weight = min(max(params["arch_weight"], 0.0), 1.0)
+    arch_offset = min(max(params["arch_offset"], -1.0), 1.0)
+    radius_center = max(0.000001, params["radius"])
+    x_orig, y_orig = params["origin"]
+
+    arc_radius_norm = (1.0 - sharpness) * 2.0 + sharpness * 4.0
+    arc_x_offset = (1.0 - sharpness) * 1.0 + sharpness * 3.0
+
+    # The arcs are two circles of equal radius whose centers lie on the
+    # x axis, so their upper intersection is on the y axis.
+    y_keystone = math.sqrt(
+        arc_radius_norm * arc_radius_norm - arc_x_offset * arc_x_offset)
+    arc_len = 2.0 * math.atan(1.0 / y_keystone)
+
+    radius_inner = radius_center
+    radius_outer = radius_center
+    arch_offset_01 = arch_offset * 0.5 + 0.5
+    if arch_weight > 0.0:
+        radius_inner_limit = radius_center - radius_center * arch_weight
+        radius_outer_limit = radius_center + radius_center * arch_weight
+        radius_inner = arch_offset_01 * radius_center \
+            + (1.0 - arch_offset_01) * radius_inner_limit
+        radius_outer = (1.0 - arch_offset_01) * radius_center \
+            + arch_offset_01 * radius_outer_limit
+
+    y_trg_inner = (1.0 - sharpness) * (2.0 / 1.7320508075688772) \
+        + sharpness * (2.6457513110645903 / 2.0)
+    y_aspect_fix_inner = (1.0 - arch_weight) + arch_weight * y_trg_inner
+    y_trg_outer = (1.0 - sharpness) * (1.7320508075688772 / 2.0) \
+        + sharpness * (2.0 / 2.6457513110645903)
+    y_aspect_fix_outer = (1.0 - arch_weight) + arch_weight * y_trg_outer
+
+    y_aspect_fix_inner = (1.0 - arch_offset_01) * y_aspect_fix_inner \
+        + arch_offset_01
+    y_aspect_fix_outer = (1.0 - arch_offset_01) \
+        + arch_offset_01 * y_aspect_fix_outer
+
+    create_faces = arch_weight > 0.0
+
+    len_vs = sectors * 2 + 1
+    if create_faces:
+        len_vs = len_vs * 2
+
+    vs = [(0.0, 0.0, 0.0)] * len_vs
+    vts = [(0.5, 0.5)] * len_vs
+
+    vs[sectors] = (
+        x_orig,
+        y_orig + y_keystone * y_aspect_fix_outer * radius_outer,
+        0.0)
+    if create_faces:
+        vs[sectors * 3 + 1] = (
+            x_orig,
+            y_orig + y_keystone * y_aspect_fix_inner * radius_inner,
+            0.0)
+        vts[sectors] = (0.5, 1.0)
+        vts[sectors * 3 + 1] = (0.5, 0.0)
+
+    i = 0
+    while i < sectors:
+        angle = arc_len * i / sectors
+        x_local = -arc_x_offset + arc_radius_norm * math.cos(angle)
+        y_local = arc_radius_norm * math.sin(angle)
+
+        x_outer = x_local * radius_outer
+        y_outer = y_orig + y_local * y_aspect_fix_outer * radius_outer
+        if create_faces:
+            vs[i] = (x_orig + x_outer, y_outer, 0.0)
+            vs[sectors * 2 - i] = (x_orig - x_outer, y_outer, 0.0)
+
+            x_inner = x_local * radius_inner
+            y_inner = y_orig + y_local * y_aspect_fix_inner * radius_inner
+            vs[sectors * 2 + 1 + i] = (x_orig - x_inner, y_inner, 0.0)
+            vs[len_vs - 1 - i] = (x_orig + x_inner, y_inner, 0.0)
+
+            vts[i] = (1.0 - 0.5 * i / sectors, 1.0)
+            vts[sectors * 2 - i] = (0.5 * i / sectors, 1.0)
+            vts[sectors * 2 + 1 + i] = (0.5 * i / sectors, 0.0)
+            vts[len_vs - 1 - i] = (1.0 - 0.5 * i / sectors, 0.0)
+        else:
+            vs[i] = (x_orig + x_outer, y_outer, 0.0)
+            vs[len_vs - 1 - i] = (x_orig - x_outer, y_outer, 0.0)
+
+        i = i + 1
+
+    fs = ()
+    if create_faces:
+        fs = lancet_face_indices(params["face_type"], sectors)
+
+    # The operator warns when it reduces the chamfer. Here it is reduced
+    # quietly, to the same length.
+    depth = params["depth"]
+    if create_faces and depth > 0.0:
+        chamfer = min(params["chamfer"], 0.9 * calc_chamfer_limit(vs))
+        vs, vts, ring_count = calc_solid(vs, vts, depth, chamfer)
+        v_fs, vt_fs = lancet_solid_indices(
+            params["face_type"], sectors, ring_count)
+        return pack_mesh(vs, vts, v_fs, "OPEN", vt_fs)
+
+    return pack_mesh(vs, vts, fs, "OPEN")
+
+
+def circle_curve(params):
+    knot_count = max(3, params["knot_count"])
+    radius = max(0.000001, params["radius"])
+    offset_angle = params["offset_angle"]
+    x_orig, y_orig = params["origin"]
+
+    to_theta = math.tau / knot_count
+    handle_mag = math.tan(0.25 * to_theta) * radius * (4.0 / 3.0)
+
+    knots = [None] * knot_count
+    i = 0
+    while i < knot_count:
+        angle = offset_angle + i * to_theta
+        cosa = math.cos(angle)
+        sina = math.sin(angle)
+        hm_cosa = handle_mag * cosa
+        hm_sina = handle_mag * sina
+        co_x = x_orig + radius * cosa
+        co_y = y_orig + radius * sina
+
+        knots[i] = (
+            (co_x, co_y, 0.0),
+            (co_x + hm_sina, co_y - hm_cosa, 0.0),
+            (co_x - hm_sina, co_y + hm_cosa, 0.0),
+            0, 0)
+        i = i + 1
+
+    return pack_curve([(True, knots)], params["res_u"])
+
+
+def foil_curve(params):
+    half_pi = math.pi * 0.5
+    kappa = 0.5522847498307936
+
+    foil_type = params["foil_type"]
+    foil_count = max(3, params["foil_count"])
+    radius = max(0.000001, params["radius"])
+    offset_angle = params["offset_angle"]
+    x_orig, y_orig = params["origin"]
+
+    to_theta_polygon = math.tau / foil_count
+    foliate_pi_ratio = math.pi / foil_count
+
+    if foil_type == "BARBED":
+        # Three knots per bulb plus one for the barb. Corners have vector
+        # handles on both sides.
+        foliate_to_side_len = 1.0 / 3.0
+        side_len = 2 * radius * math.sin(foliate_pi_ratio)
+        in_radius = radius * math.cos(foliate_pi_ratio)
+        foliate_radius = foliate_to_side_len * side_len
+        kappa_radius = foliate_radius * kappa
+        one_third = 1.0 / 3.0
+        two_thirds = 2.0 / 3.0
+        to_unit_square = radius / (in_radius + side_len * foliate_to_side_len)
+        off_angle_p_pi = offset_angle + foliate_pi_ratio
+
+        def to_co(x, y):
+            return (
+                x_orig + to_unit_square * x,
+                y_orig + to_unit_square * y, 0.0)
+
+        corners = [(0.0, 0.0)] * foil_count
+        i = 0
+        while i < foil_count:
+            theta = off_angle_p_pi + i * to_theta_polygon
+            corners[i] = (radius * math.cos(theta), radius * math.sin(theta))
+            i = i + 1
+
+        knots = [None] * (foil_count * 4)
+        i = 0
+        while i < foil_count:
+            x_curr, y_curr = corners[i]
+            x_next, y_next = corners[(i + 1) % foil_count]
+            x_prev, y_prev = corners[(i - 1) % foil_count]
+
+            x_foliate_orig = (x_curr + x_next) * 0.5
+            y_foliate_orig = (y_curr + y_next) * 0.5
+
+            x_vec = x_next - x_curr
+            y_vec = y_next - y_curr
+            mag = math.sqrt(x_vec * x_vec + y_vec * y_vec)
+            x_vec = x_vec / mag
+            y_vec = y_vec / mag
+
+            x_barb_start = x_foliate_orig - x_vec * foliate_radius
+            y_barb_start = y_foliate_orig - y_vec * foliate_radius
+            x_barb_end = x_foliate_orig + x_vec * foliate_radius
+            y_barb_end = y_foliate_orig + y_vec * foliate_radius
+
+            x_perp_cw = y_vec
+            y_perp_cw = -x_vec
+            x_apex = x_foliate_orig + x_perp_cw * foliate_radius
+            y_apex = y_foliate_orig + y_perp_cw * foliate_radius
+
+            # The left handle of a corner points toward the barb end of
+            # the previous bulb.
+            x_prev_mid = (x_prev + x_curr) * 0.5
+            y_prev_mid = (y_prev + y_curr) * 0.5
+            x_prev_vec = x_curr - x_prev
+            y_prev_vec = y_curr - y_prev
+            prev_mag = math.sqrt(x_prev_vec * x_prev_vec
+                + y_prev_vec * y_prev_vec)
+            x_prev_barb_end = x_prev_mid + x_prev_vec * foliate_radius / prev_mag
+            y_prev_barb_end = y_prev_mid + y_prev_vec * foliate_radius / prev_mag
+
+            i4 = i * 4
+            knots[i4] = (
+                to_co(x_curr, y_curr),
+                to_co(
+                    two_thirds * x_curr + one_third * x_prev_barb_end,
+                    two_thirds * y_curr + one_third * y_prev_barb_end),
+                to_co(
+                    two_thirds * x_curr + one_third * x_barb_start,
+                    two_thirds * y_curr + one_third * y_barb_start),
+                1, 1)
+            knots[i4 + 1] = (
+                to_co(x_barb_start, y_barb_start),
+                to_co(
+                    two_thirds * x_barb_start + one_third * x_curr,
+                    two_thirds * y_barb_start + one_third * y_curr),
+                to_co(
+                    x_barb_start + x_perp_cw * kappa_radius,
+                    y_barb_start + y_perp_cw * kappa_radius),
+                1, 0)
+            knots[i4 + 2] = (
+                to_co(x_apex, y_apex),
+                to_co(
+                    x_apex - x_vec * kappa_radius,
+                    y_apex - y_vec * kappa_radius),
+                to_co(
+                    x_apex + x_vec * kappa_radius,
+                    y_apex + y_vec * kappa_radius),
+                0, 0)
+            knots[i4 + 3] = (
+                to_co(x_barb_end, y_barb_end),
+                to_co(
+                    x_barb_end + x_perp_cw * kappa_radius,
+                    y_barb_end + y_perp_cw * kappa_radius),
+                to_co(
+                    two_thirds * x_barb_end + one_third * x_next,
+                    two_thirds * y_barb_end + one_third * y_next),
+                0, 1)
+
+            i = i + 1
+
+        return pack_curve([(True, knots)], params["res_u"])
+
+    if foil_type == "OVERLAP":
+        foliate_arc_len = foliate_pi_ratio * 4
+        half_radius = 0.5 * radius
+        center_radius = half_radius
+    else:
+        sin_foliate_ratio = math.sin(foliate_pi_ratio)
+        foliate_arc_len = foliate_pi_ratio * (foil_count + 2)
+        center_radius = radius / (1.0 + sin_foliate_ratio)
+        half_radius = sin_foliate_ratio * center_radius
+
+    half_arc_len = foliate_arc_len * 0.5
+    fudge = 0
+    if foliate_arc_len % half_pi > 0.00001:
+        fudge = fudge + 1
+    foliate_knot_count = max(2, math.ceil(fudge + 4 * foliate_arc_len / math.tau))
+    total_knot_count = foliate_knot_count * foil_count - foil_count
+    j_to_step = 1.0 / (foliate_knot_count - 1.0)
+    handle_mag = math.tan(0.25 * j_to_step * foliate_arc_len) \
+        * half_radius * (4.0 / 3.0)
+
+    cos_half_arc_len = math.cos(-half_arc_len)
+    sin_half_arc_len = math.sin(-half_arc_len)
+
+    # The start of each bulb is not a knot, as the curve passes from
+    # the end of one bulb to the start of the next.
+    knots = [None] * total_knot_count
+    k = 0
+    i = 0
+    while i < foil_count:
+        theta_curr = offset_angle + i * to_theta_polygon
+        x_curr = x_orig + center_radius * math.cos(theta_curr)
+        y_curr = y_orig + center_radius * math.sin(theta_curr)
+
+        start_angle = theta_curr - half_arc_len
+        stop_angle = theta_curr + half_arc_len
+
+        j = 1
+        while j < foliate_knot_count:
+            j_step = j * j_to_step
+            knot_angle = (1.0 - j_step) * start_angle + j_step * stop_angle
+
+            cosa = math.cos(knot_angle)
+            sina = math.sin(knot_angle)
+            hm_cosa = handle_mag * cosa
+            hm_sina = handle_mag * sina
+
+            co_x = x_curr + half_radius * cosa
+            co_y = y_curr + half_radius * sina
+
+            rear = (co_x + hm_sina, co_y - hm_cosa, 0.0)
+            fore = (co_x - hm_sina, co_y + hm_cosa, 0.0)
+
+            if j == foliate_knot_count - 1:
+                if foil_type == "OVERLAP":
+                    fore = (
+                        co_x + cos_half_arc_len * (fore[0] - co_x)
+                            - sin_half_arc_len * (fore[1] - co_y),
+                        co_y + cos_half_arc_len * (fore[1] - co_y)
+                            + sin_half_arc_len * (fore[0] - co_x),
+                        0.0)
+                else:
+                    fore = rear
+
+            knots[k] = ((co_x, co_y, 0.0), rear, fore, 0, 0)
+
+            k = k + 1
+            j = j + 1
+        i = i + 1
+
+    return pack_curve([(True, knots)], params["res_u"])
+
+
+def describe(shape, params):
+    # Returns a datablock name in the style of the matching operator.
+    if shape == "ARC":
+        start_angle = params["start_angle"]
+        stop_angle = params["stop_angle"]
+        arc_len = (stop_angle % math.tau - start_angle % math.tau) % math.tau
+        if arc_len < 0.00139 \
+            or abs(math.tau - (stop_angle - start_angle)) < 0.00139:
+            return "Circle"
+        return "Arc From {:.0f} To {:.0f} R {:.3f}".format(
+            math.degrees(start_angle) % 360,
+            math.degrees(stop_angle) % 360,
+            params["radius"])
+
+    if shape == "FOIL":
+        foil_names = {3: "Trefoil", 4: "Quatrefoil", 5: "Cinquefoil", 6: "Hexafoil"}
+        foil_name = foil_names.get(params["foil_count"], "Foil")
+        if params["foil_type"] == "BARBED":
+            foil_name = foil_name + ".Barbed"
+        elif params["foil_type"] == "OVERLAP":
+            foil_name = foil_name + ".Overlap"
+        return foil_name
+
+    return SHAPES[shape]["name"]
+
+
+# Defaults mirror the properties of the operator named by "generator".
+SHAPES = {
+    "ARC": {
+        "label": "Arc",
+        "name": "Arc",
+        "kind": "MESH",
+        "generator": "mesh.primitive_arc_add",
+        "kernel": arc_mesh,
+        "defaults": {
+            "arc_type": "PIE",
+            "sectors": 32,
+            "radius": 0.5,
+            "r_scalar": 2.0 / 3.0,
+            "start_angle": 0.0,
+            "stop_angle": math.pi * 0.5,
+            "origin": (0.0, 0.0),
+            "stroke_width": 0.05,
+            "join_type": "MITER"}},
+    "EGG": {
+        "label": "Egg",
+        "name": "Egg",
+        "kind": "MESH",
+        "generator": "mesh.primitive_egg_add",
+        "kernel": egg_mesh,
+        "defaults": {
+            "sectors": 64,
+            "radius": 0.5,
+            "offset_angle": 0.0,
+            "origin": (0.0, 0.0),
+            "face_type": "NGON",
+            "stroke_width": 0.05,
+            "join_type": "MITER"}},
+    "LANCET_ARCH": {
+        "label": "Lancet Arch",
+        "name": "Lancet Arch",
+        "kind": "MESH",
+        "generator": "mesh.primitive_lancet_add",
+        "kernel": lancet_arch_mesh,
+        "defaults": {
+            "sectors": 24,
+            "sharpness": 1.0,
+            "radius": 0.5,
+            "arch_weight": 0.0,
+            "arch_offset": 1.0,
+            "origin": (0.0, 0.0),
+            "face_type": "QUADS",
+            "depth": 0.0,
+            "chamfer": 0.0}},
+    "POLAR_GRID": {
+        "label": "Polar Grid",
+        "name": "Polar.Grid",
+        "kind": "MESH",
+        "generator": "mesh.primitive_polar_grid_add",
+        "kernel": polar_grid_mesh,
+        "defaults": {
+            "rings": 16,
+            "sectors": 32,
+            "radius": 0.5,
+            "offset_angle": 0.0,
+            "origin": (0.0, 0.0)}},
+    "STAR": {
+        "label": "Star",
+        "name": "Star",
+        "kind": "MESH",
+        "generator": "mesh.primitive_star_add",
+        "kernel": star_mesh,
+        "defaults": {
+            "sectors": 5,
+            "skip": (1, 1),
+            "radius": 0.5,
+            "inset": 0.5,
+            "offset_angle": math.pi * 0.5,
+            "origin": (0.0, 0.0),
+            "face_type": "NGON",
+            "stroke_width": 0.05,
+            "join_type": "MITER"}},
+    "CIRCLE": {
+        "label": "Circle",
+        "name": "Circle",
+        "kind": "CURVE",
+        "generator": "curve.primitive_circ_add",
+        "kernel": circle_curve,
+        "defaults": {
+            "knot_count": 4,
+            "radius": 0.5,
+            "offset_angle": 0.0,
+            "origin": (0.0, 0.0),
+            "res_u": 24}},
+    "FOIL": {
+        "label": "Foil",
+        "name": "Foil",
+        "kind": "CURVE",
+        "generator": "curve.primitive_foil_add",
+        "kernel": foil_curve,
+        "defaults": {
+            "foil_type": "REGULAR",
+            "foil_count": 3,
+            "radius": 0.5,
+            "offset_angle": math.pi * 0.5,
+            "origin": (0.0, 0.0),
+            "res_u": 24}},
+}
+
+
+def resolve(row):
+    # Fills in missing parameters of a row from the shape's defaults.
+    # Keys which are not parameters of the shape, such as location, are
+    # ignored. Vectors read from JSON are lists, so they are converted
+    # to tuples to compare equal to the defaults.
+    shape = row["shape"]
+    defaults = SHAPES[shape]["defaults"]
+    params = dict(defaults)
+    for key in defaults:
+        if key in row:
+            value = row[key]
+            if isinstance(value, list):
+                value = tuple(value)
+            params[key] = value
+    return shape, params
+
+
+def generate(row):
+    shape, params = resolve(row)
+    entry = SHAPES[shape]
+    return entry["kind"], entry["kernel"](params)
@@ -0,0 +1,242 @@
+import csv
+import json
+import math
+import os
+import re
+
+# This module must not import bpy, so that the command line tool can
+# validate manifests before starting Blender.
+
+# Bounds mirror the hard limits of each operator's properties. A bound
+# of None is open. Vectors give their size before their bounds.
+BOUNDS = {
+    "ARC": {
+        "arc_type": ("ENUM", (
+            "CHORD", "PIE", "SECTOR", "STROKE", "CHORD_TRIS", "RIBBON")),
+        "sectors": ("INT", 3, None),
+        "radius": ("FLOAT", 0.0002, None),
+        "r_scalar": ("FLOAT", 0.0001, 0.9999),
+        "start_angle": ("FLOAT", None, None),
+        "stop_angle": ("FLOAT", None, None),
+        "origin": ("FLOAT_VECTOR", 2, None, None),
+        "stroke_width": ("FLOAT", 0.0001, None),
+        "join_type": ("ENUM", ("MITER", "ROUND"))},
+    "EGG": {
+        "sectors": ("INT", 3, None),
+        "radius": ("FLOAT", 0.0001, None),
+        "offset_angle": ("FLOAT", None, None),
+        "origin": ("FLOAT_VECTOR", 2, None, None),
+        "face_type": ("ENUM", ("NGON", "STROKE", "TRI_FAN", "TRIS", "RIBBON")),
+        "stroke_width": ("FLOAT", 0.0001, None),
+        "join_type": ("ENUM", ("MITER", "ROUND"))},
+    "LANCET_ARCH": {
+        "sectors": ("INT", 3, None),
+        "sharpness": ("FLOAT", 0.0, 1.0),
+        "radius": ("FLOAT", 0.0001, None),
+        "arch_weight": ("FLOAT", 0.0, 1.0),
+        "arch_offset": ("FLOAT", -1.0, 1.0),
+        "origin": ("FLOAT_VECTOR", 2, None, None),
+        "face_type": ("ENUM", ("NGON", "QUADS")),
+        "depth": ("FLOAT", 0.0, None),
+        "chamfer": ("FLOAT", 0.0, None)},
+    "POLAR_GRID": {
+        "rings": ("INT", 1, None),
+        "sectors": ("INT", 4, None),
+        "radius": ("FLOAT", 0.0002, None),
+        "offset_angle": ("FLOAT", None, None),
+        "origin": ("FLOAT_VECTOR", 2, None, None)},
+    "STAR": {
+        "sectors": ("INT", 3, None),
+        "skip": ("INT_VECTOR", 2, 0, None),
+        "radius": ("FLOAT", 0.0001, None),
+        "inset": ("FLOAT", 0.0, 1.0),
+        "offset_angle": ("FLOAT", None, None),
+        "origin": ("FLOAT_VECTOR", 2, None, None),
+        "face_type": ("ENUM", ("NGON", "STROKE", "TRI_FAN", "TRIS", "RIBBON")),
+        "stroke_width": ("FLOAT", 0.0001, None),
+        "join_type": ("ENUM", ("MITER", "ROUND"))},
+    "CIRCLE": {
+        "knot_count": ("INT", 3, None),
+        "radius": ("FLOAT", 0.0001, None),
+        "offset_angle": ("FLOAT", None, None),
+        "origin": ("FLOAT_VECTOR", 2, None, None),
+        "res_u": ("INT", 1, None)},
+    "FOIL": {
+        "foil_type": ("ENUM", ("BARBED", "OVERLAP", "REGULAR")),
+        "foil_count": ("INT", 3, 32),
+        "radius": ("FLOAT", 0.0001, None),
+        "offset_angle": ("FLOAT", None, None),
+        "origin": ("FLOAT_VECTOR", 2, None, None),
+        "res_u": ("INT", 1, None)},
+}
+
+# Keys accepted for every shape.
+COMMON_BOUNDS = {
+    "location": ("FLOAT_VECTOR", 3, None, None),
+}
+
+# Column names used by other tools for the same parameter.
+ALIASES = {
+    "angle": "offset_angle",
+}
+
+VECTOR_SPLIT = re.compile(r"[\s,;]+")
+
+
+def parse_scalar(kind, raw):
+    if kind == "INT":
+        if isinstance(raw, bool):
+            raise ValueError("expected an integer, got {!r}".format(raw))
+        if isinstance(raw, float):
+            if not raw.is_integer():
+                raise ValueError("expected an integer, got {!r}".format(raw))
+            return int(raw)
+        return int(raw)
+
+    value = float(raw)
+    if math.isnan(value) or math.isinf(value):
+        raise ValueError("expected a finite number, got {!r}".format(raw))
+    return value
+
+
+def check_bounds(value, lower, upper):
+    if lower is not None and value < lower:
+        raise ValueError("{} is less than {}".format(value, lower))
+    if upper is not None and value > upper:
+        raise ValueError("{} is greater than {}".format(value, upper))
+
+
+def parse_value(spec, raw):
+    # Values from JSON arrive typed, values from CSV arrive as strings.
+    kind = spec[0]
+
+    if kind == "ENUM":
+        value = str(raw).strip().upper()
+        if value not in spec[1]:
+            raise ValueError("{!r} is not one of {}".format(
+                raw, ", ".join(spec[1])))
+        return value
+
+    if kind == "INT" or kind == "FLOAT":
+        value = parse_scalar(kind, raw)
+        check_bounds(value, spec[1], spec[2])
+        return value
+
+    # Vectors in CSV cells may be JSON arrays or separated numbers.
+    if isinstance(raw, str):
+        raw = raw.strip()
+        if raw.startswith("["):
+            raw = json.loads(raw)
+        else:
+            raw = [c for c in VECTOR_SPLIT.split(raw) if c]
+    size = spec[1]
+    if len(raw) != size:
+        raise ValueError("expected {} components, got {}".format(
+            size, len(raw)))
+    scalar_kind = "INT" if kind == "INT_VECTOR" else "FLOAT"
+    value = tuple(parse_scalar(scalar_kind, c) for c in raw)
+    for c in value:
+        check_bounds(c, spec[2], spec[3])
+    return value
+
+
+def validate_row(raw_row):
+    # Returns a row holding only the shape, its location and the
+    # parameters of the shape which were given. Columns which are not
+    # parameters of the row's shape, and empty cells, are ignored.
+    if not isinstance(raw_row, dict):
+        raise ValueError("expected an object, got {!r}".format(raw_row))
+
+    row = {}
+    for key, raw in raw_row.items():
+        if key is None:
+            continue
+        key = ALIASES.get(key.strip().lower(), key.strip().lower())
+        if raw is None or (isinstance(raw, str) and not raw.strip()):
+            continue
+        row[key] = raw
+
+    shape = str(row.get("shape", "")).strip().upper()
+    if shape not in BOUNDS:
+        raise ValueError("unknown shape {!r}".format(row.get("shape")))
+
+    clean = {"shape": shape}
+    bounds = BOUNDS[shape]
+    for key, raw in row.items():
+        spec = bounds.get(key, COMMON_BOUNDS.get(key))
+        if spec is None:
+            continue
+        try:
+            clean[key] = parse_value(spec, raw)
+        except (TypeError, ValueError) as e:
+            raise ValueError("{}: {}".format(key, e)) from None
+    return clean
+
+
+class ManifestReader:
+    """Streams validated rows from a CSV or JSON lines file"""
+
+    def __init__(self, path, start_row=0, strict=False, max_errors=100):
+        self.path = path
+        self.start_row = max(0, start_row)
+        self.strict = strict
+        self.max_errors = max_errors
+
+        # Row numbers count data rows from 1, excluding a CSV header.
+        self.row_number = 0
+        self.invalid_count = 0
+        self.errors = []
+        self.position = 0
+        self.size = max(1, os.path.getsize(path))
+
+        ext = os.path.splitext(path)[1].lower()
+        self.is_csv = ext in (".csv", ".tsv")
+        self.delimiter = "\t" if ext == ".tsv" else ","
+
+    def fraction(self):
+        return min(1.0, self.position / self.size)
+
+    def lines(self, bin_file):
+        # The file is read as bytes so that the position can be tracked
+        # for progress, which text files do not allow while iterating.
+        for raw_line in bin_file:
+            self.position = self.position + len(raw_line)
+            yield raw_line.decode("utf-8-sig")
+
+    def raw_rows(self, bin_file):
+        if self.is_csv:
+            yield from csv.DictReader(
+                self.lines(bin_file), delimiter=self.delimiter)
+            return
+
+        # A line which is not JSON is passed on as its error, so that it
+        # is counted like any other invalid row.
+        for line in self.lines(bin_file):
+            line = line.strip()
+            if line:
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    yield e
+
+    def __iter__(self):
+        with open(self.path, "rb") as bin_file:
+            for raw_row in self.raw_rows(bin_file):
+                self.row_number = self.row_number + 1
+                if self.row_number <= self.start_row:
+                    continue
+
+                try:
+                    if isinstance(raw_row, ValueError):
+                        raise raw_row
+                    row = validate_row(raw_row)
+                except ValueError as e:
+                    message = "Row {}: {}".format(self.row_number, e)
+                    if self.strict:
+                        raise ValueError(message) from None
+                    self.invalid_count = self.invalid_count + 1
+                    if len(self.errors) < self.max_errors:
+                        self.errors.append(message)
+                    continue
+
+                yield row
@@ -0,0 +1,70 @@
+import random
+
+from . import cache
+from . import kernels
+
+# This module must not import bpy. Blender makes a name unique by adding
+# a numeric suffix, which it has to search for among the datablocks that
+# share the name. Thousands of shapes with one name make every new one
+# slower to add. Names here are made unique before they reach Blender.
+NAMINGS = (
+    ("AUTO", "Auto", "Descriptive names for small batches, counters for large ones"),
+    ("DESCRIPTIVE", "Descriptive", "Names which list the shape's parameters, as its operator gives them. Blender adds a suffix to names which repeat"),
+    ("COUNTER", "Counter", "The shape's name, an id for the batch and the shape's number in it"),
+    ("HASH", "Hash", "The shape's name, a hash of its parameters and an id for the batch, so shapes with the same geometry share a prefix"))
+
+# Above this many rows, automatic naming uses counters.
+HIGH_VOLUME = 1000
+
+
+class BatchNamer:
+    """Gives each shape of a batch a datablock name"""
+
+    def __init__(self, strategy, row_count=None, taken=None):
+        # A batch of unknown size, such as a manifest being streamed, is
+        # treated as a large one.
+        if strategy == "AUTO":
+            strategy = "COUNTER"
+            if row_count is not None and row_count <= HIGH_VOLUME:
+                strategy = "DESCRIPTIVE"
+
+        self.strategy = strategy
+        self.taken = taken
+        self.index = 0
+        self.hash_counts = {}
+        self.run = BatchNamer.run_id()
+
+    @staticmethod
+    def run_id():
+        return "{:05x}".format(random.getrandbits(20))
+
+    def format_name(self, row):
+        shape = row["shape"]
+        if self.strategy == "COUNTER":
+            return "{}.{}.{}".format(
+                kernels.SHAPES[shape]["name"], self.run, self.index)
+
+        if self.strategy == "HASH":
+            digest = cache.entry_key(row)[:8]
+            count = self.hash_counts.get(digest, 0)
+            self.hash_counts[digest] = count + 1
+            name = "{}.{}.{}".format(
+                kernels.SHAPES[shape]["name"], digest, self.run)
+            if count > 0:
+                name = "{}.{}".format(name, count)
+            return name
+
+        return kernels.describe(*kernels.resolve(row))
+
+    def name(self, row):
+        # The batch id is checked against existing names once, with the
+        # first name, as every name after it shares the id.
+        name = self.format_name(row)
+        if self.index == 0 and self.strategy != "DESCRIPTIVE" \
+            and self.taken is not None:
+            while self.taken(name):
+                self.run = BatchNamer.run_id()
+                self.hash_counts.clear()
+                name = self.format_name(row)
+        self.index = self.index + 1
+        return name
@@ -0,0 +1,500 @@
+import bpy # type: ignore
+import math
+import time
+from bpy.props import ( # type: ignore
+    BoolProperty,
+    EnumProperty,
+    FloatProperty,
+    IntProperty,
+    StringProperty)
+
+from . import cache
+from . import kernels
+from . import manifest
+from . import naming
+from . import pool
+
+
+class BatchRunner:
+    """Writes shapes from worker results in the time slices of a modal operator"""
+
+    # Seconds of each timer event spent writing shapes.
+    time_slice = 0.05
+
+    def cache_dir(self):
+        if not self.use_cache:
+            return None
+        try:
+            return cache.prepare(cache.default_directory())
+        except OSError as e:
+            # Shapes are still created, only without the cache.
+            print("Shape cache unavailable: {}".format(e))
+            return None
+
+    def start_namer(self, row_count=None):
+        self.namer = naming.BatchNamer(
+            self.naming, row_count, ShapeBatchMaker.name_taken)
+
+    def start_batch(self, context, rows, chunksize=64):
+        self.start = time.perf_counter()
+        self.written = []
+        self.last_row = None
+        self.collection = context.collection
+
+        # Results are polled without blocking. Kernels run in workers,
+        # so a single large shape does not stall the interface either.
+        self.results = pool.generate_rows(
+            rows, self.processes, chunksize, timeout=0.0,
+            cache_dir=self.cache_dir())
+
+        wm = context.window_manager
+        wm.progress_begin(0, 1000)
+        context.workspace.status_text_set(
+            "{}: Esc to cancel".format(self.bl_label))
+        self.timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def batch_progress(self):
+        return 0.0
+
+    def modal(self, context, event):
+        if event.type == "ESC":
+            return self.cancel_batch(context)
+
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        written = self.written
+        done = False
+        deadline = time.perf_counter() + BatchRunner.time_slice
+        try:
+            while time.perf_counter() < deadline:
+                result = next(self.results, False)
+                if result is False:
+                    done = True
+                    break
+                if result is None:
+                    break
+                row, kind, arrays = result
+                written.append(ShapeBatchMaker.write_row(
+                    row, kind, arrays, self.collection,
+                    self.namer.name(row)))
+                self.last_row = row
+        except Exception as e:
+            # Shapes written before the error are kept.
+            self.end_batch(context)
+            self.report({"ERROR"}, self.failure_message(e))
+            return {"FINISHED"}
+
+        context.window_manager.progress_update(
+            int(1000 * self.batch_progress()))
+        if not done:
+            return {"PASS_THROUGH"}
+
+        self.end_batch(context)
+        self.report({"INFO"}, self.success_message())
+        return {"FINISHED"}
+
+    def success_message(self):
+        return "Created {} shapes in {:.3f} s".format(
+            len(self.written), time.perf_counter() - self.start)
+
+    def failure_message(self, e):
+        return "Stopped after {} shapes: {}".format(len(self.written), e)
+
+    def end_batch(self, context):
+        # Closing the results stops any chunks still in the workers.
+        self.results.close()
+        wm = context.window_manager
+        wm.event_timer_remove(self.timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+
+    def cancel_batch(self, context):
+        self.end_batch(context)
+        written = self.written
+        if self.keep_partial and len(written) > 0:
+            self.report({"WARNING"}, "Cancelled after {} shapes".format(
+                len(written)))
+            return {"FINISHED"}
+
+        # Objects are removed along with their data, in one pass.
+        ids = set()
+        for obj in written:
+            ids.add(obj)
+            ids.add(obj.data)
+        bpy.data.batch_remove(ids)
+        self.report({"INFO"}, "Cancelled")
+        return {"CANCELLED"}
+
+    def cancel(self, context):
+        # Called if Blender ends the operator, for example when the
+        # file is closed while a batch is running.
+        self.end_batch(context)
+
+
+class ShapeBatchMaker(BatchRunner, bpy.types.Operator):
+    """Creates a grid of shapes, computed in worker processes"""
+
+    bl_idname = "object.shape_batch_add"
+    bl_label = "Shape Batch"
+    bl_options = {"REGISTER", "UNDO"}
+
+    shape: EnumProperty(
+        items=[(shape, entry["label"], entry["label"])
+            for shape, entry in kernels.SHAPES.items()],
+        name="Shape",
+        default="STAR",
+        description="Shape to create") # type: ignore
+
+    count: IntProperty(
+        name="Count",
+        description="Number of shapes to create",
+        min=1,
+        soft_max=10000,
+        default=100) # type: ignore
+
+    columns: IntProperty(
+        name="Columns",
+        description="Shapes per row, or 0 for a square grid",
+        min=0,
+        soft_max=256,
+        default=0) # type: ignore
+
+    spacing: FloatProperty(
+        name="Spacing",
+        description="Distance between shapes",
+        min=0.0,
+        soft_max=100.0,
+        step=1,
+        precision=3,
+        default=1.25) # type: ignore
+
+    processes: IntProperty(
+        name="Processes",
+        description="Number of worker processes, or 0 for one per core",
+        min=0,
+        soft_max=64,
+        default=0) # type: ignore
+
+    use_cache: BoolProperty(
+        name="Cache",
+        description="Load shapes computed in an earlier session from disk, and store new ones there",
+        default=True) # type: ignore
+
+    naming: EnumProperty(
+        items=naming.NAMINGS,
+        name="Naming",
+        default="AUTO",
+        description="How shapes are named. Names which are unique from the start spare Blender from searching for a free suffix") # type: ignore
+
+    background: BoolProperty(
+        name="Background",
+        description="Create shapes in time slices, with progress, so that Blender stays responsive. Press Esc to cancel",
+        default=True) # type: ignore
+
+    keep_partial: BoolProperty(
+        name="Keep Partial",
+        description="Keep the shapes created before a batch was cancelled",
+        default=True) # type: ignore
+
+    @staticmethod
+    def write_mesh(name, arrays):
+        # Every array is passed through the buffer protocol, so no
+        # per-element work happens on this thread.
+        mesh_data = bpy.data.meshes.new(name)
+
+        co = arrays["co"]
+        mesh_data.vertices.add(len(co) // 3)
+        mesh_data.vertices.foreach_set("co", co)
+
+        edges = arrays["edges"]
+        if len(edges) > 0:
+            mesh_data.edges.add(len(edges) // 2)
+            mesh_data.edges.foreach_set("vertices", edges)
+
+        uv_layer = mesh_data.uv_layers.new()
+        loop_starts = arrays["loop_starts"]
+        if len(loop_starts) > 0:
+            loop_verts = arrays["loop_verts"]
+            mesh_data.loops.add(len(loop_verts))
+            mesh_data.loops.foreach_set("vertex_index", loop_verts)
+            mesh_data.polygons.add(len(loop_starts))
+            mesh_data.polygons.foreach_set("loop_start", loop_starts)
+            uv_layer.data.foreach_set("uv", arrays["uv"])
+
+        mesh_data.update(calc_edges=True)
+        return mesh_data
+
+    @staticmethod
+    def write_curve(name, arrays):
+        crv_data = bpy.data.curves.new(name, "CURVE")
+        # If a curve is 2D, then transforms cannot be applied.
+        crv_data.dimensions = "3D"
+
+        co = memoryview(arrays["co"])
+        handle_left = memoryview(arrays["handle_left"])
+        handle_right = memoryview(arrays["handle_right"])
+        left_types = arrays["left_types"]
+        right_types = arrays["right_types"]
+        cyclic = arrays["cyclic"]
+        resolution = arrays["resolution"]
+
+        offset = 0
+        s = 0
+        for knot_count in arrays["knot_counts"]:
+            spline = crv_data.splines.new("BEZIER")
+            spline.use_cyclic_u = cyclic[s] != 0
+            spline.resolution_u = resolution[s]
+
+            # Spline already contains one Bezier point.
+            bz_pts = spline.bezier_points
+            bz_pts.add(knot_count - 1)
+
+            # Handle types are enums, which foreach_set does not accept.
+            k = offset
+            for knot in bz_pts:
+                knot.handle_left_type = kernels.HANDLE_TYPES[left_types[k]]
+                knot.handle_right_type = kernels.HANDLE_TYPES[right_types[k]]
+                k = k + 1
+
+            start = offset * 3
+            stop = start + knot_count * 3
+            bz_pts.foreach_set("co", co[start:stop])
+            bz_pts.foreach_set("handle_left", handle_left[start:stop])
+            bz_pts.foreach_set("handle_right", handle_right[start:stop])
+
+            offset = offset + knot_count
+            s = s + 1
+
+        return crv_data
+
+    @staticmethod
+    def name_taken(name):
+        return name in bpy.data.objects or name in bpy.data.meshes \
+            or name in bpy.data.curves
+
+    @staticmethod
+    def write_row(row, kind, arrays, collection, name=None):
+        shape = row["shape"]
+        if name is None:
+            name = kernels.describe(*kernels.resolve(row))
+
+        if kind == "CURVE":
+            data = ShapeBatchMaker.write_curve(name, arrays)
+        else:
+            data = ShapeBatchMaker.write_mesh(name, arrays)
+
+        # The generator is tagged on the data rather than on the object,
+        # as a tagged object would be picked up by animation handlers.
+        data["generator"] = kernels.SHAPES[shape]["generator"]
+
+        obj = bpy.data.objects.new(data.name, data)
+        obj.location = row.get("location", (0.0, 0.0, 0.0))
+        collection.objects.link(obj)
+        return obj
+
+    @staticmethod
+    def grid_rows(shape, count, columns, spacing, location):
+        if columns < 1:
+            columns = max(1, math.ceil(math.sqrt(count)))
+
+        rows = [None] * count
+        i = 0
+        while i < count:
+            rows[i] = {
+                "shape": shape,
+                "location": (
+                    location[0] + (i % columns) * spacing,
+                    location[1] + (i // columns) * spacing,
+                    location[2])}
+            i = i + 1
+        return rows
+
+    def execute(self, context):
+        start = time.perf_counter()
+
+        rows = ShapeBatchMaker.grid_rows(
+            self.shape, max(1, self.count), self.columns,
+            self.spacing, context.scene.cursor.location)
+
+        collection = context.collection
+        self.start_namer(len(rows))
+        for row, kind, arrays in pool.generate_rows(
+            rows, self.processes, cache_dir=self.cache_dir()):
+            ShapeBatchMaker.write_row(
+                row, kind, arrays, collection, self.namer.name(row))
+
+        self.report({"INFO"}, "Created {} shapes in {:.3f} s".format(
+            len(rows), time.perf_counter() - start))
+        return {"FINISHED"}
+
+    def invoke(self, context, event):
+        if not self.background:
+            return self.execute(context)
+
+        self.row_count = max(1, self.count)
+        rows = ShapeBatchMaker.grid_rows(
+            self.shape, self.row_count, self.columns,
+            self.spacing, context.scene.cursor.location)
+        self.start_namer(self.row_count)
+        return self.start_batch(context, rows)
+
+    def batch_progress(self):
+        return len(self.written) / self.row_count
+
+    @classmethod
+    def poll(cls, context):
+        return context.area.type == "VIEW_3D"
+
+
+class ShapeManifestImporter(BatchRunner, bpy.types.Operator):
+    """Creates shapes from the rows of a CSV or JSON lines manifest"""
+
+    bl_idname = "object.shape_manifest_import"
+    bl_label = "Shape Manifest"
+    bl_options = {"REGISTER", "UNDO"}
+
+    filepath: StringProperty(
+        name="File Path",
+        description="Manifest to read",
+        subtype="FILE_PATH") # type: ignore
+
+    filter_glob: StringProperty(
+        default="*.csv;*.tsv;*.jsonl;*.ndjson",
+        options={"HIDDEN"}) # type: ignore
+
+    start_row: IntProperty(
+        name="Start Row",
+        description="Number of rows to skip, for resuming an import which stopped part way through",
+        min=0,
+        default=0) # type: ignore
+
+    chunk_size: IntProperty(
+        name="Chunk Size",
+        description="Number of rows read and computed at a time",
+        min=1,
+        soft_max=10000,
+        default=256) # type: ignore
+
+    strict: BoolProperty(
+        name="Strict",
+        description="Stop at the first invalid row rather than skipping it",
+        default=False) # type: ignore
+
+    processes: IntProperty(
+        name="Processes",
+        description="Number of worker processes, or 0 for one per core",
+        min=0,
+        soft_max=64,
+        default=0) # type: ignore
+
+    use_cache: BoolProperty(
+        name="Cache",
+        description="Load shapes computed in an earlier session from disk, and store new ones there",
+        default=True) # type: ignore
+
+    naming: EnumProperty(
+        items=naming.NAMINGS,
+        name="Naming",
+        default="AUTO",
+        description="How shapes are named. Names which are unique from the start spare Blender from searching for a free suffix") # type: ignore
+
+    background: BoolProperty(
+        name="Background",
+        description="Create shapes in time slices, with progress, so that Blender stays responsive. Press Esc to cancel",
+        default=True) # type: ignore
+
+    keep_partial: BoolProperty(
+        name="Keep Partial",
+        description="Keep the shapes created before an import was cancelled",
+        default=True) # type: ignore
+
+    def numbered_rows(self):
+        # Rows carry their number in the manifest, so that an import
+        # which stops part way through can report where to resume.
+        for row in self.reader:
+            row["row_number"] = self.reader.row_number
+            yield row
+
+    def batch_progress(self):
+        return self.reader.fraction()
+
+    def success_message(self):
+        message = "Created {} shapes in {:.3f} s".format(
+            len(self.written), time.perf_counter() - self.start)
+        if self.reader.invalid_count > 0:
+            message = "{}, skipped {} invalid rows".format(
+                message, self.reader.invalid_count)
+            for error in self.reader.errors:
+                print(error)
+        return message
+
+    def failure_message(self, e):
+        resume = self.start_row
+        if self.last_row is not None:
+            resume = self.last_row["row_number"]
+        return "Stopped after {} shapes: {}. Set Start Row to {} to resume".format(
+            len(self.written), e, resume)
+
+    def execute(self, context):
+        self.reader = manifest.ManifestReader(
+            bpy.path.abspath(self.filepath), self.start_row, self.strict)
+        rows = self.numbered_rows()
+        self.start_namer()
+
+        if self.background and context.window is not None:
+            return self.start_batch(context, rows, self.chunk_size)
+
+        self.start = time.perf_counter()
+        self.written = []
+        self.last_row = None
+        collection = context.collection
+        try:
+            for row, kind, arrays in pool.generate_rows(
+                rows, self.processes, self.chunk_size,
+                cache_dir=self.cache_dir()):
+                self.written.append(ShapeBatchMaker.write_row(
+                    row, kind, arrays, collection, self.namer.name(row)))
+                self.last_row = row
+        except Exception as e:
+            self.report({"ERROR"}, self.failure_message(e))
+            return {"FINISHED"}
+
+        self.report({"INFO"}, self.success_message())
+        return {"FINISHED"}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+
+def menu_func(self, context):
+    self.layout.operator(ShapeBatchMaker.bl_idname, icon="MOD_ARRAY")
+
+
+def menu_func_import(self, context):
+    self.layout.operator(
+        ShapeManifestImporter.bl_idname,
+        text="Shape Manifest (.csv, .jsonl)")
+
+
+def shutdown():
+    # The worker pool outlives batches, so it is stopped with the add-on.
+    pool.shutdown()
+
+
+def register():
+    bpy.utils.register_class(ShapeBatchMaker)
+    bpy.utils.register_class(ShapeManifestImporter)
+    bpy.types.VIEW3D_MT_add.append(menu_func)
+    bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
+
+
+def unregister():
+    bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
+    bpy.types.VIEW3D_MT_add.remove(menu_func)
+    bpy.utils.unregister_class(ShapeManifestImporter)
+    bpy.utils.unregister_class(ShapeBatchMaker)
+    shutdown()
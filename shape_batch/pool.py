@@ -0,0 +1,263 @@
+import collections
+import itertools
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+from . import cache
+
+# This module must not import bpy. Worker processes are started with
+# "spawn", as forking Blender is not safe. Inside Blender, sys.executable
+# is its bundled Python, so workers run as plain Python processes which
+# import only the kernels. The pool is kept between batches, as starting
+# workers costs more than most batches take to compute.
+pool_state = {
+    "pool": None,
+    "processes": 0,
+    "batches": 0,
+}
+
+# Arrays in a shared memory segment start on 8 byte boundaries.
+ALIGN = 8
+
+# On Windows, a named mapping is destroyed with its last handle, so it
+# cannot outlive the worker's handle. Results are pickled there instead.
+USE_SHARED_MEMORY = os.name != "nt"
+
+
+def worker_count(processes=0):
+    if processes > 0:
+        return processes
+    # Leave a core for Blender, which writes results as they arrive.
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def get_pool(processes):
+    if pool_state["pool"] is not None \
+        and pool_state["processes"] == processes:
+        return pool_state["pool"]
+
+    shutdown()
+    ctx = multiprocessing.get_context("spawn")
+    pool_state["pool"] = ctx.Pool(processes)
+    pool_state["processes"] = processes
+    return pool_state["pool"]
+
+
+def shutdown():
+    pool = pool_state["pool"]
+    if pool is not None:
+        pool.terminate()
+        pool.join()
+    pool_state["pool"] = None
+    pool_state["processes"] = 0
+
+
+def chunked(rows, chunksize):
+    # If reading a row fails, the rows of the chunk read before it are
+    # still yielded before the error is raised.
+    rows = iter(rows)
+    while True:
+        chunk = []
+        try:
+            chunk.extend(itertools.islice(rows, chunksize))
+        except Exception:
+            if chunk:
+                yield chunk
+            raise
+        if not chunk:
+            return
+        yield chunk
+
+
+def pack_chunk(task):
+    # Runs in a worker. The arrays of every row in the chunk are copied
+    # into one shared memory segment, so that only the segment name and
+    # a small layout per row are pickled back to Blender. A layout lists
+    # the key, type code, byte offset and byte length of each array.
+    #
+    # Kernels build their geometry in lists, so the size of a row is
+    # only known once its kernel has run, and the segment can only be
+    # sized after the whole chunk has. Arrays are therefore copied into
+    # it once. The copy is a memcpy of packed bytes, a few percent of the
+    # time taken by the kernels, and most of it is spent on first writes
+    # to the segment's pages, which writing in place would not save.
+    name, rows, cache_dir = task
+    results = [cache.compute(row, cache_dir) for row in rows]
+    if name is None:
+        return None, results
+
+    size = 0
+    headers = [None] * len(results)
+    h = 0
+    for kind, arrays in results:
+        layout = []
+        for key, buf in arrays.items():
+            nbytes = len(buf) * buf.itemsize
+            layout.append((key, buf.typecode, size, nbytes))
+            size = size + (nbytes + ALIGN - 1) // ALIGN * ALIGN
+        headers[h] = (kind, layout)
+        h = h + 1
+
+    segment = shared_memory.SharedMemory(
+        name=name, create=True, size=max(1, size))
+    seg_buf = segment.buf
+    for (kind, arrays), (_, layout) in zip(results, headers):
+        for key, typecode, offset, nbytes in layout:
+            src = memoryview(arrays[key]).cast("B")
+            seg_buf[offset:offset + nbytes] = src
+            src.release()
+
+    # Blender unlinks the segment once it has been written.
+    del seg_buf
+    segment.close()
+    return name, headers
+
+
+def unpack_chunk(segment, headers):
+    # Returns views onto the segment, cast to the type of each array, so
+    # that foreach_set reads from shared memory directly.
+    seg_buf = segment.buf
+    results = [None] * len(headers)
+    h = 0
+    for kind, layout in headers:
+        arrays = {}
+        for key, typecode, offset, nbytes in layout:
+            arrays[key] = seg_buf[offset:offset + nbytes].cast(typecode)
+        results[h] = (kind, arrays)
+        h = h + 1
+    return results
+
+
+def release_chunk(segment, results):
+    # Views must be released before the segment can be closed. If one
+    # is still held elsewhere, the mapping is closed when it is freed,
+    # but the segment is unlinked either way.
+    try:
+        for kind, arrays in results:
+            for view in arrays.values():
+                view.release()
+        segment.close()
+    except BufferError:
+        pass
+    segment.unlink()
+
+
+def discard_chunks(names):
+    # Unlinks segments which were packed but never read. The workers
+    # which may still be writing them must be stopped first.
+    for name in names:
+        try:
+            segment = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            continue
+        segment.close()
+        segment.unlink()
+
+
+def generate_rows(rows, processes=0, chunksize=64, timeout=None,
+    cache_dir=None):
+    # Yields each row with the kind and arrays of its shape, in the order
+    # of the rows. Arrays yielded from a worker are only valid until the
+    # next row is requested. With a single process, kernels are run in
+    # this process instead and the arrays are returned as is.
+    #
+    # If a timeout is given, None is yielded whenever no result arrives
+    # in time, so that the caller can return to Blender's event loop.
+    # Kernels are then always run in a worker, even with one process.
+    #
+    # If a cache directory is given, rows found in it are mapped here
+    # and only the rest are sent to workers, which store what they
+    # compute.
+    processes = worker_count(processes)
+    if processes <= 1 and timeout is None:
+        for row in rows:
+            kind, arrays = cache.generate(row, cache_dir)
+            yield row, kind, arrays
+        return
+
+    pool = get_pool(processes)
+    pool_state["batches"] = pool_state["batches"] + 1
+
+    # Segments are named by process, batch and chunk, so that any left
+    # behind by a batch which is stopped early can be found.
+    prefix = "sb{}_{}_".format(os.getpid(), pool_state["batches"])
+
+    # Only a few chunks per worker are submitted ahead of the one being
+    # written, so rows are read from their source no faster than they
+    # are written, however many there are.
+    max_in_flight = processes * 2
+    chunks = chunked(rows, chunksize)
+    in_flight = collections.deque()
+    chunk_count = 0
+
+    # An error reading rows is raised once the rows read before it have
+    # been yielded.
+    source_error = None
+
+    try:
+        while True:
+            while source_error is None and len(in_flight) < max_in_flight:
+                try:
+                    chunk = next(chunks, None)
+                except Exception as e:
+                    source_error = e
+                    break
+                if chunk is None:
+                    break
+                hits = [None] * len(chunk)
+                misses = chunk
+                if cache_dir is not None:
+                    hits = [cache.load(cache_dir, cache.entry_key(row))
+                        for row in chunk]
+                    misses = [row for row, hit in zip(chunk, hits)
+                        if hit is None]
+
+                name = None
+                if USE_SHARED_MEMORY:
+                    name = prefix + str(chunk_count)
+                chunk_count = chunk_count + 1
+                result = None
+                if misses:
+                    result = pool.apply_async(
+                        pack_chunk, ((name, misses, cache_dir),))
+                in_flight.append((name, chunk, hits, result))
+
+            if not in_flight:
+                if source_error is not None:
+                    raise source_error
+                break
+
+            name, chunk, hits, result = in_flight[0]
+            if result is not None:
+                result.wait(timeout)
+                if not result.ready():
+                    yield None
+                    continue
+
+            in_flight.popleft()
+            segment = None
+            results = []
+            if result is not None:
+                results = result.get()[1]
+                if name is not None:
+                    segment = shared_memory.SharedMemory(name=name)
+                    results = unpack_chunk(segment, results)
+
+            # Worker results fill the rows which missed the cache, in
+            # the order they were sent.
+            try:
+                r = 0
+                for row, hit in zip(chunk, hits):
+                    if hit is None:
+                        hit = results[r]
+                        r = r + 1
+                    yield row, hit[0], hit[1]
+            finally:
+                if segment is not None:
+                    release_chunk(segment, results)
+    finally:
+        if in_flight:
+            shutdown()
+            discard_chunks([name for name, _, _, result in in_flight
+                if name is not None and result is not None])